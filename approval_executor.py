@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Approval Executor - Runs approved items on per-channel worker pools
+EMAIL_, LINKEDIN_ and WHATSAPP_ items each get their own bounded pool so a
+slow channel never blocks the others. When several vaults share the pools,
+each channel serves the vaults' queues round-robin so one busy vault cannot
+starve the rest.
+"""
+
+import os
+import time
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+
+# Filename prefix -> channel
+CHANNEL_PREFIXES = {
+    'EMAIL_': 'email',
+    'LINKEDIN_': 'linkedin',
+    'WHATSAPP_': 'whatsapp',
+}
+
+# Defaults per channel; override with APPROVAL_WORKERS_<CHANNEL>,
+# APPROVAL_TIMEOUT_<CHANNEL> and APPROVAL_QUEUE_<CHANNEL> (items per tenant)
+DEFAULT_WORKERS = {'email': 4, 'linkedin': 1, 'whatsapp': 1}
+DEFAULT_TIMEOUTS = {'email': 120, 'linkedin': 300, 'whatsapp': 300}
+DEFAULT_QUEUE_LIMIT = 1000
+
+
+def channel_for(filename):
+    """Return the channel for an approved filename, or None if unknown"""
+    for prefix, channel in CHANNEL_PREFIXES.items():
+        if filename.startswith(prefix):
+            return channel
+    return None
+
+
+def channel_setting(name, channel, default):
+    """Read a per-channel numeric setting from the environment"""
+    return float(os.getenv(f"{name}_{channel.upper()}", default))
+
+
+class ApprovalExecutor:
+    """
+    Bounded executor dispatching approved items to per-channel thread pools
+
+    Handlers are called as handler(filepath, deadline) where deadline is a
+    time.monotonic() value the handler should not run past. Python threads
+    cannot be killed, so the timeout is cooperative: handlers stop retrying
+    once the deadline passes, and the watchdog reports items that overrun.
+
+    Items wait in per-tenant queues and are handed to the pool only when a
+    worker is free, taking tenants in turn.
+    """
+
+    def __init__(self, handlers, on_done=None, log=print):
+        """
+        Args:
+            handlers: Dict of channel -> handler(filepath, deadline) returning bool
+            on_done: Optional callback(filepath, channel, success) after each item
+            log: Logging function taking (message, level)
+        """
+        self.handlers = handlers
+        self.on_done = on_done
+        self.log = log
+
+        self._pools = {}
+        self._workers = {}
+        self._limits = {}
+        self._timeouts = {}
+        self._waiting = {}    # channel -> OrderedDict(tenant -> deque of paths)
+        self._running = {}    # channel -> items handed to the pool
+        self._queued = {}     # (channel, tenant) -> items queued or running
+        self._tenants = {}    # path -> tenant, while in flight
+        self._in_flight = {}  # path -> (channel, deadline or None if queued, reported)
+        self._lock = threading.Lock()
+        self._watchdog_wake = threading.Event()
+        self._stopped = False
+
+        for channel in handlers:
+            workers = int(channel_setting('APPROVAL_WORKERS', channel, DEFAULT_WORKERS.get(channel, 1)))
+            queue_limit = int(channel_setting('APPROVAL_QUEUE', channel, DEFAULT_QUEUE_LIMIT))
+            self._workers[channel] = max(1, workers)
+            self._pools[channel] = ThreadPoolExecutor(
+                max_workers=self._workers[channel],
+                thread_name_prefix=f"approval-{channel}"
+            )
+            self._limits[channel] = max(1, queue_limit)
+            self._timeouts[channel] = channel_setting('APPROVAL_TIMEOUT', channel,
+                                                      DEFAULT_TIMEOUTS.get(channel, 120))
+            self._waiting[channel] = OrderedDict()
+            self._running[channel] = 0
+
+        self._watchdog = threading.Thread(target=self._watchdog_loop, name="approval-watchdog", daemon=True)
+        self._watchdog.start()
+
+    def describe(self):
+        """Summary of pool sizes for startup logging"""
+        return ", ".join(
+            f"{channel}={self._workers[channel]} workers/{self._timeouts[channel]:.0f}s"
+            for channel in self._pools
+        )
+
+    def in_flight(self, channel=None, tenant=None):
+        """Number of queued or running items, optionally for one channel or tenant"""
+        with self._lock:
+            if channel is None and tenant is None:
+                return len(self._in_flight)
+            return sum(1 for path, (c, _, _) in self._in_flight.items()
+                       if channel in (None, c) and (tenant is None or self._tenants.get(path) == tenant))
+
+    def submit(self, filepath, tenant=None):
+        """
+        Queue an approved file on its channel's pool
+
+        Args:
+            filepath: Approved file
+            tenant: Fairness key, e.g. the vault the file belongs to
+
+        Returns:
+            True if queued (or already in flight), False if it could not be queued
+        """
+        channel = channel_for(filepath.name)
+        if channel is None or channel not in self._pools:
+            self.log(f"Unknown file type: {filepath.name}", "WARNING")
+            return False
+
+        with self._lock:
+            if self._stopped:
+                return False
+            if filepath in self._in_flight:
+                return True
+            # The limit is per tenant, so one vault's backlog cannot
+            # fill the queue for every other vault on the channel
+            queued = self._queued.get((channel, tenant), 0)
+            if queued >= self._limits[channel]:
+                self.log(f"{channel} queue full, deferring {filepath.name}", "WARNING")
+                return False
+            self._queued[(channel, tenant)] = queued + 1
+            # Deadline is set when a worker picks the item up
+            self._in_flight[filepath] = (channel, None, False)
+            self._tenants[filepath] = tenant
+            self._waiting[channel].setdefault(tenant, deque()).append(filepath)
+            self._dispatch(channel)
+        return True
+
+    def _dispatch(self, channel):
+        """Hand waiting items to free workers, one tenant at a time (lock held)"""
+        waiting = self._waiting[channel]
+        while waiting and self._running[channel] < self._workers[channel]:
+            tenant, queue = next(iter(waiting.items()))
+            filepath = queue.popleft()
+            # Served tenants go to the back of the line
+            del waiting[tenant]
+            if queue:
+                waiting[tenant] = queue
+            self._running[channel] += 1
+            self._pools[channel].submit(self._run, channel, filepath)
+
+    def _run(self, channel, filepath):
+        """Worker body: call the handler and report the outcome"""
+        deadline = time.monotonic() + self._timeouts[channel]
+        with self._lock:
+            self._in_flight[filepath] = (channel, deadline, False)
+        self._watchdog_wake.set()
+
+        success = False
+        try:
+            success = bool(self.handlers[channel](filepath, deadline))
+        except Exception as e:
+            self.log(f"Error processing {filepath.name}: {e}", "ERROR")
+        finally:
+            with self._lock:
+                self._in_flight.pop(filepath, None)
+                tenant = self._tenants.pop(filepath, None)
+                queued = self._queued.pop((channel, tenant), 1) - 1
+                if queued:
+                    self._queued[(channel, tenant)] = queued
+                self._running[channel] -= 1
+                if not self._stopped:
+                    self._dispatch(channel)
+
+        if self.on_done:
+            try:
+                self.on_done(filepath, channel, success)
+            except Exception as e:
+                self.log(f"Approval completion callback failed: {e}", "ERROR")
+
+    def _watchdog_loop(self):
+        """Report items that run past their per-item timeout"""
+        while not self._stopped:
+            self._watchdog_wake.clear()
+            now = time.monotonic()
+            next_deadline = None
+
+            with self._lock:
+                for filepath, (channel, deadline, reported) in list(self._in_flight.items()):
+                    if deadline is None or reported:
+                        continue
+                    if deadline <= now:
+                        self._in_flight[filepath] = (channel, deadline, True)
+                        self.log(f"{filepath.name} exceeded {channel} timeout "
+                                 f"({self._timeouts[channel]:.0f}s)", "WARNING")
+                    elif next_deadline is None or deadline < next_deadline:
+                        next_deadline = deadline
+
+            timeout = None if next_deadline is None else max(0.0, next_deadline - now)
+            self._watchdog_wake.wait(timeout)
+
+    def shutdown(self, wait=True):
+        """Stop accepting work and shut down every pool"""
+        with self._lock:
+            self._stopped = True
+        self._watchdog_wake.set()
+
+        for pool in self._pools.values():
+            pool.shutdown(wait=wait, cancel_futures=True)
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Child Output - Drains supervised watcher stdout/stderr continuously
+Every child's pipes are registered as readers on the orchestrator's event
+loop, so no watcher ever blocks on a full pipe buffer. Tagged lines go to
+a combined daily log in batches.
+"""
+
+import os
+from datetime import datetime
+from pathlib import Path
+
+from vault_metrics import parse_metric_line
+
+READ_SIZE = 64 * 1024
+MAX_LINE = 64 * 1024       # partial lines longer than this are flushed as-is
+FLUSH_INTERVAL = 1.0       # seconds between buffered log writes
+FLUSH_BYTES = 256 * 1024   # or flush once this much is buffered
+
+
+class ChildOutputMultiplexer:
+    """
+    Event-loop reader for the pipes of every supervised watcher
+
+    Lines are tagged with the watcher name (and stream, for stderr) and
+    appended to Logs/watchers_YYYY-MM-DD.md in batches. All methods must
+    be called from the event loop thread.
+    """
+
+    def __init__(self, logs_dir, prefix="watchers", title="Watcher Output Log", echo=False,
+                 on_metric=None):
+        """
+        Args:
+            logs_dir: Directory for the combined daily log
+            prefix: Log filename prefix
+            title: Heading written at the top of each daily file
+            echo: Also print tagged lines to the console
+            on_metric: Callable(watcher_name, metric_name, value) for metric
+                       marker lines; they are kept out of the log
+        """
+        self.logs_dir = Path(logs_dir)
+        self.prefix = prefix
+        self.title = title
+        self.echo = echo
+        self.on_metric = on_metric
+
+        self._loop = None
+        self._readers = {}        # fd -> pipe
+        self._partial = {}        # fd -> bytes of an unterminated line
+        self._buffer = []
+        self._buffered_bytes = 0
+        self._flush_handle = None
+
+    def start(self, loop):
+        """Attach to the event loop that will own the pipe readers"""
+        self._loop = loop
+
+    def add(self, name, process):
+        """
+        Start draining a child's stdout and stderr
+
+        Args:
+            name: Watcher display name used to tag lines
+            process: subprocess.Popen created with stdout/stderr=PIPE
+        """
+        for stream, pipe in (('stdout', process.stdout), ('stderr', process.stderr)):
+            if pipe is None:
+                continue
+            fd = pipe.fileno()
+            os.set_blocking(fd, False)
+            self._readers[fd] = pipe
+            self._loop.add_reader(fd, self._read, fd, name, stream)
+
+    def _emit(self, name, stream, raw):
+        """Queue one tagged line for the combined log"""
+        line = raw.decode('utf-8', errors='replace').rstrip('\r\n')
+        if not line:
+            return
+
+        if stream == 'stdout' and self.on_metric is not None:
+            metric = parse_metric_line(line)
+            if metric is not None:
+                self.on_metric(name, *metric)
+                return
+
+        tag = name if stream == 'stdout' else f"{name}:{stream}"
+        entry = f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] [{tag}] {line}\n"
+
+        if self.echo:
+            print(entry, end='')
+
+        self._buffer.append(entry)
+        self._buffered_bytes += len(entry)
+
+    def _close(self, fd):
+        """Stop reading a pipe that reached EOF"""
+        self._loop.remove_reader(fd)
+        pipe = self._readers.pop(fd, None)
+        if pipe is not None:
+            pipe.close()
+
+    def _read(self, fd, name, stream):
+        """Read whatever is available on a pipe and split it into lines"""
+        try:
+            data = os.read(fd, READ_SIZE)
+        except BlockingIOError:
+            return
+        except OSError:
+            data = b''
+
+        if not data:
+            # EOF - the child exited or closed the stream
+            leftover = self._partial.pop(fd, b'')
+            if leftover:
+                self._emit(name, stream, leftover)
+            self._close(fd)
+        else:
+            data = self._partial.pop(fd, b'') + data
+            *lines, rest = data.split(b'\n')
+            for raw in lines:
+                self._emit(name, stream, raw)
+
+            if len(rest) > MAX_LINE:
+                self._emit(name, stream, rest)
+            elif rest:
+                self._partial[fd] = rest
+
+        self._schedule_flush()
+
+    def _schedule_flush(self):
+        """Flush now if the buffer is large, otherwise within FLUSH_INTERVAL"""
+        if self._buffered_bytes >= FLUSH_BYTES:
+            self.flush()
+        elif self._buffer and self._flush_handle is None:
+            self._flush_handle = self._loop.call_later(FLUSH_INTERVAL, self.flush)
+
+    def flush(self):
+        """Append buffered lines to today's combined log"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        if not self._buffer:
+            return
+
+        entries, self._buffer = self._buffer, []
+        self._buffered_bytes = 0
+
+        log_date = datetime.now().strftime('%Y-%m-%d')
+        log_file = self.logs_dir / f"{self.prefix}_{log_date}.md"
+
+        try:
+            with open(log_file, 'a', encoding='utf-8') as f:
+                if f.tell() == 0:
+                    f.write(f"# {self.title} - {log_date}\n\n")
+                f.writelines(entries)
+        except Exception as e:
+            print(f"[ERROR] Failed to write watcher output log: {e}")
+
+    def stop(self):
+        """Detach every pipe and flush remaining output"""
+        for fd in list(self._readers):
+            self._close(fd)
+        self.flush()
@@ -0,0 +1,545 @@
+#!/usr/bin/env python3
+"""
+Done Archive - Date-sharded storage for finished vault items
+Completed items live in Done/YYYY/MM/DD/ instead of one flat folder.
+Each day's shard carries a .manifest.jsonl with one record per item
+(id, completed, type, channel, size), so reports over a date range read
+a handful of small manifests and never list the whole archive.
+
+Shards older than DONE_PACK_AFTER_DAYS are compacted into per-month packs
+under Done/packs/: one gzip member per item plus an index of
+(id, day) -> offset, so a single item is read back without unpacking the month.
+
+Usage:
+    python done_archive.py migrate
+    python done_archive.py pack --after-days 30
+    python done_archive.py list --since 2026-02-20 --until 2026-02-27
+    python done_archive.py cat EMAIL_REPLY_20260227_233500.md
+    python done_archive.py cat LinkedIn_Post.md --date 2026-02-26
+"""
+
+import os
+import re
+import sys
+import gzip
+import json
+import argparse
+from collections import Counter
+from datetime import datetime, date, timedelta
+from pathlib import Path
+from dotenv import load_dotenv
+
+from vault_catalog import get_catalog, describe_item, is_item
+
+# Load environment variables
+load_dotenv()
+
+# Configuration
+VAULT_PATH = Path(os.getenv('VAULT_PATH', '.'))
+DONE_DIR = VAULT_PATH / 'Done'
+DONE_PACK_AFTER_DAYS = int(os.getenv('DONE_PACK_AFTER_DAYS', 30))
+
+MANIFEST_NAME = '.manifest.jsonl'
+PACKS_SUBDIR = 'packs'
+PACK_RE = re.compile(r'^(\d{4}-\d{2})\.pack$')
+
+# LinkedIn_Posted_2026-02-26.md, EMAIL_REPLY_20260227_233500.md - the day is in the name
+NAME_DATE_RE = re.compile(r'(?<!\d)(20\d{2})-?(\d{2})-?(\d{2})(?!\d)')
+
+
+def shard_dir(day, done_dir=DONE_DIR):
+    """Done/YYYY/MM/DD/ for a date or datetime"""
+    return Path(done_dir) / f"{day:%Y}" / f"{day:%m}" / f"{day:%d}"
+
+
+def unique_path(path):
+    """path, or path with a timestamp suffix if the name is taken"""
+    if not path.exists():
+        return path
+    stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    return path.with_name(f"{path.stem}_{stamp}{path.suffix}")
+
+
+def manifest_record(path, completed=None, **fields):
+    """Manifest record for an item (see add_to_manifest)"""
+    path = Path(path)
+    completed = completed or datetime.now()
+    item_type, channel, _, _ = describe_item(path)
+    try:
+        size = path.stat().st_size
+    except OSError:
+        size = None
+
+    record = {
+        'id': path.name,
+        'completed': completed.strftime('%Y-%m-%d %H:%M:%S'),
+        'type': item_type,
+        'channel': channel,
+        'size': size,
+    }
+    record.update(fields)
+    return record
+
+
+def add_to_manifest(path, completed=None, **fields):
+    """
+    Append an item to its shard's manifest
+
+    Args:
+        path: Item inside a Done/ shard
+        completed: Completion datetime (default: now)
+        **fields: Override recorded fields (e.g. channel='linkedin')
+    """
+    path = Path(path)
+    record = manifest_record(path, completed, **fields)
+
+    # One short O_APPEND write per record keeps concurrent writers intact
+    with open(path.parent / MANIFEST_NAME, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def complete(filepath, completed=None, done_dir=DONE_DIR, log=None, catalog=None):
+    """
+    Move a finished item into today's Done/ shard
+
+    Args:
+        filepath: Item to move (e.g. from Approved/)
+        completed: Completion datetime (default: now)
+        done_dir: Root of the Done/ archive
+        log: Logging function taking (message, level), or None
+        catalog: VaultCatalog of the item's vault (default: this vault's)
+
+    Returns:
+        The new path
+
+    Raises:
+        OSError if the move fails
+    """
+    completed = completed or datetime.now()
+    shard = shard_dir(completed, done_dir)
+    shard.mkdir(parents=True, exist_ok=True)
+
+    destination = (catalog or get_catalog()).move(filepath, unique_path(shard / Path(filepath).name))
+
+    # The item is already done; a lost manifest line only drops it from reports
+    try:
+        add_to_manifest(destination, completed)
+    except OSError as e:
+        if log is not None:
+            log(f"Failed to update Done/ manifest for {destination.name}: {e}", "WARNING")
+    return destination
+
+
+def completion_date(path):
+    """Best guess at when a loose Done/ file was finished"""
+    match = NAME_DATE_RE.search(path.name)
+    if match:
+        try:
+            return datetime(*map(int, match.groups()))
+        except ValueError:
+            pass
+    return datetime.fromtimestamp(path.stat().st_mtime)
+
+
+def migrate(done_dir=DONE_DIR, log=print, catalog=None):
+    """
+    Move loose files at the top of Done/ into their date shards
+
+    Files put there by hand or by older versions are sharded by the date
+    in their name, else by their modification time.
+
+    Returns:
+        Number of files moved
+    """
+    done_dir = Path(done_dir)
+    moved = 0
+    for path in sorted(done_dir.iterdir()):
+        if not path.is_file() or not is_item(path):
+            continue
+        try:
+            complete(path, completion_date(path), done_dir, log=log, catalog=catalog)
+            moved += 1
+        except OSError as e:
+            log(f"Failed to shard {path.name}: {e}", "ERROR")
+
+    if moved:
+        log(f"Sharded {moved} loose Done/ item(s)")
+    return moved
+
+
+def _date_string(value):
+    return value.isoformat() if isinstance(value, date) else str(value)[:10]
+
+
+def iter_shards(since, until, done_dir=DONE_DIR):
+    """
+    Shards between two dates (inclusive), oldest first
+
+    Only the year and month folders overlapping the range are listed.
+
+    Args:
+        since: First date ('YYYY-MM-DD' or date)
+        until: Last date ('YYYY-MM-DD' or date)
+
+    Yields:
+        ('YYYY-MM-DD', shard path)
+    """
+    since, until = _date_string(since), _date_string(until)
+    done_dir = Path(done_dir)
+    if not done_dir.is_dir():
+        return
+
+    def subdirs(path, digits):
+        return sorted(p.name for p in path.iterdir()
+                      if p.is_dir() and len(p.name) == digits and p.name.isdigit())
+
+    for year in subdirs(done_dir, 4):
+        if not since[:4] <= year <= until[:4]:
+            continue
+        for month in subdirs(done_dir / year, 2):
+            if not since[:7] <= f"{year}-{month}" <= until[:7]:
+                continue
+            for day in subdirs(done_dir / year / month, 2):
+                key = f"{year}-{month}-{day}"
+                if since <= key <= until:
+                    yield key, done_dir / year / month / day
+
+
+def read_json_lines(path):
+    """Records of a JSON-lines file, stopping at a torn final write"""
+    if not path.exists():
+        return []
+    records = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                break
+    return records
+
+
+class ItemPack:
+    """
+    One month of compacted Done/ items: packs/<YYYY-MM>.pack
+
+    Each item is an independent gzip member. The .idx file next to the
+    pack holds one JSON record per item - its manifest record plus
+    "offset" and "length" - in pack order.
+    """
+
+    def __init__(self, packs_dir, month):
+        self.packs_dir = Path(packs_dir)
+        self.month = month
+        self.data_path = self.packs_dir / f"{month}.pack"
+        self.index_path = self.packs_dir / f"{month}.idx"
+
+    def records(self):
+        """Index records in pack order"""
+        return read_json_lines(self.index_path)
+
+    def add(self, items):
+        """
+        Append items and index them
+
+        Data is synced before the index so an index record never points
+        past the data; unindexed bytes from an interrupted run are
+        truncated away.
+
+        Args:
+            items: List of (manifest record, file path)
+        """
+        records = self.records()
+        end = records[-1]['offset'] + records[-1]['length'] if records else 0
+
+        self.packs_dir.mkdir(parents=True, exist_ok=True)
+        new_records = []
+
+        with open(self.data_path, 'ab') as out:
+            out.truncate(end)
+            out.seek(end)
+            for record, path in items:
+                member = gzip.compress(path.read_bytes(), mtime=0)
+                out.write(member)
+                new_records.append(dict(record, offset=end, length=len(member)))
+                end += len(member)
+            out.flush()
+            os.fsync(out.fileno())
+
+        with open(self.index_path, 'a', encoding='utf-8') as f:
+            for record in new_records:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def read(self, record, f=None):
+        """Decompressed bytes of one item"""
+        if f is None:
+            with open(self.data_path, 'rb') as f:
+                return self.read(record, f)
+        f.seek(record['offset'])
+        return gzip.decompress(f.read(record['length']))
+
+
+def packs_dir(done_dir=DONE_DIR):
+    return Path(done_dir) / PACKS_SUBDIR
+
+
+def pack_months(done_dir=DONE_DIR):
+    """Months with a pack, oldest first"""
+    target = packs_dir(done_dir)
+    if not target.is_dir():
+        return []
+    return sorted(m.group(1) for m in map(PACK_RE.match, os.listdir(target)) if m)
+
+
+def remove_shard(shard, done_dir):
+    """Delete an emptied shard and any month or year folder it leaves empty"""
+    shard.joinpath(MANIFEST_NAME).unlink(missing_ok=True)
+    for folder in (shard, shard.parent, shard.parent.parent):
+        if folder == Path(done_dir):
+            break
+        try:
+            folder.rmdir()
+        except OSError:
+            break  # not empty
+
+
+def pack_old_shards(done_dir=DONE_DIR, pack_after_days=DONE_PACK_AFTER_DAYS, today=None, log=print,
+                    catalog=None):
+    """
+    Compact shards older than pack_after_days into month packs
+
+    Items already in a pack (from a run that stopped before deleting
+    them) are not packed twice.
+
+    Returns:
+        Number of items packed
+    """
+    done_dir = Path(done_dir)
+    today = today or date.today()
+    last_day = today - timedelta(days=pack_after_days + 1)
+    catalog = catalog or get_catalog()
+    packs = {}              # month -> (ItemPack, {(id, day) already packed})
+    packed = 0
+
+    for day, shard in list(iter_shards('0000-00-00', last_day, done_dir)):
+        month = day[:7]
+        if month not in packs:
+            pack = ItemPack(packs_dir(done_dir), month)
+            packs[month] = (pack, {(r['id'], r['completed'][:10]) for r in pack.records()})
+        pack, packed_ids = packs[month]
+
+        manifest = {record['id']: record for record in read_json_lines(shard / MANIFEST_NAME)}
+        items, files = [], []
+        for path in sorted(shard.iterdir()):
+            if not path.is_file() or not is_item(path):
+                continue
+            files.append(path)
+            if (path.name, day) in packed_ids:
+                continue
+            record = manifest.get(path.name) or manifest_record(
+                path, datetime.strptime(day, '%Y-%m-%d'))
+            items.append((record, path))
+
+        try:
+            if items:
+                pack.add(items)
+                packed_ids.update((record['id'], day) for record, _ in items)
+            for path in files:
+                path.unlink()
+                catalog.forget(path, 'Done')
+            remove_shard(shard, done_dir)
+            packed += len(items)
+        except OSError as e:
+            log(f"Failed to pack Done/ shard {day}: {e}", "ERROR")
+
+    if packed:
+        log(f"Packed {packed} Done/ item(s) older than {pack_after_days} days")
+    return packed
+
+
+_pack_index = {}            # index path -> (mtime_ns, {id: {day: record}})
+
+
+def find_archived(item_id, day=None, done_dir=DONE_DIR):
+    """
+    Locate a packed item
+
+    Ids are only unique within a day, so a pack is indexed by id and day.
+    Index files are loaded on first use and reloaded when they change.
+
+    Args:
+        item_id: File name of the item
+        day: Completion date 'YYYY-MM-DD' (default: the latest packed one)
+        done_dir: Root of the Done/ archive
+
+    Returns:
+        (ItemPack, record) or None
+    """
+    target = packs_dir(done_dir)
+    months = pack_months(done_dir)
+    if day is not None:
+        months = [month for month in months if month == day[:7]]
+    for month in reversed(months):
+        pack = ItemPack(target, month)
+        try:
+            stamp = pack.index_path.stat().st_mtime_ns
+        except OSError:
+            continue
+        cached = _pack_index.get(pack.index_path)
+        if cached is None or cached[0] != stamp:
+            by_id = {}
+            for record in pack.records():
+                by_id.setdefault(record['id'], {})[record['completed'][:10]] = record
+            cached = _pack_index[pack.index_path] = (stamp, by_id)
+        days = cached[1].get(item_id)
+        if days:
+            record = days.get(day) if day is not None else days[max(days)]
+            if record is not None:
+                return pack, record
+    return None
+
+
+def read_archived(item_id, day=None, done_dir=DONE_DIR):
+    """
+    Content of a finished item, whether still in a shard or packed
+
+    Args:
+        item_id: File name of the item
+        day: Completion date 'YYYY-MM-DD' (default: the latest completion)
+        done_dir: Root of the Done/ archive
+
+    Returns:
+        Text of the item, or None if it is not in the archive
+    """
+    # Live shards are newer than any pack, so they are looked at first
+    if day is not None:
+        shards = [shard_dir(datetime.strptime(day, '%Y-%m-%d'), done_dir) / item_id]
+    else:
+        shards = sorted(Path(done_dir).glob(f"[0-9][0-9][0-9][0-9]/[0-9][0-9]/[0-9][0-9]/{item_id}"),
+                        reverse=True)
+    for path in shards:
+        if path.is_file():
+            return path.read_text(encoding='utf-8', errors='replace')
+
+    found = find_archived(item_id, day, done_dir)
+    if found is not None:
+        pack, record = found
+        return pack.read(record).decode('utf-8', errors='replace')
+    return None
+
+
+def iter_completed(since, until, done_dir=DONE_DIR):
+    """
+    Manifest records of items completed between two dates
+
+    Packed months are read from their index, live shards from their
+    manifest.
+
+    Yields:
+        Dicts with id, completed, type, channel and size, plus either
+        path (live shards) or pack, offset and length (packed items)
+    """
+    since, until = _date_string(since), _date_string(until)
+
+    for month in pack_months(done_dir):
+        if not since[:7] <= month <= until[:7]:
+            continue
+        pack = ItemPack(packs_dir(done_dir), month)
+        for record in pack.records():
+            if since <= record['completed'][:10] <= until:
+                record['pack'] = pack
+                yield record
+
+    for _, shard in iter_shards(since, until, done_dir):
+        for record in read_json_lines(shard / MANIFEST_NAME):
+            record['path'] = shard / record['id']
+            yield record
+
+
+def iter_items(since, until, done_dir=DONE_DIR):
+    """
+    Stream (record, text) for every item completed between two dates
+
+    Packed items are decompressed one at a time.
+    """
+    for record in iter_completed(since, until, done_dir):
+        try:
+            if 'pack' in record:
+                data = record['pack'].read(record)
+            else:
+                data = record['path'].read_bytes()
+        except OSError:
+            continue  # moved out of Done/ by hand
+        yield record, data.decode('utf-8', errors='replace')
+
+
+def completed_counts(since, until, done_dir=DONE_DIR):
+    """
+    Completed items per channel between two dates
+
+    Returns:
+        Counter of channel -> count ('other' for items without one)
+    """
+    return Counter(record.get('channel') or 'other'
+                   for record in iter_completed(since, until, done_dir))
+
+
+def format_counts(counts):
+    """'5 (email: 3, linkedin: 2)' or '0'"""
+    total = sum(counts.values())
+    if not total:
+        return "0"
+    detail = ", ".join(f"{channel}: {n}" for channel, n in counts.most_common())
+    return f"{total} ({detail})"
+
+
+def main():
+    """Command line interface"""
+    parser = argparse.ArgumentParser(description="Shard and query the Done/ archive")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    commands.add_parser('migrate', help="Move loose Done/ files into date shards")
+
+    pack = commands.add_parser('pack', help="Compact old shards into month packs")
+    pack.add_argument('--after-days', type=int, default=DONE_PACK_AFTER_DAYS,
+                      help=f"Keep this many days of shards unpacked (default {DONE_PACK_AFTER_DAYS})")
+
+    cat = commands.add_parser('cat', help="Print a finished item, packed or not")
+    cat.add_argument('id', help="File name of the item")
+    cat.add_argument('--date', help="Completion date, for an id reused on several days (default: latest)")
+
+    listing = commands.add_parser('list', help="List items completed in a date range")
+    listing.add_argument('--since', help="First date (default: 7 days ago)")
+    listing.add_argument('--until', help="Last date (default: today)")
+
+    args = parser.parse_args()
+
+    log = lambda message, level="INFO": print(message)
+    if args.command == 'migrate':
+        migrate(log=log)
+        return
+    if args.command == 'pack':
+        pack_old_shards(pack_after_days=args.after_days, log=log)
+        return
+    if args.command == 'cat':
+        text = read_archived(args.id, args.date)
+        if text is None:
+            print(f"Not found in Done/: {args.id}" + (f" ({args.date})" if args.date else ""))
+            sys.exit(1)
+        print(text, end='')
+        return
+
+    today = date.today()
+    since = args.since or (today - timedelta(days=7)).isoformat()
+    until = args.until or today.isoformat()
+    try:
+        for record in iter_completed(since, until):
+            print(f"{record['completed']}  {record.get('channel') or '-':<9} {record['id']}")
+    except BrokenPipeError:
+        sys.stderr.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Inbox Routing - Per-folder rules for files dropped into Inbox/ subfolders
+Clients can organise drops (Inbox/invoices/, Inbox/clientA/urgent/, ...)
+and each folder maps to a task type, a priority and a destination folder.
+
+Rules live in inbox_routes.json at the vault root, a list such as:
+
+    [
+      {"path": "invoices", "type": "invoice", "priority": "high"},
+      {"path": "clients/*", "type": "client"},
+      {"path": "clients/*/drafts", "destination": "Plans"}
+    ]
+
+A rule applies to its folder and everything below it. Path segments are
+literal names or '*' (any one folder). Where several rules match, each
+field comes from the deepest rule that sets it, and a literal name beats
+'*' at the same depth. Rules are compiled into a deterministic trie, so
+routing a path costs one dictionary lookup per folder level however many
+rules there are.
+
+Usage:
+    python inbox_routing.py Inbox/clients/acme/drafts/offer.md
+"""
+
+import os
+import json
+import argparse
+from typing import NamedTuple, Optional
+from pathlib import Path
+
+from vault_catalog import CATALOG_FOLDERS
+
+# Configuration
+VAULT_PATH = Path(os.getenv('VAULT_PATH', '.'))
+INBOX_ROUTES_PATH = Path(os.getenv('INBOX_ROUTES_PATH', VAULT_PATH / 'inbox_routes.json'))
+
+ROUTE_FIELDS = ('type', 'priority', 'destination')
+PRIORITIES = ('high', 'medium', 'normal', 'low')
+
+
+class Route(NamedTuple):
+    type: Optional[str] = None
+    priority: Optional[str] = None
+    destination: Optional[str] = None   # top-level vault folder, default Needs_Action
+
+    def task_name(self, filename):
+        """File name for the task: prefixed with the type, e.g. INVOICE_scan.pdf"""
+        if not self.type:
+            return filename
+        prefix = f"{self.type.upper()}_"
+        return filename if filename.upper().startswith(prefix) else prefix + filename
+
+
+class _Node:
+    __slots__ = ('children', 'star', 'fields', 'route')
+
+    def __init__(self, fields=None):
+        self.children = {}
+        self.star = None
+        self.fields = dict(fields or {})
+        self.route = None
+
+
+def _merge(first, second):
+    """New node matching both subtrees; first's fields win"""
+    if first is None and second is None:
+        return None
+    # Always a fresh copy: _compile() gives each position its own routes
+    first, second = first or _Node(), second or _Node()
+    node = _Node({**second.fields, **first.fields})
+    for name in first.children.keys() | second.children.keys():
+        node.children[name] = _merge(first.children.get(name), second.children.get(name))
+    node.star = _merge(first.star, second.star)
+    return node
+
+
+def _compile(node, inherited):
+    """Fold '*' subtrees into literal siblings and resolve each node's route"""
+    fields = {**inherited, **node.fields}
+    node.route = Route(**fields)
+    if node.star is not None:
+        for name, child in node.children.items():
+            node.children[name] = _merge(child, node.star)
+        node.star = _merge(node.star, None)
+        _compile(node.star, fields)
+    for child in node.children.values():
+        _compile(child, fields)
+
+
+class RouteTable:
+    """Compiled routing rules"""
+
+    def __init__(self, rules=()):
+        """
+        Args:
+            rules: Dicts with 'path' and any of type, priority, destination
+
+        Raises:
+            ValueError for an unknown field, priority or destination
+        """
+        root = _Node()
+        self.count = 0
+        for rule in rules:
+            rule = dict(rule)
+            segments = [s for s in str(rule.pop('path', '')).strip('/').split('/') if s not in ('', '.')]
+            unknown = set(rule) - set(ROUTE_FIELDS)
+            if unknown:
+                raise ValueError(f"Unknown route field(s) {sorted(unknown)} for '{'/'.join(segments)}'")
+            if rule.get('priority') and rule['priority'].lower() not in PRIORITIES:
+                raise ValueError(f"Unknown priority '{rule['priority']}'")
+            if rule.get('destination') and rule['destination'] not in CATALOG_FOLDERS:
+                raise ValueError(f"Destination '{rule['destination']}' is not a vault folder")
+            if rule.get('priority'):
+                rule['priority'] = rule['priority'].lower()
+
+            node = root
+            for segment in segments:
+                if segment == '*':
+                    node.star = node.star or _Node()
+                    node = node.star
+                else:
+                    node = node.children.setdefault(segment, _Node())
+            node.fields.update({k: v for k, v in rule.items() if v})
+            self.count += 1
+
+        _compile(root, {})
+        self._root = root
+
+    def route(self, folders):
+        """
+        Route for a file in an Inbox/ subfolder
+
+        Args:
+            folders: Folder names from Inbox/ down to the file's folder
+
+        Returns:
+            Route (all fields None when no rule applies)
+        """
+        node = self._root
+        for name in folders:
+            nxt = node.children.get(name) or node.star
+            if nxt is None:
+                break
+            node = nxt
+        return node.route
+
+
+def load_routes(path=INBOX_ROUTES_PATH):
+    """
+    Read and compile the routing rules
+
+    Returns:
+        RouteTable (empty if the file does not exist)
+
+    Raises:
+        ValueError if the file is not a valid rules list
+    """
+    path = Path(path)
+    if not path.exists():
+        return RouteTable()
+    with open(path, 'r', encoding='utf-8') as f:
+        rules = json.load(f)
+    if not isinstance(rules, list):
+        raise ValueError(f"{path}: expected a list of rules")
+    return RouteTable(rules)
+
+
+class RoutingRules:
+    """Routing rules that recompile when the rules file changes"""
+
+    def __init__(self, path=INBOX_ROUTES_PATH, log=None):
+        """
+        Args:
+            path: Rules file
+            log: Logging function taking (message, level), or None
+        """
+        self.path = Path(path)
+        self.log = log
+        self.table = RouteTable()
+        self._stamp = None
+        self.refresh()
+
+    def refresh(self):
+        """Recompile if the file changed; a broken file keeps the old rules"""
+        try:
+            st = self.path.stat()
+            stamp = (st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            stamp = None
+        if stamp == self._stamp:
+            return self.table
+
+        self._stamp = stamp
+        try:
+            self.table = load_routes(self.path)
+            if self.log is not None and stamp is not None:
+                self.log(f"Loaded {self.table.count} inbox routing rule(s)")
+        except (OSError, ValueError) as e:
+            if self.log is not None:
+                self.log(f"Invalid inbox routing rules in {self.path}: {e}", "ERROR")
+        return self.table
+
+
+def main():
+    """Command line interface"""
+    parser = argparse.ArgumentParser(description="Show how inbox files would be routed")
+    parser.add_argument('files', nargs='+', help="Paths under Inbox/")
+    args = parser.parse_args()
+
+    table = load_routes()
+    inbox = (VAULT_PATH / 'Inbox').resolve()
+    for name in args.files:
+        path = Path(name).resolve()
+        try:
+            folders = path.relative_to(inbox).parent.parts
+        except ValueError:
+            folders = ()
+        route = table.route(folders)
+        print(f"{name}: {route.destination or 'Needs_Action'}/{route.task_name(path.name)} "
+              f"(type: {route.type or '-'}, priority: {route.priority or 'from contents'})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+Log Archive - Rotation, compression and retention for Logs/
+Daily logs older than LOG_ARCHIVE_AFTER_DAYS are packed into per-month
+gzip archives under Logs/archive/. Each archive is a series of
+independent gzip members with a small offset index next to it, so a
+reader can stream a single day (or part of one) without decompressing
+the whole month. Anything older than LOG_RETENTION_DAYS is deleted.
+
+Usage:
+    python log_archive.py rotate
+    python log_archive.py cat gmail --since 2026-01-03 --until 2026-01-05
+"""
+
+import os
+import re
+import sys
+import gzip
+import json
+import argparse
+from datetime import datetime, timedelta
+from pathlib import Path
+from dotenv import load_dotenv
+
+from log_index import parse_line
+
+# Load environment variables
+load_dotenv()
+
+# Configuration
+VAULT_PATH = Path(os.getenv('VAULT_PATH', '.'))
+LOGS_DIR = VAULT_PATH / 'Logs'
+LOG_ARCHIVE_AFTER_DAYS = int(os.getenv('LOG_ARCHIVE_AFTER_DAYS', 7))
+LOG_RETENTION_DAYS = int(os.getenv('LOG_RETENTION_DAYS', 365))
+
+ARCHIVE_SUBDIR = 'archive'
+
+# Uncompressed size of one gzip member; the unit a reader decompresses
+CHUNK_BYTES = 256 * 1024
+
+# Logs/<component>_<date>.<md|jsonl>, or Logs/<date>.md from the original file watcher
+DAILY_LOG_RE = re.compile(r'^(?:(?P<component>.+)_)?(?P<date>\d{4}-\d{2}-\d{2})\.(?P<kind>md|jsonl)$')
+ARCHIVE_RE = re.compile(r'^(?P<component>.+)_(?P<month>\d{4}-\d{2})\.(?P<kind>md|jsonl)\.gz$')
+
+
+def parse_daily_log_name(name):
+    """
+    Split a daily log file name
+
+    Returns:
+        (component, 'YYYY-MM-DD', kind) or None
+    """
+    match = DAILY_LOG_RE.match(name)
+    if not match:
+        return None
+    return match.group('component') or 'file_watcher', match.group('date'), match.group('kind')
+
+
+def first_timestamp(lines, log_date, kind):
+    """Timestamp ('YYYY-MM-DD HH:MM:SS') of the first entry in a chunk"""
+    for line in lines:
+        text = line.decode('utf-8', errors='replace').rstrip('\r\n')
+        if kind == 'jsonl':
+            try:
+                return json.loads(text)['ts'].replace('T', ' ')[:19]
+            except (ValueError, KeyError, TypeError, AttributeError):
+                continue
+        entry = parse_line(text, log_date)
+        if entry is not None:
+            return entry[0]
+    return None
+
+
+class MonthArchive:
+    """
+    One component's logs for one month: <component>_<YYYY-MM>.<kind>.gz
+
+    The .idx file next to it holds one JSON record per gzip member:
+    {"date", "first_ts", "offset", "length"}.
+    """
+
+    def __init__(self, archive_dir, component, month, kind='md'):
+        self.archive_dir = Path(archive_dir)
+        self.component = component
+        self.month = month
+        self.kind = kind
+        self.data_path = self.archive_dir / f"{component}_{month}.{kind}.gz"
+        self.index_path = self.archive_dir / f"{component}_{month}.{kind}.idx"
+
+    def records(self):
+        """Index records in archive order"""
+        if not self.index_path.exists():
+            return []
+        records = []
+        with open(self.index_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    break  # torn final write; the data past it is unindexed
+        return records
+
+    def dates(self):
+        return {record['date'] for record in self.records()}
+
+    def add_day(self, path, log_date):
+        """
+        Append one daily log as gzip members and index them
+
+        Data is synced before the index so an index record never points
+        past the data; unindexed bytes from an interrupted run are
+        truncated away.
+        """
+        records = self.records()
+        end = records[-1]['offset'] + records[-1]['length'] if records else 0
+
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        new_records = []
+
+        with open(path, 'rb') as src, open(self.data_path, 'ab') as out:
+            out.truncate(end)
+            out.seek(end)
+            while True:
+                lines = src.readlines(CHUNK_BYTES)
+                if not lines:
+                    break
+                member = gzip.compress(b''.join(lines), mtime=0)
+                out.write(member)
+                new_records.append({
+                    'date': log_date,
+                    'first_ts': first_timestamp(lines, log_date, self.kind),
+                    'offset': end,
+                    'length': len(member),
+                })
+                end += len(member)
+            out.flush()
+            os.fsync(out.fileno())
+
+        with open(self.index_path, 'a', encoding='utf-8') as f:
+            for record in new_records:
+                f.write(json.dumps(record) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def read_member(self, record, f=None):
+        """Decompressed bytes of one member"""
+        if f is None:
+            with open(self.data_path, 'rb') as f:
+                return self.read_member(record, f)
+        f.seek(record['offset'])
+        return gzip.decompress(f.read(record['length']))
+
+    def iter_lines(self, since=None, until=None):
+        """
+        Stream lines, decompressing only members that can hold the range
+
+        Args:
+            since: Earliest date or timestamp wanted
+            until: Latest date or timestamp wanted
+        """
+        records = self.records()
+        if not records:
+            return
+
+        with open(self.data_path, 'rb') as f:
+            for i, record in enumerate(records):
+                if until and record['first_ts'] and record['first_ts'] > range_end(until):
+                    break
+                if since:
+                    # A member ends where the next one from the same day begins
+                    following = records[i + 1] if i + 1 < len(records) else None
+                    if record['date'] < since[:10]:
+                        continue
+                    if (following and following['date'] == record['date']
+                            and following['first_ts'] and following['first_ts'] <= since):
+                        continue
+                for line in self.read_member(record, f).decode('utf-8', errors='replace').splitlines():
+                    yield line
+
+
+def range_end(until):
+    """A bare date covers the whole day"""
+    return until + " 99" if len(until) == 10 else until
+
+
+def archive_dir(logs_dir=LOGS_DIR):
+    return Path(logs_dir) / ARCHIVE_SUBDIR
+
+
+def rotate_logs(logs_dir=LOGS_DIR, archive_after_days=LOG_ARCHIVE_AFTER_DAYS,
+                retention_days=LOG_RETENTION_DAYS, today=None, log=print):
+    """
+    Archive old daily logs and prune past the retention horizon
+
+    Args:
+        logs_dir: Folder with the daily logs
+        archive_after_days: Keep this many days of plain logs
+        retention_days: Delete logs and archives older than this
+        today: Reference date (default: today)
+        log: Logging function taking (message, level)
+
+    Returns:
+        (days archived, files deleted)
+    """
+    logs_dir = Path(logs_dir)
+    today = today or datetime.now().date()
+    archive_before = (today - timedelta(days=archive_after_days)).isoformat()
+    horizon = (today - timedelta(days=retention_days)).isoformat()
+    target_dir = archive_dir(logs_dir)
+
+    archived = deleted = 0
+    archives = {}
+
+    for path in sorted(logs_dir.iterdir()):
+        parsed = parse_daily_log_name(path.name)
+        if parsed is None or not path.is_file():
+            continue
+        component, log_date, kind = parsed
+        if log_date >= archive_before:
+            continue
+
+        try:
+            if log_date >= horizon:
+                key = (component, log_date[:7], kind)
+                archive = archives.get(key)
+                if archive is None:
+                    archive = archives[key] = MonthArchive(target_dir, *key)
+                # Already archived by a run that stopped before unlinking
+                if log_date not in archive.dates():
+                    archive.add_day(path, log_date)
+                    archived += 1
+            path.unlink()
+            deleted += log_date < horizon
+        except OSError as e:
+            log(f"Failed to archive {path.name}: {e}", "ERROR")
+
+    if target_dir.exists():
+        horizon_month = horizon[:7]
+        for path in sorted(target_dir.glob('*.gz')):
+            match = ARCHIVE_RE.match(path.name)
+            if match and match.group('month') < horizon_month:
+                path.unlink()
+                path.with_name(path.name[:-3] + '.idx').unlink(missing_ok=True)
+                deleted += 1
+
+    if archived or deleted:
+        log(f"Log rotation: archived {archived} daily log(s), deleted {deleted} past retention")
+    return archived, deleted
+
+
+def iter_log_lines(component, since=None, until=None, kind='md', logs_dir=LOGS_DIR, offsets=None):
+    """
+    Stream a component's log lines across archives and live daily files
+
+    Args:
+        component: Log prefix, e.g. 'gmail'
+        since: Earliest date or timestamp (entries before it may still
+               appear from the first member read)
+        until: Latest date or timestamp
+        kind: 'md' or 'jsonl'
+        logs_dir: Folder with the daily logs
+        offsets: Optional dict filled with {path: byte offset} of where each
+                 daily file was read up to; a last line still being written
+                 is left out, for a follower to pick up from there
+
+    Yields:
+        Lines without line endings, oldest first
+    """
+    logs_dir = Path(logs_dir)
+    target_dir = archive_dir(logs_dir)
+
+    months = []
+    if target_dir.exists():
+        for path in target_dir.glob(f"{component}_*.{kind}.gz"):
+            match = ARCHIVE_RE.match(path.name)
+            if match and match.group('component') == component:
+                months.append(match.group('month'))
+
+    for month in sorted(months):
+        if (since and month < since[:7]) or (until and month > until[:7]):
+            continue
+        yield from MonthArchive(target_dir, component, month, kind).iter_lines(since, until)
+
+    daily = []
+    for path in logs_dir.glob(f"*.{kind}"):
+        parsed = parse_daily_log_name(path.name)
+        if parsed and parsed[0] == component and parsed[2] == kind:
+            daily.append((parsed[1], path))
+
+    for log_date, path in sorted(daily):
+        if (since and log_date < since[:10]) or (until and log_date > until[:10]):
+            continue
+        with open(path, 'rb') as f:
+            held = b''
+            for line in f:
+                if offsets is not None and not line.endswith(b'\n'):
+                    held = line
+                    break
+                yield line.decode('utf-8', errors='replace').rstrip('\r\n')
+            if offsets is not None:
+                offsets[path] = f.tell() - len(held)
+
+
+def main():
+    """Command line interface"""
+    parser = argparse.ArgumentParser(description="Rotate and read archived vault logs")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    rotate = commands.add_parser('rotate', help="Archive old logs and apply retention")
+    rotate.add_argument('--archive-after', type=int, default=LOG_ARCHIVE_AFTER_DAYS,
+                        help=f"Days of plain logs to keep (default {LOG_ARCHIVE_AFTER_DAYS})")
+    rotate.add_argument('--retention', type=int, default=LOG_RETENTION_DAYS,
+                        help=f"Days of logs to keep at all (default {LOG_RETENTION_DAYS})")
+
+    cat = commands.add_parser('cat', help="Print a component's log lines, archived or not")
+    cat.add_argument('component', help="Log prefix, e.g. gmail or orchestrator")
+    cat.add_argument('--since', help="From this date or timestamp")
+    cat.add_argument('--until', help="Up to this date or timestamp")
+    cat.add_argument('--jsonl', action='store_true', help="Read the JSONL logs")
+
+    args = parser.parse_args()
+
+    if args.command == 'rotate':
+        rotate_logs(archive_after_days=args.archive_after, retention_days=args.retention,
+                    log=lambda message, level="INFO": print(message))
+        return
+
+    try:
+        for line in iter_log_lines(args.component, args.since, args.until,
+                                   'jsonl' if args.jsonl else 'md'):
+            print(line)
+    except BrokenPipeError:
+        sys.stderr.close()
+
+
+if __name__ == "__main__":
+    main()
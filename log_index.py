@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+Log Index - Incremental full-text index over the vault's Logs/ folder
+Tails every component log into a SQLite FTS5 index keyed by component,
+level, timestamp and Gmail message ID, and answers searches from it.
+
+Usage:
+    python log_index.py update
+    python log_index.py search "invoice" --component emails_sent --since 2026-02-01
+    python log_index.py search --message-id 18c8f0a2b3d4e5f6
+"""
+
+import os
+import re
+import sys
+import sqlite3
+import argparse
+from pathlib import Path
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+# Configuration
+VAULT_PATH = Path(os.getenv('VAULT_PATH', '.'))
+LOGS_DIR = VAULT_PATH / 'Logs'
+LOG_INDEX_PATH = Path(os.getenv('LOG_INDEX_PATH', VAULT_PATH / '.log_index.db'))
+
+# watchers_<date>.md repeats the component logs line for line
+SKIP_COMPONENTS = {'watchers'}
+
+# Logs/<component>_<date>.md, or Logs/<date>.md from the original file watcher
+LOG_NAME_RE = re.compile(r'^(?:(?P<component>.+)_)?(?P<date>\d{4}-\d{2}-\d{2})\.md$')
+
+# [2026-02-27 23:48:39] [INFO] message
+ENTRY_RE = re.compile(r'^\[(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})\] \[([A-Z]+)\] ?(.*)$')
+# [20:13:32] message (date taken from the file name)
+SHORT_ENTRY_RE = re.compile(r'^\[(\d{2}:\d{2}:\d{2})\] ?(.*)$')
+# ## Email Sent at 2026-02-27 23:48:39 (multi-line block in emails_sent logs)
+BLOCK_RE = re.compile(r'^## (.+?) at (\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})\s*$')
+
+# Gmail message IDs as they appear in log lines
+MESSAGE_ID_RE = re.compile(r'(?:message id|email)\**:?\**\s+([0-9a-f]{12,})\b', re.IGNORECASE)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    inode INTEGER,
+    offset INTEGER NOT NULL DEFAULT 0,
+    last_entry INTEGER
+);
+CREATE TABLE IF NOT EXISTS entries (
+    id INTEGER PRIMARY KEY,
+    file TEXT NOT NULL,
+    ts TEXT NOT NULL,
+    component TEXT NOT NULL,
+    level TEXT NOT NULL,
+    message_id TEXT,
+    message TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_ts ON entries(ts);
+CREATE INDEX IF NOT EXISTS entries_component_ts ON entries(component, ts);
+CREATE INDEX IF NOT EXISTS entries_message_id ON entries(message_id) WHERE message_id IS NOT NULL;
+CREATE INDEX IF NOT EXISTS entries_file ON entries(file);
+CREATE VIRTUAL TABLE IF NOT EXISTS entries_fts USING fts5(
+    message, content='entries', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS entries_ai AFTER INSERT ON entries BEGIN
+    INSERT INTO entries_fts(rowid, message) VALUES (new.id, new.message);
+END;
+CREATE TRIGGER IF NOT EXISTS entries_ad AFTER DELETE ON entries BEGIN
+    INSERT INTO entries_fts(entries_fts, rowid, message) VALUES ('delete', old.id, old.message);
+END;
+CREATE TRIGGER IF NOT EXISTS entries_au AFTER UPDATE OF message ON entries BEGIN
+    INSERT INTO entries_fts(entries_fts, rowid, message) VALUES ('delete', old.id, old.message);
+    INSERT INTO entries_fts(rowid, message) VALUES (new.id, new.message);
+END;
+"""
+
+
+def parse_log_name(name):
+    """
+    Split a log file name into (component, date)
+
+    Returns:
+        (component, 'YYYY-MM-DD') or None for files that are not daily logs
+    """
+    match = LOG_NAME_RE.match(name)
+    if not match:
+        return None
+    return match.group('component') or 'file_watcher', match.group('date')
+
+
+def parse_line(line, log_date):
+    """
+    Parse the start of a log entry
+
+    Args:
+        line: One line without its newline
+        log_date: Date from the file name, for entries without one
+
+    Returns:
+        (timestamp, level, message) or None for continuation lines
+    """
+    match = ENTRY_RE.match(line)
+    if match:
+        return match.group(1), match.group(2), match.group(3)
+
+    match = BLOCK_RE.match(line)
+    if match:
+        return match.group(2), 'INFO', match.group(1)
+
+    match = SHORT_ENTRY_RE.match(line)
+    if match:
+        return f"{log_date} {match.group(1)}", 'INFO', match.group(2)
+
+    return None
+
+
+def find_message_id(message):
+    """Gmail message ID mentioned in an entry, if any"""
+    match = MESSAGE_ID_RE.search(message)
+    return match.group(1) if match else None
+
+
+class LogIndexer:
+    """
+    Incremental FTS5 index over daily component logs
+
+    Each file's read offset is remembered, so update() only parses bytes
+    appended since the last run. Lines that do not start a new entry are
+    appended to the previous entry from the same file. Entries stay
+    searchable after their source file is rotated away.
+    """
+
+    def __init__(self, logs_dir=LOGS_DIR, db_path=LOG_INDEX_PATH):
+        """
+        Args:
+            logs_dir: Folder holding the daily logs
+            db_path: SQLite database for the index
+        """
+        self.logs_dir = Path(logs_dir)
+        self.db_path = Path(db_path)
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+    def update(self):
+        """
+        Index everything appended to Logs/ since the last update
+
+        Returns:
+            Number of new entries
+        """
+        added = 0
+        for path in sorted(self.logs_dir.glob('*.md')):
+            parsed = parse_log_name(path.name)
+            if parsed is None or parsed[0] in SKIP_COMPONENTS:
+                continue
+            with self.conn:
+                added += self._index_file(path, *parsed)
+        return added
+
+    def _index_file(self, path, component, log_date):
+        try:
+            st = path.stat()
+        except OSError:
+            return 0
+
+        key = str(path.resolve())
+        row = self.conn.execute(
+            "SELECT inode, offset, last_entry FROM files WHERE path = ?", (key,)).fetchone()
+        inode, offset, last_entry = row if row else (None, 0, None)
+
+        if inode is not None and (inode != st.st_ino or st.st_size < offset):
+            # Replaced or truncated: index the file again from the start
+            self.conn.execute("DELETE FROM entries WHERE file = ?", (key,))
+            offset, last_entry = 0, None
+
+        if st.st_size == offset:
+            return 0
+
+        with open(path, 'rb') as f:
+            f.seek(offset)
+            data = f.read(max(0, st.st_size - offset))
+
+        # Only complete lines; the rest is picked up next time
+        end = data.rfind(b'\n') + 1
+        added = 0
+        continuation = []
+
+        for raw in data[:end].splitlines():
+            line = raw.decode('utf-8', errors='replace').rstrip('\r')
+            if offset == 0 and not added and last_entry is None and line.startswith('# '):
+                continue  # daily file heading
+
+            entry = parse_line(line, log_date)
+            if entry is None:
+                if line.strip() and line.strip() != '---':
+                    continuation.append(line)
+                continue
+
+            last_entry = self._extend(last_entry, continuation)
+            continuation = []
+
+            ts, level, message = entry
+            cursor = self.conn.execute(
+                "INSERT INTO entries (file, ts, component, level, message_id, message) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, ts, component, level, find_message_id(message), message)
+            )
+            last_entry = cursor.lastrowid
+            added += 1
+
+        last_entry = self._extend(last_entry, continuation)
+
+        self.conn.execute(
+            "INSERT OR REPLACE INTO files (path, inode, offset, last_entry) VALUES (?, ?, ?, ?)",
+            (key, st.st_ino, offset + end, last_entry)
+        )
+        return added
+
+    def _extend(self, entry_id, lines):
+        """Append continuation lines to an entry"""
+        if entry_id is None or not lines:
+            return entry_id
+        message, message_id = self.conn.execute(
+            "SELECT message, message_id FROM entries WHERE id = ?", (entry_id,)).fetchone()
+        message = "\n".join([message] + lines)
+        self.conn.execute(
+            "UPDATE entries SET message = ?, message_id = ? WHERE id = ?",
+            (message, message_id or find_message_id(message), entry_id)
+        )
+        return entry_id
+
+    def search(self, query=None, component=None, level=None, since=None, until=None,
+               message_id=None, limit=50):
+        """
+        Find entries, newest first
+
+        Args:
+            query: FTS5 query over messages (words, "phrases", AND/OR/NOT, prefix*)
+            component: Component name (e.g. gmail, orchestrator, emails_sent)
+            level: Log level
+            since: Earliest timestamp or date (inclusive)
+            until: Latest timestamp or date (inclusive)
+            message_id: Gmail message ID
+            limit: Maximum number of results
+
+        Returns:
+            List of (timestamp, component, level, message) tuples
+        """
+        sql = "SELECT e.ts, e.component, e.level, e.message FROM entries e"
+        where, params = [], []
+
+        if query:
+            sql += " JOIN entries_fts ON entries_fts.rowid = e.id"
+            where.append("entries_fts MATCH ?")
+            params.append(query)
+        if component:
+            where.append("e.component = ?")
+            params.append(component)
+        if level:
+            where.append("e.level = ?")
+            params.append(level.upper())
+        if since:
+            where.append("e.ts >= ?")
+            params.append(since)
+        if until:
+            where.append("e.ts <= ?")
+            # A bare date covers the whole day
+            params.append(until + " 99" if len(until) == 10 else until)
+        if message_id:
+            where.append("e.message_id = ?")
+            params.append(message_id)
+
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY e.ts DESC, e.id DESC LIMIT ?"
+        params.append(limit)
+
+        return self.conn.execute(sql, params).fetchall()
+
+    def prune(self, before):
+        """
+        Drop entries older than a date or timestamp
+
+        Returns:
+            Number of entries removed
+        """
+        with self.conn:
+            return self.conn.execute("DELETE FROM entries WHERE ts < ?", (before,)).rowcount
+
+    def close(self):
+        self.conn.close()
+
+
+def main():
+    """Command line interface"""
+    parser = argparse.ArgumentParser(description="Index and search the vault's logs")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    commands.add_parser('update', help="Index new log entries")
+
+    search = commands.add_parser('search', help="Search indexed log entries")
+    search.add_argument('query', nargs='?', help="Full-text query")
+    search.add_argument('--component', '-c', help="Only this component (e.g. gmail)")
+    search.add_argument('--level', '-l', help="Only this level (e.g. ERROR)")
+    search.add_argument('--since', help="From this date or timestamp")
+    search.add_argument('--until', help="Up to this date or timestamp")
+    search.add_argument('--message-id', '-m', help="Gmail message ID")
+    search.add_argument('--limit', '-n', type=int, default=50, help="Maximum results (default 50)")
+    search.add_argument('--no-update', action='store_true', help="Skip indexing new entries first")
+
+    args = parser.parse_args()
+    indexer = LogIndexer()
+
+    try:
+        if args.command == 'update':
+            print(f"Indexed {indexer.update()} new log entries")
+            return
+
+        if not args.no_update:
+            indexer.update()
+
+        try:
+            results = indexer.search(
+                args.query, args.component, args.level, args.since, args.until,
+                args.message_id, args.limit
+            )
+        except sqlite3.OperationalError as e:
+            print(f"Invalid query: {e}")
+            sys.exit(1)
+
+        for ts, component, level, message in reversed(results):
+            print(f"[{ts}] [{component}] [{level}] {message}")
+        if not results:
+            print("No matching log entries")
+    finally:
+        indexer.close()
+
+
+if __name__ == "__main__":
+    main()
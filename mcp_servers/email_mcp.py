@@ -5,6 +5,7 @@ Integrates with Gmail API for actual email sending
 """
 
 import os
+import sys
 import json
 import time
 import base64
@@ -20,6 +21,14 @@ from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from dotenv import load_dotenv
 
+# Shared vault modules live in the vault root
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from vault_log import get_logger
+from vault_catalog import get_catalog
+from vault_write import write_file
+from done_archive import complete
+from vault_doc import parse_email_draft, MalformedDocument
+
 # Gmail API scopes - need send permission
 SCOPES = [
     'https://www.googleapis.com/auth/gmail.readonly',
@@ -51,112 +60,139 @@ LOGS_DIR.mkdir(exist_ok=True)
 MAX_RETRIES = 3
 RETRY_DELAY = 5  # seconds
 
+# Daily log: Logs/emails_sent_<date>.md
+logger = get_logger(LOGS_DIR, 'emails_sent', 'Email Activity Log')
+log_message = logger.log
 
-def log_message(message, level="INFO"):
-    """
-    Log a message to both console and daily log file
-
-    Args:
-        message: The message to log
-        level: Log level (INFO, WARNING, ERROR)
-    """
-    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    log_entry = f"[{timestamp}] [{level}] {message}"
-
-    # Print to console
-    print(log_entry)
-
-    # Write to daily log file
-    log_date = datetime.now().strftime('%Y-%m-%d')
-    log_file = LOGS_DIR / f"emails_sent_{log_date}.md"
 
-    try:
-        with open(log_file, 'a', encoding='utf-8') as f:
-            if not log_file.exists() or log_file.stat().st_size == 0:
-                f.write(f"# Email Activity Log - {log_date}\n\n")
-            f.write(f"{log_entry}\n")
-    except Exception as e:
-        print(f"[ERROR] Failed to write to log file: {e}")
-
-
-def authenticate_gmail():
+def load_credentials(token_path=None, credentials_path=None, log=None):
     """
-    Authenticate with Gmail API using OAuth 2.0
+    Load OAuth 2.0 credentials for Gmail, refreshing or re-authorizing as needed
     Requires send permissions
 
+    Args:
+        token_path: Saved token file (default: TOKEN_PATH)
+        credentials_path: OAuth client secrets (default: CREDENTIALS_PATH)
+        log: Logging function for the owning vault (default: this vault's)
+
     Returns:
-        Gmail API service object or None if failed
+        Valid Credentials object or None if failed
     """
+    log = log or log_message
+    token_path = Path(token_path or TOKEN_PATH)
+    credentials_path = Path(credentials_path or CREDENTIALS_PATH)
     creds = None
 
     # Check if we have a saved token
-    if TOKEN_PATH.exists():
+    if token_path.exists():
         try:
-            creds = Credentials.from_authorized_user_file(str(TOKEN_PATH), SCOPES)
-            log_message("Loaded existing credentials from token.json")
+            creds = Credentials.from_authorized_user_file(str(token_path), SCOPES)
+            log("Loaded existing credentials from token.json")
         except Exception as e:
-            log_message(f"Failed to load token: {e}", "WARNING")
+            log(f"Failed to load token: {e}", "WARNING")
 
     # If no valid credentials, authenticate
     if not creds or not creds.valid:
         if creds and creds.expired and creds.refresh_token:
             try:
-                log_message("Refreshing expired token...")
+                log("Refreshing expired token...")
                 creds.refresh(Request())
-                log_message("Token refreshed successfully")
+                log("Token refreshed successfully")
             except Exception as e:
-                log_message(f"Failed to refresh token: {e}", "ERROR")
+                log(f"Failed to refresh token: {e}", "ERROR")
                 creds = None
 
         if not creds:
             # First time authentication - requires browser
-            if not CREDENTIALS_PATH.exists():
-                log_message(f"ERROR: credentials.json not found at {CREDENTIALS_PATH}", "ERROR")
+            if not credentials_path.exists():
+                log(f"ERROR: credentials.json not found at {credentials_path}", "ERROR")
                 return None
 
-            log_message("Starting OAuth flow...")
-            log_message("NOTE: You'll need to grant SEND permissions this time", "WARNING")
+            log("Starting OAuth flow...")
+            log("NOTE: You'll need to grant SEND permissions this time", "WARNING")
             flow = InstalledAppFlow.from_client_secrets_file(
-                str(CREDENTIALS_PATH), SCOPES)
+                str(credentials_path), SCOPES)
 
             # Try to open browser, fallback to console if fails
             try:
-                log_message("Attempting to open browser for authorization...")
+                log("Attempting to open browser for authorization...")
                 creds = flow.run_local_server(port=0, open_browser=True)
-                log_message("Authorization successful!")
+                log("Authorization successful!")
             except Exception as e:
-                log_message(f"Browser opening failed: {e}", "WARNING")
-                log_message("=" * 70)
-                log_message("MANUAL AUTHORIZATION REQUIRED")
-                log_message("=" * 70)
-                log_message("Please follow these steps:")
-                log_message("1. Copy the URL that will appear below")
-                log_message("2. Open it in your browser (Windows/Mac)")
-                log_message("3. Login and authorize the app")
-                log_message("4. Grant SEND permissions when asked")
-                log_message("5. Copy the authorization code from browser")
-                log_message("6. Paste it back here when prompted")
-                log_message("=" * 70)
+                log(f"Browser opening failed: {e}", "WARNING")
+                log("=" * 70)
+                log("MANUAL AUTHORIZATION REQUIRED")
+                log("=" * 70)
+                log("Please follow these steps:")
+                log("1. Copy the URL that will appear below")
+                log("2. Open it in your browser (Windows/Mac)")
+                log("3. Login and authorize the app")
+                log("4. Grant SEND permissions when asked")
+                log("5. Copy the authorization code from browser")
+                log("6. Paste it back here when prompted")
+                log("=" * 70)
                 creds = flow.run_console()
-                log_message("Authorization successful!")
+                log("Authorization successful!")
 
-        # Save credentials for next run
-        try:
-            with open(TOKEN_PATH, 'w') as token:
-                token.write(creds.to_json())
-            log_message(f"Saved credentials to {TOKEN_PATH}")
-        except Exception as e:
-            log_message(f"Failed to save token: {e}", "WARNING")
+        save_credentials(creds, token_path, log)
+
+    return creds
 
-    # Build and return Gmail service
+
+def save_credentials(creds, token_path=None, log=None):
+    """
+    Save credentials to token.json for the next run
+
+    Args:
+        creds: Credentials object to persist
+        token_path: Token file to write (default: TOKEN_PATH)
+        log: Logging function for the owning vault (default: this vault's)
+    """
+    log = log or log_message
+    token_path = token_path or TOKEN_PATH
+    try:
+        # Atomic: a crash mid-write must not lose the refresh token
+        write_file(token_path, creds.to_json())
+        log(f"Saved credentials to {token_path}")
+    except Exception as e:
+        log(f"Failed to save token: {e}", "WARNING")
+
+
+def build_service(creds, log=None):
+    """
+    Build a Gmail API service object from credentials
+
+    Args:
+        creds: Valid Credentials object
+        log: Logging function for the owning vault (default: this vault's)
+
+    Returns:
+        Gmail API service object or None if failed
+    """
+    log = log or log_message
     try:
         service = build('gmail', 'v1', credentials=creds)
-        log_message("Gmail API service initialized successfully")
+        log("Gmail API service initialized successfully")
         return service
     except Exception as e:
-        log_message(f"Failed to build Gmail service: {e}", "ERROR")
+        log(f"Failed to build Gmail service: {e}", "ERROR")
+        return None
+
+
+def authenticate_gmail():
+    """
+    Authenticate with Gmail API using OAuth 2.0
+    Requires send permissions
+
+    Returns:
+        Gmail API service object or None if failed
+    """
+    creds = load_credentials()
+    if creds is None:
         return None
 
+    return build_service(creds)
+
 
 def draft_email(to, subject, body, cc=None, bcc=None):
     """
@@ -228,8 +264,8 @@ status: pending_approval
 """
 
         # Write draft file
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+        # The catalog is opened on first use, not when the server is imported
+        write_file(filepath, content, on_commit=get_catalog(log=log_message).record)
 
         log_message(f"Created email draft: {filename}")
         log_message(f"Recipient: {to_str}")
@@ -253,33 +289,11 @@ def parse_approved_email(filepath):
         Dictionary with email details or None if failed
     """
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
+        return parse_email_draft(filepath)._asdict()
 
-        # Extract metadata from frontmatter
-        import re
-
-        to_match = re.search(r'^to:\s*(.+)$', content, re.MULTILINE)
-        subject_match = re.search(r'^subject:\s*(.+)$', content, re.MULTILINE)
-        cc_match = re.search(r'^cc:\s*(.+)$', content, re.MULTILINE)
-        bcc_match = re.search(r'^bcc:\s*(.+)$', content, re.MULTILINE)
-
-        # Extract body (everything after "## Body" until "---")
-        body_match = re.search(r'## Body\s*\n(.*?)\n---', content, re.DOTALL)
-
-        if not to_match or not subject_match or not body_match:
-            log_message(f"Failed to parse email file: {filepath}", "ERROR")
-            return None
-
-        email_data = {
-            'to': to_match.group(1).strip(),
-            'subject': subject_match.group(1).strip(),
-            'body': body_match.group(1).strip(),
-            'cc': cc_match.group(1).strip() if cc_match else None,
-            'bcc': bcc_match.group(1).strip() if bcc_match else None
-        }
-
-        return email_data
+    except MalformedDocument as e:
+        log_message(f"Failed to parse email file: {e}", "ERROR")
+        return None
 
     except Exception as e:
         log_message(f"Error parsing approved email: {e}", "ERROR")
@@ -318,7 +332,8 @@ def create_message(to, subject, body, cc=None, bcc=None):
     return {'raw': raw_message}
 
 
-def send_email(to, subject, body, cc=None, bcc=None, service=None):
+def send_email(to, subject, body, cc=None, bcc=None, service=None, timeout=None, on_retry=None,
+               activity_log=None):
     """
     Send an email via Gmail API with retry logic
 
@@ -329,67 +344,82 @@ def send_email(to, subject, body, cc=None, bcc=None, service=None):
         cc: CC recipients (optional)
         bcc: BCC recipients (optional)
         service: Gmail API service (will authenticate if not provided)
+        timeout: Total seconds to spend on attempts and retry delays (optional)
+        on_retry: Called before each retry, e.g. to count retries (optional)
+        activity_log: VaultLogger for the sending vault (default: this vault's)
 
     Returns:
         True if sent successfully, False otherwise
     """
+    activity = activity_log or logger
+    deadline = None if timeout is None else time.monotonic() + timeout
+
     # Authenticate if service not provided
     if service is None:
         service = authenticate_gmail()
         if service is None:
-            log_message("Failed to authenticate with Gmail", "ERROR")
+            activity.log("Failed to authenticate with Gmail", "ERROR")
             return False
 
     # Create message
     try:
         message = create_message(to, subject, body, cc, bcc)
     except Exception as e:
-        log_message(f"Failed to create message: {e}", "ERROR")
+        activity.log(f"Failed to create message: {e}", "ERROR")
         return False
 
     # Attempt to send with retries
     for attempt in range(1, MAX_RETRIES + 1):
         try:
-            log_message(f"Sending email (attempt {attempt}/{MAX_RETRIES})...")
-            log_message(f"To: {to}")
-            log_message(f"Subject: {subject}")
+            activity.log(f"Sending email (attempt {attempt}/{MAX_RETRIES})...")
+            activity.log(f"To: {to}")
+            activity.log(f"Subject: {subject}")
 
             result = service.users().messages().send(
                 userId='me',
                 body=message
             ).execute()
 
-            log_message(f"Email sent successfully! Message ID: {result['id']}")
+            activity.log(f"Email sent successfully! Message ID: {result['id']}")
 
             # Log to sent emails file
-            log_sent_email(to, subject, body, cc, bcc, result['id'])
+            log_sent_email(to, subject, body, cc, bcc, result['id'], activity)
 
             return True
 
         except HttpError as e:
-            log_message(f"HTTP error sending email (attempt {attempt}): {e}", "ERROR")
+            activity.log(f"HTTP error sending email (attempt {attempt}): {e}", "ERROR")
 
-            if attempt < MAX_RETRIES:
-                log_message(f"Retrying in {RETRY_DELAY} seconds...", "WARNING")
+            if attempt < MAX_RETRIES and not _retry_would_overrun(deadline):
+                activity.log(f"Retrying in {RETRY_DELAY} seconds...", "WARNING")
+                if on_retry is not None:
+                    on_retry()
                 time.sleep(RETRY_DELAY)
             else:
-                log_message("Max retries reached. Email not sent.", "ERROR")
+                activity.log("Max retries reached. Email not sent.", "ERROR")
                 return False
 
         except Exception as e:
-            log_message(f"Unexpected error sending email (attempt {attempt}): {e}", "ERROR")
+            activity.log(f"Unexpected error sending email (attempt {attempt}): {e}", "ERROR")
 
-            if attempt < MAX_RETRIES:
-                log_message(f"Retrying in {RETRY_DELAY} seconds...", "WARNING")
+            if attempt < MAX_RETRIES and not _retry_would_overrun(deadline):
+                activity.log(f"Retrying in {RETRY_DELAY} seconds...", "WARNING")
+                if on_retry is not None:
+                    on_retry()
                 time.sleep(RETRY_DELAY)
             else:
-                log_message("Max retries reached. Email not sent.", "ERROR")
+                activity.log("Max retries reached. Email not sent.", "ERROR")
                 return False
 
     return False
 
 
-def log_sent_email(to, subject, body, cc, bcc, message_id):
+def _retry_would_overrun(deadline):
+    """Check whether sleeping RETRY_DELAY would pass the send deadline"""
+    return deadline is not None and time.monotonic() + RETRY_DELAY >= deadline
+
+
+def log_sent_email(to, subject, body, cc, bcc, message_id, activity_log=None):
     """
     Log a sent email to the daily log file
 
@@ -400,29 +430,21 @@ def log_sent_email(to, subject, body, cc, bcc, message_id):
         cc: CC recipients
         bcc: BCC recipients
         message_id: Gmail message ID
+        activity_log: VaultLogger to append to (default: this vault's)
     """
-    try:
-        log_date = datetime.now().strftime('%Y-%m-%d')
-        log_file = LOGS_DIR / f"emails_sent_{log_date}.md"
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-
-        with open(log_file, 'a', encoding='utf-8') as f:
-            if not log_file.exists() or log_file.stat().st_size == 0:
-                f.write(f"# Sent Emails Log - {log_date}\n\n")
-
-            f.write(f"## Email Sent at {timestamp}\n\n")
-            f.write(f"**To:** {to}\n")
-            if cc:
-                f.write(f"**CC:** {cc}\n")
-            if bcc:
-                f.write(f"**BCC:** {bcc}\n")
-            f.write(f"**Subject:** {subject}\n")
-            f.write(f"**Message ID:** {message_id}\n\n")
-            f.write(f"**Body:**\n```\n{body[:500]}{'...' if len(body) > 500 else ''}\n```\n\n")
-            f.write("---\n\n")
+    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
 
-    except Exception as e:
-        log_message(f"Failed to log sent email: {e}", "WARNING")
+    lines = [f"## Email Sent at {timestamp}\n\n", f"**To:** {to}\n"]
+    if cc:
+        lines.append(f"**CC:** {cc}\n")
+    if bcc:
+        lines.append(f"**BCC:** {bcc}\n")
+    lines.append(f"**Subject:** {subject}\n")
+    lines.append(f"**Message ID:** {message_id}\n\n")
+    lines.append(f"**Body:**\n```\n{body[:500]}{'...' if len(body) > 500 else ''}\n```\n\n")
+    lines.append("---\n\n")
+
+    (activity_log or logger).append(''.join(lines))
 
 
 def process_approved_emails():
@@ -472,10 +494,9 @@ def process_approved_emails():
         if success:
             sent_count += 1
 
-            # Move to Done/ folder
-            done_path = VAULT_PATH / 'Done' / filepath.name
+            # Move to today's Done/ shard
             try:
-                filepath.rename(done_path)
+                complete(filepath, log=log_message)
                 log_message(f"Moved {filepath.name} to Done/")
             except Exception as e:
                 log_message(f"Failed to move file to Done/: {e}", "WARNING")
@@ -1,19 +1,42 @@
 #!/usr/bin/env python3
 """
 AI Employee Orchestrator - Enhanced version with approval processing and scheduling
-Manages all watchers, processes approvals, and handles scheduled tasks
+Manages all watchers, processes approvals, and handles scheduled tasks.
+One process can serve several vaults (one per client, see VAULTS): each
+keeps its own folders, credentials, sessions and watchers, while approval
+execution and background jobs share worker pools scheduled fairly across
+vaults.
 """
 
 import os
 import sys
 import time
 import signal
+import asyncio
+import copy
 import subprocess
-import re
+from functools import partial
 from pathlib import Path
-from datetime import datetime, time as dt_time
-from threading import Thread, Event
-from dotenv import load_dotenv
+from datetime import datetime, timedelta, timezone, time as dt_time
+from threading import Lock, local
+from concurrent.futures import ThreadPoolExecutor
+from dotenv import load_dotenv, dotenv_values
+
+from vault_watch import DirectoryWatcher
+from approval_executor import ApprovalExecutor, channel_for
+from child_output import ChildOutputMultiplexer
+from supervisor import WatcherSupervisor
+from vault_index import VaultIndex, format_age
+from vault_log import get_logger
+from vault_catalog import get_catalog, VaultCatalog
+from vault_write import write_file
+from done_archive import complete, migrate as shard_done_items, pack_old_shards, completed_counts, format_counts
+from vault_doc import (parse_email_draft, parse_linkedin_approval,
+                       parse_whatsapp_approval, MalformedDocument)
+from log_index import LogIndexer, LOG_INDEX_PATH
+from log_archive import rotate_logs, LOG_RETENTION_DAYS
+from status_panel import StatusPanel, EventRate
+from vault_metrics import Registry, POLL_BUCKETS, METRICS_ENV, start_metrics_server
 
 # Load environment variables
 load_dotenv()
@@ -22,71 +45,301 @@ load_dotenv()
 VAULT_PATH = Path(os.getenv('VAULT_PATH', '.'))
 WATCHERS_DIR = VAULT_PATH / 'watchers'
 MCP_DIR = VAULT_PATH / 'mcp_servers'
-APPROVED_DIR = VAULT_PATH / 'Approved'
-DONE_DIR = VAULT_PATH / 'Done'
 LOGS_DIR = VAULT_PATH / 'Logs'
-NEEDS_ACTION_DIR = VAULT_PATH / 'Needs_Action'
-DASHBOARD_FILE = VAULT_PATH / 'Dashboard.md'
+
+# Vaults served by this process: comma-separated paths or name=path pairs.
+# Defaults to VAULT_PATH alone. Each vault may have its own .env (Gmail
+# token, sessions, VAULT_WATCHERS) that overrides this process's settings.
+VAULTS = os.getenv('VAULTS', '')
+
+# Watchers started per vault (VAULT_WATCHERS picks a subset)
+WATCHER_SCRIPTS = {
+    'file': ("File Watcher", WATCHERS_DIR / "file_watcher.py"),
+    'gmail': ("Gmail Watcher", WATCHERS_DIR / "gmail_watcher.py"),
+    'linkedin': ("LinkedIn Poster", WATCHERS_DIR / "linkedin_poster.py"),
+    'whatsapp': ("WhatsApp Watcher", WATCHERS_DIR / "whatsapp_watcher.py"),
+    'scheduler': ("Scheduler", VAULT_PATH / "scheduler.py"),
+}
+
+# Threads shared by every vault's background jobs (log rotation, Done/ upkeep)
+JOB_WORKERS = int(os.getenv('JOB_WORKERS', 2))
+
+# Approved/ watching (inotify with polling fallback)
+APPROVAL_POLL_INTERVAL = float(os.getenv('APPROVAL_POLL_INTERVAL', 30))
+APPROVAL_DEBOUNCE = float(os.getenv('APPROVAL_DEBOUNCE', 0.2))
+APPROVAL_RETRY_DELAY = float(os.getenv('APPROVAL_RETRY_DELAY', 30))
+
+# Refresh the Gmail token this many seconds before it expires
+GMAIL_REFRESH_MARGIN = float(os.getenv('GMAIL_REFRESH_MARGIN', 300))
+
+# Folders kept in the in-memory vault index
+INDEXED_FOLDERS = ['Needs_Action', 'Pending_Approval', 'Approved']
+
+# Prometheus /metrics on localhost (0 disables)
+METRICS_PORT = int(os.getenv('METRICS_PORT', 9108))
+
+# Refresh the Logs/ search index this often (0 disables)
+LOG_INDEX_INTERVAL = float(os.getenv('LOG_INDEX_INTERVAL', 300))
+
+# Status panel: refresh interval on a terminal and when headless
+STATUS_REFRESH = 1
+STATUS_INTERVAL = 30
+
+# email_mcp lives in mcp_servers/
+sys.path.append(str(MCP_DIR))
 
 # Ensure directories exist
-APPROVED_DIR.mkdir(exist_ok=True)
-DONE_DIR.mkdir(exist_ok=True)
 LOGS_DIR.mkdir(exist_ok=True)
 
-# Track running processes
-processes = []
-shutdown_event = Event()
-last_activity = datetime.now()
+# Shared state - only touched from the event loop thread
+event_loop = None
+vaults = []                # Vault objects served by this process
+vaults_by_approved = {}    # Approved/ folder -> Vault, for worker threads
+approval_executor = None
+job_pool = None
+status_changed = None
+event_rate = EventRate()   # indexed file changes and finished approvals
+
+# Metrics served at /metrics; callback metrics are read on the event loop
+metrics = Registry()
+approval_latency = metrics.histogram(
+    'ai_employee_approval_latency_seconds',
+    'Time from a file landing in Approved/ until it is done', ['vault', 'channel'])
+approval_retries = metrics.counter(
+    'ai_employee_approval_retries_total',
+    'Approved items that failed and were scheduled for a retry', ['vault', 'channel'])
+send_retries = metrics.counter(
+    'ai_employee_send_retries_total',
+    'Retried send attempts inside a single approval', ['vault', 'channel'])
+poll_duration = metrics.histogram(
+    'ai_employee_watcher_poll_duration_seconds',
+    'Duration of one watcher poll cycle', ['vault', 'watcher'], buckets=POLL_BUCKETS)
+
+# Daily log: Logs/orchestrator_<date>.md (process-wide messages go to VAULT_PATH)
+logger = get_logger(LOGS_DIR, 'orchestrator', 'Orchestrator Log')
+log_message = logger.log
+
+
+def seconds_until_expiry(expiry):
+    """Seconds from now until a google-auth expiry (naive UTC, or aware)"""
+    now = datetime.now(timezone.utc)
+    if expiry.tzinfo is None:
+        now = now.replace(tzinfo=None)
+    return (expiry - now).total_seconds()
+
+
+class GmailClient:
+    """
+    Long-lived Gmail API access for the send path
 
+    Credentials are loaded once and refreshed in the background shortly
+    before they expire. The googleapiclient transport is not thread-safe,
+    so each approval worker thread gets its own service built from the
+    shared credentials.
+    """
 
-def log_message(message, level="INFO"):
-    """Log a message with timestamp to console and file"""
-    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    log_entry = f"[{timestamp}] [{level}] {message}"
+    def __init__(self, token_path, credentials_path, log=log_message,
+                 refresh_margin=GMAIL_REFRESH_MARGIN):
+        """
+        Args:
+            token_path: The vault's saved Gmail token
+            credentials_path: The vault's OAuth client secrets
+            log: The owning vault's logging function taking (message, level);
+                 credential loading and saving log here too
+            refresh_margin: Seconds before expiry to refresh the token
+        """
+        self.token_path = token_path
+        self.credentials_path = credentials_path
+        self.log = log
+        self.refresh_margin = refresh_margin
+        self._creds = None
+        self._lock = Lock()
+        self._local = local()
+
+    def _credentials(self):
+        """Return shared credentials, loading them on first use"""
+        with self._lock:
+            if self._creds is None:
+                from email_mcp import load_credentials
+                self._creds = load_credentials(self.token_path, self.credentials_path, log=self.log)
+            return self._creds
+
+    def get_service(self):
+        """
+        Return a warm Gmail service for the calling thread
+
+        Returns:
+            Gmail API service object or None if authentication failed
+        """
+        creds = self._credentials()
+        if creds is None:
+            return None
 
-    # Print to console
-    print(log_entry)
+        if getattr(self._local, 'creds', None) is not creds:
+            from email_mcp import build_service
+            self._local.service = build_service(creds, log=self.log)
+            self._local.creds = creds
+
+        return self._local.service
+
+    def refresh(self):
+        """
+        Refresh the token if it is close to expiry
+
+        Returns:
+            Seconds until the next refresh check
+        """
+        creds = self._credentials()
+        if creds is None:
+            return APPROVAL_RETRY_DELAY
+
+        with self._lock:
+            if creds.expiry is None:
+                return 3600
+            remaining = seconds_until_expiry(creds.expiry)
+            if remaining > self.refresh_margin:
+                return remaining - self.refresh_margin
+
+        from google.auth.transport.requests import Request
+        from email_mcp import save_credentials
+
+        # The network round trip runs on a copy, outside the lock, so
+        # senders keep using the current token meanwhile
+        fresh = copy.copy(creds)
+        try:
+            fresh.refresh(Request())
+        except Exception as e:
+            self.log(f"Failed to refresh Gmail token: {e}", "ERROR")
+            return APPROVAL_RETRY_DELAY
 
-    # Write to daily log file
-    log_date = datetime.now().strftime('%Y-%m-%d')
-    log_file = LOGS_DIR / f"orchestrator_{log_date}.md"
+        with self._lock:
+            # Worker threads rebuild their service on next use
+            self._creds = fresh
+        save_credentials(fresh, self.token_path, log=self.log)
+        self.log("Gmail token refreshed")
 
-    try:
-        with open(log_file, 'a', encoding='utf-8') as f:
-            if not log_file.exists() or log_file.stat().st_size == 0:
-                f.write(f"# Orchestrator Log - {log_date}\n\n")
-            f.write(f"{log_entry}\n")
-    except Exception as e:
-        print(f"[ERROR] Failed to write to log file: {e}")
+        if fresh.expiry is None:
+            return 3600
+        return max(60.0, seconds_until_expiry(fresh.expiry) - self.refresh_margin)
 
 
-def signal_handler(sig, frame):
-    """Handle shutdown signals gracefully"""
-    log_message("\n" + "=" * 60)
-    log_message("Shutdown signal received - stopping all watchers...")
-    log_message("=" * 60)
+class Vault:
+    """
+    One client vault served by this orchestrator
+
+    Holds everything that must not be shared between clients: folders,
+    logs, catalog, Gmail credentials, watcher processes and the in-memory
+    index. Only the event loop thread touches the mutable state; approval
+    workers use the folders, logs, catalog and Gmail client.
+    """
+
+    def __init__(self, name, path, settings=None):
+        """
+        Args:
+            name: Short name used in logs, metrics and the status panel
+            path: Root of the vault
+            settings: The vault's own .env values (override os.environ)
+        """
+        self.name = name
+        self.path = Path(path)
+        self.settings = settings or {}
+        self.is_home = self.path.resolve() == VAULT_PATH.resolve()
+
+        self.approved_dir = self.path / 'Approved'
+        self.done_dir = self.path / 'Done'
+        self.logs_dir = LOGS_DIR if self.is_home else self.path / 'Logs'
+        self.plans_dir = self.path / 'Plans'
+        self.dashboard_file = self.path / 'Dashboard.md'
+        for folder in (self.approved_dir, self.done_dir, self.logs_dir):
+            folder.mkdir(exist_ok=True)
+
+        # Daily logs: <vault>/Logs/orchestrator_<date>.md and emails_sent_<date>.md
+        self.logger = get_logger(self.logs_dir, 'orchestrator', 'Orchestrator Log')
+        self.log = self.logger.log
+        self.email_log = get_logger(self.logs_dir, 'emails_sent', 'Email Activity Log')
+
+        # The home vault shares the catalog connection used by email_mcp
+        if self.is_home:
+            self.catalog = get_catalog(log=self.log)
+        else:
+            self.catalog = VaultCatalog(self.path, self.path / '.vault_catalog.db', log=self.log)
+        self.log_index_path = LOG_INDEX_PATH if self.is_home else self.path / '.log_index.db'
+
+        self.gmail = GmailClient(
+            self.path / self.setting('GMAIL_TOKEN_PATH', 'token.json'),
+            self.path / self.setting('GMAIL_CREDENTIALS_PATH', 'credentials.json'),
+            log=self.log
+        )
+        self.child_output = ChildOutputMultiplexer(
+            self.logs_dir, on_metric=partial(on_watcher_metric, self))
+
+        self.index = None
+        self.supervisor = None
+        self.approval_watcher = None
+        self.approval_wakeup = None
+        self.approved_at = {}      # filepath -> time the file landed in Approved/
+        self.last_activity = datetime.now()
 
-    shutdown_event.set()
+    def setting(self, key, default=None):
+        """A setting from the vault's .env, else the process environment"""
+        value = self.settings.get(key)
+        return value if value not in (None, '') else os.getenv(key, default)
 
-    for name, process in processes:
-        log_message(f"Stopping {name}...")
-        process.terminate()
+    def watchers(self):
+        """(name, script_path) of the watchers this vault runs"""
+        wanted = self.setting('VAULT_WATCHERS', ','.join(WATCHER_SCRIPTS))
+        return [WATCHER_SCRIPTS[key.strip()] for key in wanted.split(',')
+                if key.strip() in WATCHER_SCRIPTS]
+
+    def label(self, name):
+        """Display name, qualified by the vault when serving several"""
+        return name if len(vaults) <= 1 else f"{self.name}/{name}"
+
+
+def load_vaults():
+    """
+    Vaults named by VAULTS, or VAULT_PATH alone
+
+    A vault that cannot be set up (missing folder, unreadable .env) is
+    logged and skipped so the others still run.
+
+    Returns:
+        List of Vault objects
+    """
+    entries = [entry.strip() for entry in VAULTS.split(',') if entry.strip()]
+    if not entries:
+        return [Vault(VAULT_PATH.resolve().name, VAULT_PATH)]
+
+    result = []
+    for entry in entries:
+        name, _, path = entry.rpartition('=')
+        path = Path(path).expanduser()
         try:
-            process.wait(timeout=5)
-            log_message(f"{name} stopped")
-        except subprocess.TimeoutExpired:
-            log_message(f"Force killing {name}...", "WARNING")
-            process.kill()
+            env_file = path / '.env'
+            settings = dotenv_values(env_file) if env_file.exists() else {}
+            result.append(Vault(name or path.resolve().name, path, settings))
+        except Exception as e:
+            log_message(f"Skipping vault {name or path}: {e}", "ERROR")
+    return result
+
+
+def vault_for(filepath):
+    """Vault owning an approved file"""
+    return vaults_by_approved[filepath.parent]
 
-    log_message("All watchers stopped. Goodbye!")
-    sys.exit(0)
 
+def on_watcher_metric(vault, watcher, name, value):
+    """Record a sample reported by a supervised watcher"""
+    if name == 'poll_duration_seconds':
+        poll_duration.observe(value, vault=vault.name, watcher=watcher)
 
-def start_watcher(name, script_path):
+
+def start_watcher(vault, name, script_path):
     """
-    Start a watcher script as a subprocess
+    Start one of a vault's watcher scripts as a subprocess
 
     Args:
+        vault: Vault the watcher works on
         name: Display name for the watcher
         script_path: Path to the Python script
 
@@ -97,236 +350,300 @@ def start_watcher(name, script_path):
         venv_python = VAULT_PATH / 'venv' / 'bin' / 'python'
 
         if not venv_python.exists():
-            log_message(f"Virtual environment not found at {venv_python}", "ERROR")
+            vault.log(f"Virtual environment not found at {venv_python}", "ERROR")
             return None
 
         if not script_path.exists():
-            log_message(f"Script not found: {script_path}", "ERROR")
+            vault.log(f"Script not found: {script_path}", "ERROR")
             return None
 
-        log_message(f"Starting {name}...")
+        vault.log(f"Starting {name}...")
+
+        # Unbuffered so output reaches the multiplexer as it is printed;
+        # the metrics flag makes watchers report poll durations on stdout.
+        # The vault's own settings and path win over the orchestrator's.
+        env = dict(os.environ, **vault.settings)
+        env.update(VAULT_PATH=str(vault.path.resolve()), PYTHONUNBUFFERED='1', **{METRICS_ENV: '1'})
 
         process = subprocess.Popen(
-            [str(venv_python), str(script_path)],
+            [str(venv_python), str(script_path.resolve())],
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            text=True,
-            bufsize=1
+            env=env,
+            cwd=str(vault.path)
         )
+        vault.child_output.add(name, process)
 
-        log_message(f"{name} started (PID: {process.pid})")
+        vault.log(f"{name} started (PID: {process.pid})")
         return process
 
     except Exception as e:
-        log_message(f"Failed to start {name}: {e}", "ERROR")
+        vault.log(f"Failed to start {name}: {e}", "ERROR")
         return None
 
 
-def count_files_in_dir(directory):
-    """Count markdown files in a directory"""
-    try:
-        return len(list(directory.glob('*.md')))
-    except:
-        return 0
-
-
-def get_status_display():
-    """Generate status display string"""
-    global last_activity
-
-    # Count active processes
-    active_count = sum(1 for _, p in processes if p.poll() is None)
+def get_status_fields():
+    """Current status as (label, value) pairs for the status panel"""
+    supervised = [(vault, vault.supervisor) for vault in vaults if vault.supervisor]
+    watcher_states = [state for _, supervisor in supervised for state in supervisor.states]
+    active_count = sum(supervisor.active_count() for _, supervisor in supervised)
 
-    # Count pending items
-    tasks_pending = count_files_in_dir(NEEDS_ACTION_DIR)
-    approved_waiting = count_files_in_dir(APPROVED_DIR)
-
-    # Calculate time since last activity
-    time_diff = datetime.now() - last_activity
-    if time_diff.seconds < 60:
-        last_activity_str = f"{time_diff.seconds} seconds ago"
-    elif time_diff.seconds < 3600:
-        last_activity_str = f"{time_diff.seconds // 60} minutes ago"
+    if active_count == 0:
+        status = "🔴 Degraded"
+    elif active_count == len(watcher_states):
+        status = "🟢 Running"
     else:
-        last_activity_str = f"{time_diff.seconds // 3600} hours ago"
-
-    # Status emoji
-    status_emoji = "🟢" if active_count == len(processes) else "🟡"
-
-    status = f"""
-{'=' * 50}
-       AI EMPLOYEE ORCHESTRATOR
-{'=' * 50}
-Status: {status_emoji} {'Running' if active_count > 0 else 'Degraded'}
-Watchers Active: {active_count}/{len(processes)}
-Tasks Pending: {tasks_pending}
-Approved Waiting: {approved_waiting}
-Last Activity: {last_activity_str}
-
-Press Ctrl+C to stop
-{'=' * 50}
-"""
-    return status
+        status = "🟡 Running"
 
+    fields = [
+        ("Status", status),
+        ("Watchers Active", f"{active_count}/{len(watcher_states)}"),
+    ]
+    for vault, supervisor in supervised:
+        if len(vaults) > 1:
+            in_flight = approval_executor.in_flight(tenant=vault.name) if approval_executor else 0
+            fields.append((f"Vault {vault.name}",
+                           f"{vault.index.count('Needs_Action')} pending, "
+                           f"{vault.index.count('Pending_Approval')} awaiting approval, "
+                           f"{in_flight} in progress"))
+        for state in supervisor.states:
+            detail = state.status
+            if state.restarts:
+                detail += f" ({state.restarts} restarts)"
+            fields.append((f"  {vault.label(state.name)}", detail))
+
+    def total(method, *args):
+        return sum(getattr(vault.index, method)(*args) for vault in vaults if vault.index)
+
+    in_flight = approval_executor.in_flight() if approval_executor else 0
+    last_activity = max(vault.last_activity for vault in vaults)
+    fields += [
+        ("Tasks Pending", f"{total('count', 'Needs_Action')} "
+                          f"({total('priority_count', 'Needs_Action', 'high')} high priority)"),
+        ("Pending Approval", total('count', 'Pending_Approval')),
+        ("Approved Waiting", f"{total('count', 'Approved')} ({in_flight} in progress)"),
+        ("Last Activity", f"{format_age((datetime.now() - last_activity).total_seconds())} ago"),
+        ("Events/min", f"{event_rate.per_minute():.0f}"),
+    ]
+    return fields
 
-def process_approved_email(filepath):
-    """Process an approved email file"""
-    global last_activity
 
+def process_approved_email(filepath, deadline=None):
+    """Process an approved email file, giving up on retries after deadline"""
+    vault = vault_for(filepath)
     try:
-        log_message(f"Processing approved email: {filepath.name}")
+        vault.log(f"Processing approved email: {filepath.name}")
 
         # Import email_mcp functions
-        sys.path.append(str(MCP_DIR))
-        from email_mcp import parse_approved_email, send_email
+        from email_mcp import send_email
 
         # Parse email
-        email_data = parse_approved_email(filepath)
+        draft = parse_email_draft(filepath)
 
-        if email_data is None:
-            log_message(f"Failed to parse email: {filepath.name}", "ERROR")
+        service = vault.gmail.get_service()
+        if service is None:
+            vault.log("Gmail client not authenticated", "ERROR")
             return False
 
         # Send email
         success = send_email(
-            to=email_data['to'],
-            subject=email_data['subject'],
-            body=email_data['body'],
-            cc=email_data.get('cc'),
-            bcc=email_data.get('bcc')
+            to=draft.to,
+            subject=draft.subject,
+            body=draft.body,
+            cc=draft.cc,
+            bcc=draft.bcc,
+            service=service,
+            timeout=None if deadline is None else max(0.0, deadline - time.monotonic()),
+            on_retry=lambda: send_retries.inc(vault=vault.name, channel='email'),
+            activity_log=vault.email_log
         )
 
         if success:
-            # Move to Done
-            done_path = DONE_DIR / filepath.name
-            filepath.rename(done_path)
-            log_message(f"Email sent and moved to Done/")
-            last_activity = datetime.now()
+            # Move to today's Done/ shard
+            complete(filepath, done_dir=vault.done_dir, log=vault.log, catalog=vault.catalog)
+            vault.log(f"Email sent and moved to Done/")
             return True
         else:
-            log_message(f"Failed to send email", "ERROR")
+            vault.log(f"Failed to send email", "ERROR")
             return False
 
+    except MalformedDocument as e:
+        vault.log(f"Failed to parse email: {e}", "ERROR")
+        return False
+
     except Exception as e:
-        log_message(f"Error processing email: {e}", "ERROR")
+        vault.log(f"Error processing email: {e}", "ERROR")
         return False
 
 
-def process_approved_linkedin(filepath):
+def process_approved_linkedin(filepath, deadline=None):
     """Process an approved LinkedIn post file"""
-    global last_activity
-
+    vault = vault_for(filepath)
     try:
-        log_message(f"Processing approved LinkedIn post: {filepath.name}")
-
-        # Read the file content
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
+        vault.log(f"Processing approved LinkedIn post: {filepath.name}")
 
-        # Extract post content (after "## Content" until "---")
-        content_match = re.search(r'## Content\s*\n(.*?)\n---', content, re.DOTALL)
-
-        if not content_match:
-            log_message(f"Failed to parse LinkedIn post content", "ERROR")
-            return False
-
-        post_content = content_match.group(1).strip()
+        post_content = parse_linkedin_approval(filepath).content
 
         # TODO: Implement LinkedIn posting via Playwright
         # For now, just log and move to Done
-        log_message(f"LinkedIn post content: {post_content[:100]}...")
-        log_message("LinkedIn posting not yet implemented - marking as done", "WARNING")
+        vault.log(f"LinkedIn post content: {post_content[:100]}...")
+        vault.log("LinkedIn posting not yet implemented - marking as done", "WARNING")
 
-        # Move to Done
-        done_path = DONE_DIR / filepath.name
-        filepath.rename(done_path)
-        last_activity = datetime.now()
+        # Move to today's Done/ shard
+        complete(filepath, done_dir=vault.done_dir, log=vault.log, catalog=vault.catalog)
 
         return True
 
+    except MalformedDocument as e:
+        vault.log(f"Failed to parse LinkedIn post: {e}", "ERROR")
+        return False
+
     except Exception as e:
-        log_message(f"Error processing LinkedIn post: {e}", "ERROR")
+        vault.log(f"Error processing LinkedIn post: {e}", "ERROR")
         return False
 
 
-def process_approved_whatsapp(filepath):
+def process_approved_whatsapp(filepath, deadline=None):
     """Process an approved WhatsApp message file"""
-    global last_activity
-
+    vault = vault_for(filepath)
     try:
-        log_message(f"Processing approved WhatsApp message: {filepath.name}")
-
-        # Read the file content
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
+        vault.log(f"Processing approved WhatsApp message: {filepath.name}")
 
-        # Extract recipient and message
-        to_match = re.search(r'^to:\s*(.+)$', content, re.MULTILINE)
-        message_match = re.search(r'## Message\s*\n(.*?)\n---', content, re.DOTALL)
-
-        if not to_match or not message_match:
-            log_message(f"Failed to parse WhatsApp message", "ERROR")
-            return False
-
-        recipient = to_match.group(1).strip()
-        message = message_match.group(1).strip()
+        approval = parse_whatsapp_approval(filepath)
+        recipient, message = approval.to, approval.message
 
         # TODO: Implement WhatsApp sending via Playwright
         # For now, just log and move to Done
-        log_message(f"WhatsApp to {recipient}: {message[:100]}...")
-        log_message("WhatsApp sending not yet implemented - marking as done", "WARNING")
+        vault.log(f"WhatsApp to {recipient}: {message[:100]}...")
+        vault.log("WhatsApp sending not yet implemented - marking as done", "WARNING")
 
-        # Move to Done
-        done_path = DONE_DIR / filepath.name
-        filepath.rename(done_path)
-        last_activity = datetime.now()
+        # Move to today's Done/ shard
+        complete(filepath, done_dir=vault.done_dir, log=vault.log, catalog=vault.catalog)
 
         return True
 
+    except MalformedDocument as e:
+        vault.log(f"Failed to parse WhatsApp message: {e}", "ERROR")
+        return False
+
     except Exception as e:
-        log_message(f"Error processing WhatsApp message: {e}", "ERROR")
+        vault.log(f"Error processing WhatsApp message: {e}", "ERROR")
         return False
 
 
-def check_approved_folder():
-    """Check Approved/ folder and process files"""
+def on_approval_done(filepath, channel, success):
+    """Executor callback (worker thread): hand the result to the event loop"""
+    event_loop.call_soon_threadsafe(approval_finished, filepath, channel, success)
+
+
+def approval_finished(filepath, channel, success):
+    """Record a finished approval; failed items stay in Approved/ for a retry"""
+    vault = vault_for(filepath)
+
+    event_rate.record()
+    if success:
+        vault.last_activity = datetime.now()
+        started = vault.approved_at.pop(filepath, None)
+        if started is not None:
+            approval_latency.observe(max(0.0, time.time() - started), vault=vault.name, channel=channel)
+    elif filepath.exists():
+        approval_retries.inc(vault=vault.name, channel=channel)
+        vault.approval_watcher.retry(filepath, APPROVAL_RETRY_DELAY)
+        vault.approval_wakeup.set()
+    else:
+        vault.approved_at.pop(filepath, None)
+
+    status_changed.set()
+
+
+def create_approval_executor():
+    """Create the per-channel executor for approved items"""
+    return ApprovalExecutor(
+        handlers={
+            'email': process_approved_email,
+            'linkedin': process_approved_linkedin,
+            'whatsapp': process_approved_whatsapp,
+        },
+        on_done=on_approval_done,
+        log=log_message
+    )
+
+
+def check_approved_folder(vault, approved_files=None):
+    """
+    Queue a vault's approved files on the shared executor
+
+    Args:
+        vault: Vault whose Approved/ folder is checked
+        approved_files: Files to process (scans Approved/ when not given)
+    """
     try:
         # Get all files in Approved/
-        approved_files = list(APPROVED_DIR.glob('*.md'))
+        if approved_files is None:
+            approved_files = list(vault.approved_dir.glob('*.md'))
 
         if not approved_files:
             return
 
-        log_message(f"Found {len(approved_files)} approved item(s) to process")
+        vault.log(f"Found {len(approved_files)} approved item(s) to process")
 
         for filepath in approved_files:
-            filename = filepath.name
-
-            # Route based on filename prefix
-            if filename.startswith('EMAIL_'):
-                process_approved_email(filepath)
-            elif filename.startswith('LINKEDIN_'):
-                process_approved_linkedin(filepath)
-            elif filename.startswith('WHATSAPP_'):
-                process_approved_whatsapp(filepath)
-            else:
-                log_message(f"Unknown file type: {filename}", "WARNING")
+            if filepath not in vault.approved_at:
+                # Moving a file into Approved/ updates its ctime
+                try:
+                    vault.approved_at[filepath] = filepath.stat().st_ctime
+                except OSError:
+                    continue
+            if not approval_executor.submit(filepath, tenant=vault.name):
+                vault.approved_at.pop(filepath, None)
+                # Queue full: the watcher already counts the file as seen,
+                # so schedule it again rather than losing it
+                if channel_for(filepath.name) and filepath.exists():
+                    vault.approval_watcher.retry(filepath, APPROVAL_RETRY_DELAY)
 
     except Exception as e:
-        log_message(f"Error checking approved folder: {e}", "ERROR")
+        vault.log(f"Error checking approved folder: {e}", "ERROR")
 
 
-def update_dashboard():
-    """Update the Dashboard.md file with current status"""
-    global last_activity
+def vault_snapshot(vault):
+    """
+    Index counts and watcher states for the report jobs
 
+    Read on the event loop thread, which owns the index and the
+    supervisor, so the reports can be written from a worker thread.
+    """
+    states = vault.supervisor.states if vault.supervisor else []
+    return {
+        'tasks_pending': vault.index.count('Needs_Action'),
+        'high_priority': vault.index.priority_count('Needs_Action', 'high'),
+        'oldest_task': format_age(vault.index.oldest_age('Needs_Action')),
+        'pending_approval': vault.index.count('Pending_Approval'),
+        'approved_waiting': vault.index.count('Approved'),
+        'watchers': [(state.name, state.status, state.restarts, state.last_exit) for state in states],
+    }
+
+
+def update_dashboard(vault, snapshot):
+    """
+    Update a vault's Dashboard.md file with current status (runs in a worker thread)
+
+    Args:
+        vault: Vault to update
+        snapshot: Figures from vault_snapshot()
+    """
     try:
-        log_message("Updating dashboard...")
+        vault.log("Updating dashboard...")
 
         # Count items
-        tasks_pending = count_files_in_dir(NEEDS_ACTION_DIR)
-        approved_waiting = count_files_in_dir(APPROVED_DIR)
-        active_watchers = sum(1 for _, p in processes if p.poll() is None)
+        tasks_pending = snapshot['tasks_pending']
+        high_priority = snapshot['high_priority']
+        oldest_task = snapshot['oldest_task']
+        pending_approval = snapshot['pending_approval']
+        approved_waiting = snapshot['approved_waiting']
+        today = datetime.now().date()
+        completed_today = format_counts(completed_counts(today, today, vault.done_dir))
+        watcher_states = snapshot['watchers']
+        active_watchers = sum(1 for _, status, _, _ in watcher_states if status == 'running')
 
         # Generate dashboard content
         dashboard_content = f"""# AI Employee Dashboard
@@ -336,22 +653,32 @@ def update_dashboard():
 ## System Status
 
 - **Orchestrator:** 🟢 Running
-- **Active Watchers:** {active_watchers}/{len(processes)}
+- **Active Watchers:** {active_watchers}/{len(watcher_states)}
 - **Last Activity:** {datetime.now().strftime('%H:%M:%S')}
 
 ## Task Overview
 
-- **Needs Action:** {tasks_pending} task(s)
-- **Pending Approval:** {approved_waiting} item(s)
-- **Completed Today:** Check Done/ folder
+- **Needs Action:** {tasks_pending} task(s) ({high_priority} high priority, oldest {oldest_task})
+- **Pending Approval:** {pending_approval} item(s)
+- **Approved Waiting:** {approved_waiting} item(s)
+- **Completed Today:** {completed_today} in `Done/{today:%Y/%m/%d}/`
 
 ## Active Watchers
 
 """
 
-        for name, process in processes:
-            status = "🟢 Running" if process.poll() is None else "🔴 Stopped"
-            dashboard_content += f"- **{name}:** {status}\n"
+        status_labels = {
+            'running': "🟢 Running",
+            'restarting': "🟡 Restarting",
+            'quarantined': "🔴 Quarantined",
+            'stopped': "🔴 Stopped",
+        }
+        for name, status, restarts, last_exit in watcher_states:
+            dashboard_content += f"- **{name}:** {status_labels[status]}"
+            dashboard_content += f" (restarts: {restarts}"
+            if last_exit:
+                dashboard_content += f", last exit: {last_exit}"
+            dashboard_content += ")\n"
 
         dashboard_content += f"""
 ## Quick Actions
@@ -369,28 +696,27 @@ Check `Logs/orchestrator_{datetime.now().strftime('%Y-%m-%d')}.md` for details.
 """
 
         # Write dashboard
-        with open(DASHBOARD_FILE, 'w', encoding='utf-8') as f:
-            f.write(dashboard_content)
+        write_file(vault.dashboard_file, dashboard_content)
 
-        log_message("Dashboard updated successfully")
-        last_activity = datetime.now()
+        vault.log("Dashboard updated successfully")
+        vault.last_activity = datetime.now()
 
     except Exception as e:
-        log_message(f"Error updating dashboard: {e}", "ERROR")
-
+        vault.log(f"Error updating dashboard: {e}", "ERROR")
 
-def generate_daily_briefing():
-    """Generate daily briefing at 8am"""
-    global last_activity
 
+def generate_daily_briefing(vault, snapshot):
+    """Generate a vault's daily briefing at 8am (runs in a worker thread)"""
     try:
-        log_message("Generating daily briefing...")
+        vault.log("Generating daily briefing...")
 
         date_str = datetime.now().strftime('%Y-%m-%d')
-        briefing_file = VAULT_PATH / 'Plans' / f'Daily_Briefing_{date_str}.md'
+        briefing_file = vault.plans_dir / f'Daily_Briefing_{date_str}.md'
 
         # Count yesterday's activity
-        tasks_pending = count_files_in_dir(NEEDS_ACTION_DIR)
+        tasks_pending = snapshot['tasks_pending']
+        yesterday = datetime.now().date() - timedelta(days=1)
+        completed_yesterday = format_counts(completed_counts(yesterday, yesterday, vault.done_dir))
 
         briefing_content = f"""# Daily Briefing - {date_str}
 
@@ -402,6 +728,7 @@ Here's your daily briefing for {datetime.now().strftime('%A, %B %d, %Y')}
 
 - **Pending Tasks:** {tasks_pending}
 - **Location:** `Needs_Action/` folder
+- **Completed Yesterday:** {completed_yesterday} in `Done/{yesterday:%Y/%m/%d}/`
 
 ## System Status
 
@@ -426,25 +753,24 @@ Here's your daily briefing for {datetime.now().strftime('%A, %B %d, %Y')}
 *Generated automatically at 8:00 AM*
 """
 
-        with open(briefing_file, 'w', encoding='utf-8') as f:
-            f.write(briefing_content)
+        write_file(briefing_file, briefing_content, on_commit=vault.catalog.record)
 
-        log_message(f"Daily briefing created: {briefing_file.name}")
-        last_activity = datetime.now()
+        vault.log(f"Daily briefing created: {briefing_file.name}")
+        vault.last_activity = datetime.now()
 
     except Exception as e:
-        log_message(f"Error generating daily briefing: {e}", "ERROR")
+        vault.log(f"Error generating daily briefing: {e}", "ERROR")
 
 
-def generate_weekly_summary():
-    """Generate weekly summary on Sunday at 8pm"""
-    global last_activity
-
+def generate_weekly_summary(vault, snapshot):
+    """Generate a vault's weekly summary on Sunday at 8pm (runs in a worker thread)"""
     try:
-        log_message("Generating weekly summary...")
+        vault.log("Generating weekly summary...")
 
         date_str = datetime.now().strftime('%Y-%m-%d')
-        summary_file = VAULT_PATH / 'Plans' / f'Weekly_Summary_{date_str}.md'
+        week_start = datetime.now().date() - timedelta(days=6)
+        completed_week = format_counts(completed_counts(week_start, datetime.now().date(), vault.done_dir))
+        summary_file = vault.plans_dir / f'Weekly_Summary_{date_str}.md'
 
         summary_content = f"""# Weekly Summary - Week of {date_str}
 
@@ -461,7 +787,10 @@ This week's AI Employee activity summary.
 
 ## Statistics
 
-Check `Logs/` folder for detailed activity logs from this week.
+- **Items Completed:** {completed_week} since {week_start.isoformat()}
+
+Check `Logs/` folder for detailed activity logs from this week, or search them with
+`python log_index.py search "<words>" --since <date>`.
 
 ## Next Week
 
@@ -473,132 +802,415 @@ Check `Logs/` folder for detailed activity logs from this week.
 *Generated automatically every Sunday at 8:00 PM*
 """
 
-        with open(summary_file, 'w', encoding='utf-8') as f:
-            f.write(summary_content)
+        write_file(summary_file, summary_content, on_commit=vault.catalog.record)
 
-        log_message(f"Weekly summary created: {summary_file.name}")
-        last_activity = datetime.now()
+        vault.log(f"Weekly summary created: {summary_file.name}")
+        vault.last_activity = datetime.now()
 
     except Exception as e:
-        log_message(f"Error generating weekly summary: {e}", "ERROR")
+        vault.log(f"Error generating weekly summary: {e}", "ERROR")
 
 
-def scheduled_tasks_thread():
-    """Background thread for scheduled tasks"""
-    last_dashboard_update = datetime.now()
-    last_daily_briefing = None
-    last_weekly_summary = None
+def next_time(after, at, weekday=None):
+    """
+    Next datetime strictly after `after` at time-of-day `at`
 
-    while not shutdown_event.is_set():
-        try:
-            now = datetime.now()
+    Args:
+        after: Reference datetime
+        at: datetime.time of day
+        weekday: Optional weekday (Monday=0) the result must fall on
+    """
+    candidate = datetime.combine(after.date(), at)
+    while candidate <= after or (weekday is not None and candidate.weekday() != weekday):
+        candidate += timedelta(days=1)
+    return candidate
 
-            # Update dashboard every 4 hours
-            if (now - last_dashboard_update).seconds >= 14400:  # 4 hours
-                update_dashboard()
-                last_dashboard_update = now
 
-            # Daily briefing at 8am
-            if now.hour == 8 and now.minute == 0:
-                if last_daily_briefing != now.date():
-                    generate_daily_briefing()
-                    last_daily_briefing = now.date()
+def archive_logs(vault):
+    """Index, then archive and prune a vault's old logs (runs in a worker thread)"""
+    indexer = LogIndexer(vault.logs_dir, vault.log_index_path)
+    try:
+        # Index first so nothing is archived before it is searchable
+        indexer.update()
+        rotate_logs(vault.logs_dir, log=vault.log)
+        horizon = (datetime.now() - timedelta(days=LOG_RETENTION_DAYS)).strftime('%Y-%m-%d')
+        indexer.prune(horizon)
+    finally:
+        indexer.close()
 
-            # Weekly summary on Sunday at 8pm
-            if now.weekday() == 6 and now.hour == 20 and now.minute == 0:
-                if last_weekly_summary != now.date():
-                    generate_weekly_summary()
-                    last_weekly_summary = now.date()
 
-            # Sleep for 60 seconds before next check
-            shutdown_event.wait(60)
+async def run_log_rotation(vault):
+    await event_loop.run_in_executor(job_pool, archive_logs, vault)
 
-        except Exception as e:
-            log_message(f"Error in scheduled tasks: {e}", "ERROR")
-            shutdown_event.wait(60)
+
+def maintain_done(vault):
+    """Shard loose Done/ items, then pack old shards (runs in a worker thread)"""
+    # Loose items are ones moved into Done/ by hand
+    shard_done_items(vault.done_dir, vault.log, catalog=vault.catalog)
+    pack_old_shards(vault.done_dir, log=vault.log, catalog=vault.catalog)
+
+
+async def run_done_maintenance(vault):
+    await event_loop.run_in_executor(job_pool, maintain_done, vault)
+
+
+async def run_report(report, vault):
+    """Write a report on the job pool from figures read here on the loop"""
+    await event_loop.run_in_executor(job_pool, report, vault, vault_snapshot(vault))
+
+
+# (name, job, next run after a given datetime); jobs take the vault and
+# coroutine jobs are awaited
+SCHEDULED_JOBS = [
+    ("dashboard update", partial(run_report, update_dashboard), lambda now: now + timedelta(hours=4)),
+    ("daily briefing", partial(run_report, generate_daily_briefing), lambda now: next_time(now, dt_time(8, 0))),
+    ("weekly summary", partial(run_report, generate_weekly_summary),
+     lambda now: next_time(now, dt_time(20, 0), weekday=6)),
+    ("Done/ maintenance", run_done_maintenance, lambda now: next_time(now, dt_time(0, 15))),
+    ("log rotation", run_log_rotation, lambda now: next_time(now, dt_time(0, 30))),
+]
+
+
+async def wait_event(event, timeout=None):
+    """Wait for an asyncio.Event with an optional timeout; True if it was set"""
+    try:
+        # Unlike wait_for(), timeout() never drops a cancellation that
+        # arrives just as the event is set, which could hang shutdown
+        async with asyncio.timeout(timeout):
+            await event.wait()
+        return True
+    except TimeoutError:
+        return False
+
+
+def seconds_until(deadline):
+    """Seconds from now until a time.monotonic() deadline (None stays None)"""
+    return None if deadline is None else max(0.0, deadline - time.monotonic())
+
+
+def add_watch_readers(watchers, wakeup):
+    """Have inotify-backed watchers set `wakeup` when events arrive"""
+    fds = [watcher.fileno() for watcher in watchers if watcher.using_inotify]
+    for fd in fds:
+        event_loop.add_reader(fd, wakeup.set)
+    return fds
 
 
-def approval_monitor_thread():
-    """Background thread for monitoring Approved/ folder"""
-    while not shutdown_event.is_set():
+def remove_watch_readers(fds):
+    for fd in fds:
+        event_loop.remove_reader(fd)
+
+
+async def run_job(name, job, vault):
+    """Run one scheduled job for one vault, logging its errors there"""
+    try:
+        result = job(vault)
+        if asyncio.iscoroutine(result):
+            await result
+    except Exception as e:
+        vault.log(f"Error in scheduled {name}: {e}", "ERROR")
+
+
+async def run_scheduled_jobs():
+    """Run each scheduled job for every vault exactly at its next deadline"""
+    now = datetime.now()
+    next_runs = [schedule(now) for _, _, schedule in SCHEDULED_JOBS]
+    rounds = 0
+
+    while True:
+        # Cap the sleep so wall clock changes are picked up within the hour
+        delay = (min(next_runs) - datetime.now()).total_seconds()
+        await asyncio.sleep(min(max(0.0, delay), 3600))
+
+        now = datetime.now()
+        for i, (name, job, schedule) in enumerate(SCHEDULED_JOBS):
+            if now < next_runs[i]:
+                continue
+            # Rotate the starting vault so none is always served last;
+            # thread-bound jobs queue on the shared job pool
+            start = rounds % len(vaults)
+            rounds += 1
+            await asyncio.gather(*(run_job(name, job, vault)
+                                   for vault in vaults[start:] + vaults[:start]))
+            next_runs[i] = schedule(now)
+            status_changed.set()
+
+
+async def refresh_gmail_token(vault):
+    """Keep a vault's Gmail token fresh ahead of its expiry"""
+    while True:
         try:
-            check_approved_folder()
-            shutdown_event.wait(30)  # Check every 30 seconds
+            delay = await asyncio.to_thread(vault.gmail.refresh)
         except Exception as e:
-            log_message(f"Error in approval monitor: {e}", "ERROR")
-            shutdown_event.wait(30)
-
-
-def monitor_processes():
-    """Monitor running processes and restart if they crash"""
-    watchers = [
-        ("File Watcher", WATCHERS_DIR / "file_watcher.py"),
-        ("Gmail Watcher", WATCHERS_DIR / "gmail_watcher.py"),
-        ("LinkedIn Poster", WATCHERS_DIR / "linkedin_poster.py"),
-        ("WhatsApp Watcher", WATCHERS_DIR / "whatsapp_watcher.py"),
-        ("Scheduler", VAULT_PATH / "scheduler.py"),
-    ]
+            vault.log(f"Gmail client error: {e}", "ERROR")
+            delay = APPROVAL_RETRY_DELAY
+        await asyncio.sleep(delay)
+
+
+async def monitor_approvals(vault):
+    """React to files landing in a vault's Approved/"""
+    vault.approval_wakeup = asyncio.Event()
+    vault.approval_watcher = DirectoryWatcher(
+        vault.approved_dir,
+        pattern='*.md',
+        debounce=APPROVAL_DEBOUNCE,
+        poll_interval=APPROVAL_POLL_INTERVAL
+    )
+    vault.log(f"Watching Approved/ ({vault.approval_watcher.mode})")
+
+    fds = add_watch_readers([vault.approval_watcher], vault.approval_wakeup)
+    try:
+        while True:
+            await wait_event(vault.approval_wakeup, vault.approval_watcher.next_timeout())
+            vault.approval_wakeup.clear()
+
+            try:
+                vault.approval_watcher.read_events()
+                ready = vault.approval_watcher.collect_ready()
+                if ready:
+                    check_approved_folder(vault, ready)
+                    status_changed.set()
+            except Exception as e:
+                vault.log(f"Error in approval monitor: {e}", "ERROR")
+                await asyncio.sleep(APPROVAL_RETRY_DELAY)
+    finally:
+        remove_watch_readers(fds)
+        vault.approval_watcher.close()
+
+
+def mirror_to_catalog(vault, folder, path, present):
+    """Carry indexed file changes (including moves made by hand) into the catalog"""
+    if present:
+        vault.catalog.record(path)
+    else:
+        vault.catalog.forget(path, folder)
 
-    # Start all watchers
-    for name, script_path in watchers:
-        if script_path.exists():
-            process = start_watcher(name, script_path)
-            if process:
-                processes.append((name, process))
-        else:
-            log_message(f"Skipping {name} - script not found", "WARNING")
 
-    if not processes:
-        log_message("No watchers started successfully", "ERROR")
-        return
+async def maintain_index(vault):
+    """Apply filesystem events to a vault's in-memory index"""
+    wakeup = asyncio.Event()
+    fds = add_watch_readers(vault.index.watchers(), wakeup)
+
+    try:
+        while True:
+            await wait_event(wakeup, vault.index.next_timeout())
+            wakeup.clear()
 
-    # Start background threads
-    log_message("Starting scheduled tasks thread...")
-    scheduled_thread = Thread(target=scheduled_tasks_thread, daemon=True)
-    scheduled_thread.start()
+            try:
+                changes = vault.index.sync()
+                if changes:
+                    event_rate.record(changes)
+                    status_changed.set()
+            except Exception as e:
+                vault.log(f"Error updating vault index: {e}", "ERROR")
+    finally:
+        remove_watch_readers(fds)
+        vault.index.close()
 
-    log_message("Starting approval monitor thread...")
-    approval_thread = Thread(target=approval_monitor_thread, daemon=True)
-    approval_thread.start()
 
-    # Initial dashboard update
-    update_dashboard()
+def supervisors():
+    return [vault.supervisor for vault in vaults if vault.supervisor]
 
-    # Display initial status
-    print(get_status_display())
 
-    # Monitor loop
-    status_update_counter = 0
+async def supervise_watchers():
+    """Restart watchers as soon as SIGCHLD arrives or a backoff expires"""
+    child_exited = asyncio.Event()
+    event_loop.add_signal_handler(signal.SIGCHLD, child_exited.set)
 
-    while not shutdown_event.is_set():
-        time.sleep(10)  # Check every 10 seconds
+    try:
+        while True:
+            deadlines = [d for d in (s.next_deadline() for s in supervisors()) if d is not None]
+            await wait_event(child_exited, seconds_until(min(deadlines, default=None)))
+            child_exited.clear()
+            for supervisor in supervisors():
+                supervisor.reap()
+            status_changed.set()
+    finally:
+        event_loop.remove_signal_handler(signal.SIGCHLD)
+
+
+async def index_logs():
+    """Keep every vault's Logs/ full-text index current in a worker thread"""
+    indexers = [(vault, LogIndexer(vault.logs_dir, vault.log_index_path)) for vault in vaults]
+    # The connections are left open on cancellation; an update may still be running
+    while True:
+        for vault, indexer in indexers:
+            try:
+                added = await asyncio.to_thread(indexer.update)
+                if added:
+                    vault.log(f"Indexed {added} new log entries", "DEBUG")
+            except Exception as e:
+                vault.log(f"Error indexing logs: {e}", "ERROR")
+        await asyncio.sleep(LOG_INDEX_INTERVAL)
+
+
+async def render_status():
+    """Keep the status panel current, rewriting only fields that changed"""
+    panel = StatusPanel(
+        "AI EMPLOYEE ORCHESTRATOR",
+        volatile=("Last Activity", "Events/min"),
+        log=log_message
+    )
+    interval = STATUS_INTERVAL if panel.headless else STATUS_REFRESH
 
-        # Update status display every 30 seconds
-        status_update_counter += 1
-        if status_update_counter >= 3:
-            os.system('clear' if os.name == 'posix' else 'cls')
-            print(get_status_display())
-            status_update_counter = 0
+    try:
+        while True:
+            await wait_event(status_changed, interval)
+            status_changed.clear()
+            panel.render(get_status_fields())
+            await asyncio.sleep(STATUS_REFRESH)
+    finally:
+        panel.close()
+
+
+def watcher_states():
+    """(vault, watcher state) for every supervised watcher"""
+    return [(vault, state) for vault in vaults if vault.supervisor
+            for state in vault.supervisor.states]
+
+
+def register_state_metrics():
+    """Metrics read from orchestrator state at scrape time"""
+    metrics.gauge(
+        'ai_employee_folder_queue_depth',
+        'Task files waiting in a vault folder', ['vault', 'folder'],
+        callback=lambda: {(vault.name, name): vault.index.count(name)
+                          for vault in vaults for name in INDEXED_FOLDERS})
+    metrics.gauge(
+        'ai_employee_folder_oldest_age_seconds',
+        'Age of the oldest task file in a vault folder', ['vault', 'folder'],
+        callback=lambda: {(vault.name, name): vault.index.oldest_age(name) or 0
+                          for vault in vaults for name in INDEXED_FOLDERS})
+    metrics.gauge(
+        'ai_employee_approvals_in_flight',
+        'Approved items queued or running per channel', ['vault', 'channel'],
+        callback=lambda: {(vault.name, channel): approval_executor.in_flight(channel, vault.name)
+                          for vault in vaults for channel in ('email', 'linkedin', 'whatsapp')})
+    metrics.counter(
+        'ai_employee_watcher_restarts_total',
+        'Watcher restarts by the supervisor', ['vault', 'watcher'],
+        callback=lambda: {(vault.name, state.name): state.restarts
+                          for vault, state in watcher_states()})
+    metrics.gauge(
+        'ai_employee_watcher_up',
+        'Whether a watcher process is running', ['vault', 'watcher'],
+        callback=lambda: {(vault.name, state.name): int(state.running)
+                          for vault, state in watcher_states()})
+
+
+def open_vault(vault):
+    """Bring a vault's Done/ shards, catalog and index up to date (runs in a worker thread)"""
+    shard_done_items(vault.done_dir, vault.log, catalog=vault.catalog)
+    written, removed = vault.catalog.rebuild()
+    if written or removed:
+        vault.log(f"Catalog rebuilt: {written} item(s) written, {removed} removed")
+    vault.index = VaultIndex(vault.path, INDEXED_FOLDERS, poll_interval=APPROVAL_POLL_INTERVAL)
+    vault.index.on_change = partial(mirror_to_catalog, vault)
+
+
+def stop_vaults():
+    for vault in vaults:
+        if vault.supervisor:
+            vault.supervisor.stop_all()
+        vault.child_output.stop()
+
+
+async def run_orchestrator():
+    """Start watchers and run every orchestrator task on one event loop"""
+    global event_loop, approval_executor, job_pool, status_changed
+
+    event_loop = asyncio.get_running_loop()
+    status_changed = asyncio.Event()
+    job_pool = ThreadPoolExecutor(max_workers=max(1, JOB_WORKERS), thread_name_prefix="vault-job")
+
+    # Opening walks every vault folder; keep it off the loop, vaults in
+    # parallel. A vault that fails to open is dropped, not the whole run.
+    results = await asyncio.gather(
+        *(event_loop.run_in_executor(job_pool, open_vault, vault) for vault in vaults),
+        return_exceptions=True)
+    for vault, result in zip(list(vaults), results):
+        if isinstance(result, Exception):
+            vault.log(f"Could not open vault: {result}", "ERROR")
+            log_message(f"Skipping vault {vault.name}: {result}", "ERROR")
+            vaults.remove(vault)
+        else:
+            vaults_by_approved[vault.approved_dir] = vault
+    if not vaults:
+        log_message("No vault could be opened", "ERROR")
+        job_pool.shutdown(wait=False)
+        return
 
-        # Check process health
-        for i, (name, process) in enumerate(processes):
-            if process.poll() is not None:
-                log_message(f"{name} stopped unexpectedly!", "WARNING")
-                log_message(f"{name} exit code: {process.returncode}", "WARNING")
+    stop = asyncio.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        event_loop.add_signal_handler(sig, stop.set)
+
+    # Start each vault's watchers, draining their output into
+    # <vault>/Logs/watchers_<date>.md
+    started = False
+    for vault in vaults:
+        vault.child_output.start(event_loop)
+        vault.supervisor = WatcherSupervisor(
+            [(vault.label(name), script) for name, script in vault.watchers()],
+            partial(start_watcher, vault), log=vault.log)
+        started = vault.supervisor.start_all() or started
+
+    if not started:
+        log_message("No watchers started successfully", "ERROR")
+        stop_vaults()
+        for vault in vaults:
+            vault.index.close()
+        job_pool.shutdown(wait=False)
+        return
 
-                # Try to restart
-                log_message(f"Attempting to restart {name}...", "WARNING")
-                script_path = None
-                for watcher_name, watcher_path in watchers:
-                    if watcher_name == name:
-                        script_path = watcher_path
-                        break
+    approval_executor = create_approval_executor()
+    log_message(f"Approval workers: {approval_executor.describe()}")
 
-                if script_path:
-                    new_process = start_watcher(name, script_path)
-                    if new_process:
-                        processes[i] = (name, new_process)
-                        log_message(f"{name} restarted successfully")
+    metrics_server = None
+    if METRICS_PORT:
+        register_state_metrics()
+        try:
+            metrics_server = await start_metrics_server(metrics, METRICS_PORT)
+            log_message(f"Metrics at http://127.0.0.1:{METRICS_PORT}/metrics")
+        except OSError as e:
+            log_message(f"Metrics endpoint disabled: {e}", "WARNING")
+
+    tasks = [
+        asyncio.create_task(supervise_watchers(), name="supervisor"),
+        asyncio.create_task(run_scheduled_jobs(), name="scheduler"),
+        asyncio.create_task(render_status(), name="status"),
+    ]
+    for vault in vaults:
+        tasks += [
+            asyncio.create_task(monitor_approvals(vault), name=f"approvals-{vault.name}"),
+            asyncio.create_task(maintain_index(vault), name=f"index-{vault.name}"),
+            asyncio.create_task(refresh_gmail_token(vault), name=f"gmail-{vault.name}"),
+        ]
+    if LOG_INDEX_INTERVAL:
+        tasks.append(asyncio.create_task(index_logs(), name="log-index"))
+
+    # Initial dashboard updates and status display
+    await asyncio.gather(*(run_job("dashboard update", partial(run_report, update_dashboard), vault)
+                           for vault in vaults))
+    status_changed.set()
+
+    try:
+        await stop.wait()
+    finally:
+        log_message("=" * 60)
+        log_message("Shutdown signal received - stopping all watchers...")
+        log_message("=" * 60)
+
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        if metrics_server is not None:
+            metrics_server.close()
+        approval_executor.shutdown(wait=False)
+        job_pool.shutdown(wait=False)
+        stop_vaults()
+
+        log_message("All watchers stopped. Goodbye!")
 
 
 def main():
@@ -606,11 +1218,17 @@ def main():
     log_message("=" * 60)
     log_message("AI EMPLOYEE ORCHESTRATOR - ENHANCED VERSION")
     log_message(f"Vault Path: {VAULT_PATH}")
-    log_message("=" * 60)
 
-    # Register signal handlers
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    try:
+        vaults.extend(load_vaults())
+    except (OSError, KeyError) as e:
+        log_message(f"ERROR: Could not load vaults: {e}", "ERROR")
+        return
+    if len(vaults) > 1:
+        for vault in vaults:
+            log_message(f"Vault {vault.name}: {vault.path} "
+                        f"({', '.join(name for name, _ in vault.watchers()) or 'no watchers'})")
+    log_message("=" * 60)
 
     # Check virtual environment
     venv_python = VAULT_PATH / 'venv' / 'bin' / 'python'
@@ -624,12 +1242,11 @@ def main():
         log_message("ERROR: watchers/ directory not found!", "ERROR")
         return
 
-    # Start monitoring
+    # Run the event loop until SIGINT/SIGTERM
     try:
-        monitor_processes()
+        asyncio.run(run_orchestrator())
     except Exception as e:
         log_message(f"Orchestrator error: {e}", "ERROR")
-        signal_handler(None, None)
 
 
 if __name__ == "__main__":
@@ -6,7 +6,8 @@ Move files from Pending_Approval to Approved with preview
 
 import sys
 from pathlib import Path
-from datetime import datetime
+
+from vault_catalog import get_catalog
 
 # Configuration
 VAULT_PATH = Path.cwd()
@@ -80,13 +81,13 @@ def approve_file(filename):
 
     # Move file
     try:
-        pending_file.rename(approved_file)
+        get_catalog().move(pending_file, approved_file)
         print_color(f"\n✅ Approved: {filename}", GREEN)
         print(f"File moved to: Approved/")
-        print("Will be processed within 30 seconds by orchestrator")
+        print("Will be processed by the orchestrator within seconds")
         print()
         print("Monitor execution:")
-        print(f"  tail -f Logs/orchestrator_{datetime.now().strftime('%Y-%m-%d')}.md")
+        print(f"  python vault_tail.py -f -x {Path(filename).stem}")
         return True
     except Exception as e:
         print_color(f"Error moving file: {e}", RED)
@@ -11,6 +11,11 @@ from pathlib import Path
 import schedule
 from dotenv import load_dotenv
 
+from vault_index import VaultIndex
+from vault_log import get_logger
+from vault_catalog import get_catalog
+from vault_write import write_file
+
 # Load environment variables
 load_dotenv()
 
@@ -29,26 +34,15 @@ LOGS_DIR.mkdir(exist_ok=True)
 # Track last execution to prevent duplicates
 last_executions = {}
 
+# Event-fed index of Pending_Approval/ (created in run_scheduler)
+pending_index = None
 
-def log_message(message, level="INFO"):
-    """Log a message with timestamp to console and file"""
-    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    log_entry = f"[{timestamp}] [{level}] {message}"
-
-    # Print to console
-    print(log_entry)
+# Daily log: Logs/scheduler_<date>.md
+logger = get_logger(LOGS_DIR, 'scheduler', 'Scheduler Log')
+log_message = logger.log
 
-    # Write to daily log file
-    log_date = datetime.now().strftime('%Y-%m-%d')
-    log_file = LOGS_DIR / f"scheduler_{log_date}.md"
-
-    try:
-        with open(log_file, 'a', encoding='utf-8') as f:
-            if not log_file.exists() or log_file.stat().st_size == 0:
-                f.write(f"# Scheduler Log - {log_date}\n\n")
-            f.write(f"{log_entry}\n")
-    except Exception as e:
-        print(f"[ERROR] Failed to write to log file: {e}")
+# Item catalog: pending-task checks are index lookups, not folder globs
+catalog = get_catalog(log=log_message)
 
 
 def check_task_pending(task_name):
@@ -62,8 +56,7 @@ def check_task_pending(task_name):
         True if task is still pending, False otherwise
     """
     # Check Needs_Action for pending tasks
-    pattern = f"SCHEDULED_{task_name}_*.md"
-    pending_files = list(NEEDS_ACTION_DIR.glob(pattern))
+    pending_files = catalog.find('Needs_Action', f"SCHEDULED_{task_name}_")
 
     if pending_files:
         log_message(f"Previous {task_name} task still pending, skipping", "WARNING")
@@ -134,8 +127,7 @@ When complete:
 """
 
         # Write task file
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+        write_file(filepath, content, on_commit=catalog.record)
 
         log_message(f"Created scheduled task: {filename}")
 
@@ -184,7 +176,7 @@ def schedule_daily_briefing():
 
 Include:
 1. **Tasks Completed Yesterday**
-   - Review Done/ folder for yesterday's date
+   - Review Done/YYYY/MM/DD/ for yesterday's date (`python done_archive.py list`)
    - Summarize key accomplishments
    - Count emails sent, posts made, etc.
 
@@ -241,6 +233,7 @@ Include:
 
 3. **Statistics**
    - Review all logs from the past 7 days
+     (`python log_index.py search "<words>" --since <date>` searches them)
    - Count activities by type
    - Calculate success rates
 
@@ -275,7 +268,8 @@ def schedule_approval_reminder():
     log_message("Checking pending approvals")
 
     # Count pending approvals
-    pending_count = len(list(PENDING_APPROVAL_DIR.glob('*.md')))
+    pending_index.sync(settle=False)
+    pending_count = pending_index.count('Pending_Approval')
 
     if pending_count == 0:
         log_message("No pending approvals")
@@ -326,8 +320,7 @@ Please review within the next hour if possible.
     filepath = NEEDS_ACTION_DIR / filename
 
     try:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(f"""---
+        write_file(filepath, f"""---
 type: reminder
 task: pending_approvals
 created: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
@@ -338,7 +331,7 @@ priority: high
 # Reminder: Pending Approvals
 
 {instructions}
-""")
+""", on_commit=catalog.record)
 
         log_message(f"Created approval reminder: {filename}")
 
@@ -375,8 +368,15 @@ def setup_schedule():
 
 def run_scheduler():
     """Main scheduler loop"""
+    global pending_index
+
     log_message("Scheduler starting...")
 
+    pending_index = VaultIndex(VAULT_PATH, ['Pending_Approval'])
+
+    # Pending-task checks read the catalog; make sure it matches Needs_Action/
+    catalog.rebuild(folders=['Needs_Action'])
+
     # Setup all scheduled tasks
     setup_schedule()
 
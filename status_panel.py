@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Status Panel - In-place terminal status for the orchestrator
+Pins the status box to the top of the terminal with ANSI escapes and
+rewrites only the lines whose values changed; log output keeps scrolling
+underneath. Falls back to logging compact status lines when headless.
+"""
+
+import os
+import sys
+import time
+import shutil
+from collections import deque
+
+# auto (panel on a terminal, headless otherwise), ansi or headless
+STATUS_PANEL = os.getenv('STATUS_PANEL', 'auto').lower()
+
+WIDTH = 50
+
+ESC = '\x1b['
+SAVE_CURSOR = '\x1b7'
+RESTORE_CURSOR = '\x1b8'
+CLEAR_LINE = ESC + 'K'
+RESET_REGION = ESC + 'r'
+
+
+class EventRate:
+    """Sliding-window event counter"""
+
+    def __init__(self, window=60.0):
+        self.window = window
+        self._events = deque()     # (monotonic time, count)
+        self._total = 0
+
+    def record(self, count=1):
+        self._events.append((time.monotonic(), count))
+        self._total += count
+
+    def per_minute(self):
+        """Events in the last window, scaled to one minute"""
+        cutoff = time.monotonic() - self.window
+        while self._events and self._events[0][0] < cutoff:
+            self._total -= self._events.popleft()[1]
+        return self._total * 60.0 / self.window
+
+
+class StatusPanel:
+    """
+    Status box pinned above the scrolling log output
+
+    render() takes a list of (label, value) fields. On a terminal only the
+    changed lines are rewritten, using cursor save/restore so concurrent
+    log prints are not disturbed. In headless mode (systemd, pipes) a
+    one-line summary is logged whenever a non-volatile field changes.
+    """
+
+    def __init__(self, title, footer="Press Ctrl+C to stop", stream=None,
+                 mode=STATUS_PANEL, volatile=(), log=print):
+        """
+        Args:
+            title: Heading shown in the box
+            footer: Last line of the box
+            stream: Terminal stream (default: sys.stdout)
+            mode: 'auto', 'ansi' or 'headless'
+            volatile: Labels whose changes alone do not trigger a headless
+                      summary (ages, rates)
+            log: Callable(message) for headless summaries
+        """
+        self.title = title
+        self.footer = footer
+        self.stream = stream or sys.stdout
+        self.volatile = set(volatile)
+        self.log = log
+
+        if mode == 'auto':
+            is_tty = hasattr(self.stream, 'isatty') and self.stream.isatty()
+            mode = 'ansi' if is_tty and os.getenv('TERM', 'dumb') != 'dumb' else 'headless'
+        self.headless = mode == 'headless'
+
+        self._lines = []           # lines currently on screen
+        self._size = None          # terminal size the layout was drawn for
+        self._summary = None       # last headless summary
+
+    def _layout(self, fields):
+        rule = '=' * WIDTH
+        lines = [rule, self.title.center(WIDTH).rstrip(), rule]
+        lines.extend(f"{label}: {value}" for label, value in fields)
+        lines.extend(['', self.footer, rule])
+        return lines
+
+    def render(self, fields):
+        """Show the current field values"""
+        if self.headless:
+            self._render_headless(fields)
+            return
+
+        lines = self._layout(fields)
+        size = shutil.get_terminal_size()
+
+        if size.lines < len(lines) + 3:
+            # Terminal too small to pin the box; stay out of the way
+            return
+
+        if size != self._size or len(lines) != len(self._lines):
+            self._redraw(lines, size)
+            return
+
+        out = [SAVE_CURSOR]
+        for row, (old, new) in enumerate(zip(self._lines, lines), start=1):
+            if old != new:
+                out.append(f"{ESC}{row};1H{self._fit(new, size)}{CLEAR_LINE}")
+        if len(out) == 1:
+            return
+        out.append(RESTORE_CURSOR)
+
+        self._write(''.join(out))
+        self._lines = lines
+
+    def _fit(self, line, size):
+        return line[:max(1, size.columns - 1)]
+
+    def _redraw(self, lines, size):
+        """Draw the whole box and confine scrolling to the rows below it"""
+        height = len(lines)
+        out = []
+        if self._size is None:
+            # Push the visible screen into scrollback instead of erasing it
+            out.append('\n' * size.lines)
+        out.append(f"{ESC}1;{size.lines}r")
+        for row, line in enumerate(lines, start=1):
+            out.append(f"{ESC}{row};1H{self._fit(line, size)}{CLEAR_LINE}")
+        out.append(f"{ESC}{height + 1};1H{CLEAR_LINE}")
+        out.append(f"{ESC}{height + 2};{size.lines}r")
+        out.append(f"{ESC}{size.lines};1H")
+
+        self._write(''.join(out))
+        self._lines = lines
+        self._size = size
+
+    def _render_headless(self, fields):
+        summary = " | ".join(f"{label.strip()}: {value}" for label, value in fields
+                             if label not in self.volatile)
+        if summary != self._summary:
+            self._summary = summary
+            self.log(f"Status - {summary}")
+
+    def _write(self, data):
+        try:
+            self.stream.write(data)
+            self.stream.flush()
+        except (OSError, ValueError):
+            pass
+
+    def close(self):
+        """Release the pinned rows and leave the cursor below the log"""
+        if self.headless or self._size is None:
+            return
+        self._write(f"{RESET_REGION}{ESC}{self._size.lines};1H\n")
+        self._size = None
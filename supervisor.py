@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Supervisor - Restarts crashed watchers with backoff and crash-loop detection
+The orchestrator calls reap() from its SIGCHLD handler, so exits are
+noticed immediately instead of on a periodic poll
+"""
+
+import os
+import time
+import random
+import signal
+from collections import deque
+
+# Restart policy; override via environment
+BACKOFF_BASE = float(os.getenv('SUPERVISOR_BACKOFF_BASE', 1))
+BACKOFF_MAX = float(os.getenv('SUPERVISOR_BACKOFF_MAX', 300))
+CRASH_LIMIT = int(os.getenv('SUPERVISOR_CRASH_LIMIT', 5))
+CRASH_WINDOW = float(os.getenv('SUPERVISOR_CRASH_WINDOW', 600))
+QUARANTINE_TIME = float(os.getenv('SUPERVISOR_QUARANTINE_TIME', 1800))
+STABLE_AFTER = float(os.getenv('SUPERVISOR_STABLE_AFTER', 60))
+
+
+def describe_exit(returncode):
+    """Human readable reason for a process exit"""
+    if returncode is None:
+        return "running"
+    if returncode < 0:
+        try:
+            return f"killed by {signal.Signals(-returncode).name}"
+        except ValueError:
+            return f"killed by signal {-returncode}"
+    return f"exit code {returncode}"
+
+
+class WatcherState:
+    """Supervision state for one watcher"""
+
+    def __init__(self, name, script_path):
+        self.name = name
+        self.script_path = script_path
+        self.process = None
+        self.started_at = None
+        self.restarts = 0
+        self.failures = 0          # consecutive crashes, drives the backoff
+        self.crashes = deque()     # monotonic times of recent crashes
+        self.last_exit = None
+        self.next_start = None     # monotonic time of the scheduled restart
+        self.quarantined = False
+
+    @property
+    def running(self):
+        return self.process is not None and self.process.poll() is None
+
+    @property
+    def status(self):
+        """Short status label for the dashboard and status box"""
+        if self.running:
+            return "running"
+        if self.quarantined:
+            return "quarantined"
+        if self.next_start is not None:
+            return "restarting"
+        return "stopped"
+
+
+class WatcherSupervisor:
+    """
+    Start watchers and restart them with exponential backoff and jitter
+
+    A watcher that crashes CRASH_LIMIT times within CRASH_WINDOW seconds is
+    quarantined for QUARANTINE_TIME seconds before it gets another try.
+    """
+
+    def __init__(self, watchers, start_fn, log=print):
+        """
+        Args:
+            watchers: List of (name, script_path) tuples
+            start_fn: Callable(name, script_path) returning Popen or None
+            log: Logging function taking (message, level)
+        """
+        self.states = [WatcherState(name, path) for name, path in watchers]
+        self.start_fn = start_fn
+        self.log = log
+
+    def processes(self):
+        """(name, process) pairs for watchers that have been started"""
+        return [(s.name, s.process) for s in self.states if s.process is not None]
+
+    def active_count(self):
+        return sum(1 for s in self.states if s.running)
+
+    def _launch(self, state):
+        """Start (or restart) one watcher"""
+        state.next_start = None
+        process = self.start_fn(state.name, state.script_path)
+        if process is None:
+            state.process = None
+            self._record_crash(state, "failed to start")
+            return False
+
+        state.process = process
+        state.started_at = time.monotonic()
+        return True
+
+    def start_all(self):
+        """Start every watcher whose script exists"""
+        for state in self.states:
+            if state.script_path.exists():
+                self._launch(state)
+            else:
+                self.log(f"Skipping {state.name} - script not found", "WARNING")
+        return self.active_count()
+
+    def _record_crash(self, state, reason):
+        """Register a crash and schedule the next restart (or quarantine)"""
+        now = time.monotonic()
+        state.last_exit = reason
+
+        if state.started_at is not None and now - state.started_at >= STABLE_AFTER:
+            state.failures = 0
+        state.failures += 1
+
+        state.crashes.append(now)
+        while state.crashes and now - state.crashes[0] > CRASH_WINDOW:
+            state.crashes.popleft()
+
+        if len(state.crashes) >= CRASH_LIMIT:
+            state.quarantined = True
+            state.next_start = now + QUARANTINE_TIME
+            state.crashes.clear()
+            self.log(f"{state.name} crashed {CRASH_LIMIT} times in {CRASH_WINDOW:.0f}s - "
+                     f"quarantined for {QUARANTINE_TIME:.0f}s", "ERROR")
+            return
+
+        delay = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** (state.failures - 1))
+        delay = random.uniform(delay / 2, delay)
+        state.next_start = now + delay
+        self.log(f"Restarting {state.name} in {delay:.1f}s (attempt {state.failures})", "WARNING")
+
+    def reap(self):
+        """Handle exited watchers and start any whose restart is due"""
+        now = time.monotonic()
+
+        for state in self.states:
+            if state.process is not None and state.next_start is None:
+                returncode = state.process.poll()
+                if returncode is not None:
+                    reason = describe_exit(returncode)
+                    self.log(f"{state.name} stopped unexpectedly ({reason})", "WARNING")
+                    self._record_crash(state, reason)
+
+            if state.next_start is not None and state.next_start <= now:
+                if state.quarantined:
+                    self.log(f"Releasing {state.name} from quarantine", "WARNING")
+                    state.quarantined = False
+                state.restarts += 1
+                if self._launch(state):
+                    self.log(f"{state.name} restarted successfully")
+
+    def next_deadline(self):
+        """Earliest scheduled restart, or None"""
+        deadlines = [s.next_start for s in self.states if s.next_start is not None]
+        return min(deadlines) if deadlines else None
+
+    def stop_all(self, timeout=5):
+        """Terminate every running watcher"""
+        for state in self.states:
+            state.next_start = None
+            if not state.running:
+                continue
+
+            self.log(f"Stopping {state.name}...")
+            state.process.terminate()
+            try:
+                state.process.wait(timeout=timeout)
+                self.log(f"{state.name} stopped")
+            except Exception:
+                self.log(f"Force killing {state.name}...", "WARNING")
+                state.process.kill()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Tests for the inbox file watcher
+
+Run from the vault root:
+    python -m unittest discover tests
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(ROOT), str(ROOT / 'watchers')]
+
+from vault_catalog import VaultCatalog
+from file_watcher import FileWatcher
+
+
+class RecordingWatcher:
+    """Stands in for DirectoryWatcher: remembers the files handed back"""
+
+    def __init__(self):
+        self.retried = []
+
+    def retry(self, path, delay):
+        self.retried.append(path)
+
+
+class SourceLeftBehindTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cwd = os.getcwd()
+        os.chdir(self.tmp.name)
+        self.vault = Path(self.tmp.name)
+        self.file_watcher = FileWatcher()
+        self.file_watcher.catalog = VaultCatalog(self.vault, self.vault / '.vault_catalog.db')
+
+    def tearDown(self):
+        # Log writes are relative to the vault; finish them before leaving it
+        self.file_watcher.logger.flush()
+        self.file_watcher.catalog.close()
+        self.file_watcher.processed.close()
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def test_unremovable_source_is_moved_once(self):
+        source = Path('Inbox') / 'report.txt'
+        source.write_text("quarterly numbers")
+        real_unlink = Path.unlink
+
+        def unlink(path, missing_ok=False):
+            if path.name == source.name:
+                raise PermissionError(13, "Permission denied", str(path))
+            return real_unlink(path, missing_ok=missing_ok)
+
+        watcher = RecordingWatcher()
+        with mock.patch.object(Path, 'unlink', autospec=True, side_effect=unlink):
+            # Two watcher cycles both reporting the file that stayed behind
+            for _ in range(2):
+                self.file_watcher.process_ready([source], watcher, interval=0)
+
+        tasks = [p for p in Path('Needs_Action').iterdir() if not p.name.startswith('.')]
+        self.assertEqual(len(tasks), 1)
+        self.assertEqual(tasks[0].read_text(), "quarterly numbers")
+        self.assertTrue(source.exists())
+        self.assertIn(source, self.file_watcher.processed)
+        self.assertEqual(watcher.retried, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
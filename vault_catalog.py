@@ -0,0 +1,477 @@
+#!/usr/bin/env python3
+"""
+Vault Catalog - SQLite mirror of where every vault item is
+One row per task, draft or approval file (id, type, channel, priority,
+folder, created, moved), keyed on its vault-relative path, written in the same transaction as the file
+operation that creates or moves it. State questions such as "is a
+dashboard_update task still pending?" become indexed lookups instead of
+directory walks. The files stay the source of truth: rebuild() re-derives
+the catalog from disk at any time.
+
+Usage:
+    python vault_catalog.py rebuild [--full]
+    python vault_catalog.py stats
+    python vault_catalog.py list Needs_Action --priority high
+"""
+
+import os
+import sqlite3
+import argparse
+import threading
+from itertools import chain
+from datetime import datetime
+from pathlib import Path
+from dotenv import load_dotenv
+
+from approval_executor import channel_for
+from vault_doc import read_document, MalformedDocument
+from vault_write import move_file, rename_no_replace
+
+# Load environment variables
+load_dotenv()
+
+# Configuration
+VAULT_PATH = Path(os.getenv('VAULT_PATH', '.'))
+VAULT_CATALOG_PATH = Path(os.getenv('VAULT_CATALOG_PATH', VAULT_PATH / '.vault_catalog.db'))
+
+# Folders an item moves through, in lifecycle order
+CATALOG_FOLDERS = ['Inbox', 'Needs_Action', 'Plans', 'Pending_Approval', 'Approved', 'Rejected', 'Done']
+
+# Folders whose items live in dated subfolders (Done/YYYY/MM/DD/); packed
+# items under Done/packs/ are no longer catalogued
+NESTED_FOLDERS = {'Done': ('*', '[0-9][0-9][0-9][0-9]/[0-9][0-9]/[0-9][0-9]/*')}
+
+# Folder notes that are not vault items
+SKIP_NAMES = {'README.md'}
+
+# Frontmatter fields holding the creation time, in order of preference
+CREATED_FIELDS = ('created', 'received', 'scheduled')
+
+# Bumped when the table layout or id scheme changes; older catalogs are
+# dropped and rebuilt from disk (version 2: ids are vault-relative paths)
+SCHEMA_VERSION = 2
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    id TEXT PRIMARY KEY,
+    type TEXT,
+    channel TEXT,
+    priority TEXT NOT NULL DEFAULT 'normal',
+    folder TEXT NOT NULL,
+    created TEXT NOT NULL,
+    moved TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS items_folder_id ON items(folder, id);
+CREATE INDEX IF NOT EXISTS items_folder_priority ON items(folder, priority);
+"""
+
+
+def timestamp(seconds=None):
+    """'YYYY-MM-DD HH:MM:SS' for a POSIX time (default: now)"""
+    moment = datetime.now() if seconds is None else datetime.fromtimestamp(seconds)
+    return moment.strftime('%Y-%m-%d %H:%M:%S')
+
+
+def prefix_end(prefix):
+    """Smallest string greater than every string starting with prefix"""
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+def is_item(path):
+    path = Path(path)
+    return path.name not in SKIP_NAMES and not path.name.startswith('.')
+
+
+def describe_item(path):
+    """
+    Read an item's catalog fields from its frontmatter
+
+    Returns:
+        (type, channel, priority, created)
+    """
+    path = Path(path)
+    frontmatter = {}
+    if path.suffix == '.md':
+        try:
+            frontmatter = read_document(path, sections=[]).frontmatter
+        except (OSError, ValueError, MalformedDocument):
+            pass
+
+    created = next((frontmatter[f] for f in CREATED_FIELDS if frontmatter.get(f)), None)
+    if created:
+        created = created.replace('T', ' ')[:19]
+    else:
+        try:
+            created = timestamp(path.stat().st_mtime)
+        except OSError:
+            created = timestamp()
+
+    return (
+        frontmatter.get('type'),
+        channel_for(path.name) or frontmatter.get('source'),
+        (frontmatter.get('priority') or 'normal').lower(),
+        created
+    )
+
+
+class VaultCatalog:
+    """
+    WAL-mode catalog of vault items, shared by every process
+
+    All writes go through one connection guarded by a lock, so the
+    orchestrator's worker threads can record moves concurrently.
+    """
+
+    def __init__(self, vault_path=VAULT_PATH, db_path=VAULT_CATALOG_PATH, log=None):
+        """
+        Args:
+            vault_path: Root of the vault
+            db_path: SQLite database for the catalog
+            log: Logging function taking (message, level), or None
+        """
+        self.vault_path = Path(vault_path)
+        self.db_path = Path(db_path)
+        self.log = log
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(str(self.db_path), timeout=10, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._root = self.vault_path.resolve()
+
+        if self._schema_version() < SCHEMA_VERSION:
+            self._migrate()
+        else:
+            self.conn.executescript(SCHEMA)
+
+    def _schema_version(self):
+        return self.conn.execute("PRAGMA user_version").fetchone()[0]
+
+    def _migrate(self):
+        """
+        Drop an older catalog and rebuild it from disk
+
+        Runs in one write transaction, and the version is checked again
+        once the lock is held: several watchers start together, and only
+        the first of them to get the lock rebuilds.
+        """
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                if self._schema_version() < SCHEMA_VERSION:
+                    self.conn.execute("DROP TABLE IF EXISTS items")
+                    for statement in SCHEMA.split(';'):
+                        if statement.strip():
+                            self.conn.execute(statement)
+                    self._scan()
+                    self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+                self.conn.commit()
+            except BaseException:
+                self.conn.rollback()
+                raise
+
+    def _warn(self, message):
+        if self.log is not None:
+            self.log(message, "WARNING")
+
+    def folder_of(self, path):
+        """Top-level vault folder holding a path"""
+        path = Path(path)
+        try:
+            return path.resolve().relative_to(self.vault_path.resolve()).parts[0]
+        except (ValueError, IndexError):
+            return path.parent.name
+
+    def item_id(self, path):
+        """Catalog id of a path: its vault-relative path, e.g. 'Needs_Action/a.md'"""
+        path = Path(path)
+        try:
+            return (path.parent.resolve() / path.name).relative_to(self._root).as_posix()
+        except ValueError:
+            return f"{path.parent.name}/{path.name}"
+
+    def _upsert(self, path, folder, moved, item_id=None, details=None):
+        item_type, channel, priority, created = describe_item(path)
+        if details:
+            # Known to the caller but not written in the file (e.g. inbox routing)
+            item_type = details.get('type') or item_type
+            priority = details.get('priority') or priority
+        self.conn.execute(
+            "INSERT INTO items (id, type, channel, priority, folder, created, moved) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(id) DO UPDATE SET type = excluded.type, channel = excluded.channel, "
+            "priority = excluded.priority, folder = excluded.folder, "
+            "moved = CASE WHEN items.folder = excluded.folder THEN items.moved ELSE excluded.moved END",
+            (item_id or self.item_id(path), item_type, channel, priority, folder, created, moved)
+        )
+
+    def record(self, path):
+        """
+        Catalog a file that was just written (or refresh its row)
+
+        Returns:
+            True if the catalog was updated
+        """
+        if not is_item(path):
+            return False
+        try:
+            with self._lock, self.conn:
+                self._upsert(path, self.folder_of(path), timestamp())
+            return True
+        except sqlite3.Error as e:
+            self._warn(f"Catalog update failed for {Path(path).name}: {e}")
+            return False
+
+    def move(self, src, dst, details=None):
+        """
+        Rename a vault file and update its row in one transaction
+
+        The row is written first and the rename happens before commit, so
+        a failed rename rolls the catalog back. If the catalog itself is
+        unavailable the file is still moved; rebuild() repairs the row.
+        Moves across filesystems copy the data, so they run outside the
+        transaction and the row is recorded once the file is in place.
+
+        Args:
+            src: File to move
+            dst: Destination path, which must not exist
+            details: Optional {'type', 'priority'} overriding the file's own
+
+        Returns:
+            The destination path
+
+        Raises:
+            FileExistsError if dst exists; OSError if the rename fails
+        """
+        src, dst = Path(src), Path(dst)
+        try:
+            same_device = src.stat().st_dev == dst.parent.stat().st_dev
+        except OSError:
+            same_device = True  # let the rename report the problem
+        if not same_device:
+            move_file(src, dst, log=self.log)
+            self.record_moves([(src, dst)], {dst: details} if details else None)
+            return dst
+
+        try:
+            with self._lock, self.conn:
+                self.conn.execute("DELETE FROM items WHERE id = ?", (self.item_id(src),))
+                if is_item(dst):
+                    self._upsert(src, self.folder_of(dst), timestamp(), item_id=self.item_id(dst),
+                                 details=details)
+                rename_no_replace(src, dst, self.log)
+            return dst
+        except sqlite3.Error as e:
+            self._warn(f"Catalog update failed for {src.name}: {e}")
+            if src.exists():
+                rename_no_replace(src, dst, self.log)
+            return dst
+
+    def record_moves(self, moves, details=None):
+        """
+        Catalog a batch of renames already made on disk, in one transaction
+
+        Args:
+            moves: (src, dst) path pairs
+            details: Optional {dst: {'type', 'priority'}} overriding the files' own
+
+        Returns:
+            True if the catalog was updated
+        """
+        moved = timestamp()
+        try:
+            with self._lock, self.conn:
+                for src, dst in moves:
+                    self.conn.execute("DELETE FROM items WHERE id = ?", (self.item_id(src),))
+                    dst = Path(dst)
+                    if is_item(dst):
+                        self._upsert(dst, self.folder_of(dst), moved,
+                                     details=details.get(dst) if details else None)
+            return True
+        except sqlite3.Error as e:
+            self._warn(f"Catalog update failed for {len(moves)} moved item(s): {e}")
+            return False
+
+    def forget(self, path, folder=None):
+        """
+        Drop a file's row
+
+        Args:
+            path: File that was removed
+            folder: Only drop the row if the item is still catalogued here
+                    (a move recorded elsewhere already updated it)
+        """
+        sql, params = "DELETE FROM items WHERE id = ?", [self.item_id(path)]
+        if folder is not None:
+            sql += " AND folder = ?"
+            params.append(folder)
+        try:
+            with self._lock, self.conn:
+                self.conn.execute(sql, params)
+        except sqlite3.Error as e:
+            self._warn(f"Catalog update failed for {Path(path).name}: {e}")
+
+    def count(self, folder, priority=None):
+        """Number of items in a folder, optionally of one priority"""
+        if priority is None:
+            row = self.conn.execute("SELECT COUNT(*) FROM items WHERE folder = ?", (folder,)).fetchone()
+        else:
+            row = self.conn.execute(
+                "SELECT COUNT(*) FROM items WHERE folder = ? AND priority = ?",
+                (folder, priority.lower())).fetchone()
+        return row[0]
+
+    def items(self, folder, prefix=None, priority=None):
+        """
+        Items in a folder, oldest first
+
+        Args:
+            folder: Top-level folder, e.g. 'Needs_Action'
+            prefix: Only items directly in the folder whose name starts
+                    with this (an index range scan)
+            priority: Only this priority
+
+        Returns:
+            List of (id, type, channel, priority, created, moved) tuples
+        """
+        sql = "SELECT id, type, channel, priority, created, moved FROM items WHERE folder = ?"
+        params = [folder]
+        if prefix:
+            sql += " AND id >= ? AND id < ?"
+            params += [f"{folder}/{prefix}", prefix_end(f"{folder}/{prefix}")]
+        if priority:
+            sql += " AND priority = ?"
+            params.append(priority.lower())
+        sql += " ORDER BY created, id"
+        return self.conn.execute(sql, params).fetchall()
+
+    def find(self, folder, prefix):
+        """
+        Names of items directly in a folder that start with prefix
+
+        Rows whose file has since disappeared (moved by hand while nothing
+        was mirroring the vault) are dropped rather than reported.
+        """
+        found = []
+        for row in self.items(folder, prefix):
+            path = self.vault_path / row[0]
+            if path.exists():
+                found.append(path.name)
+            else:
+                self.forget(path, folder)
+        return found
+
+    def rebuild(self, full=False, folders=CATALOG_FOLDERS):
+        """
+        Re-derive the catalog from the files on disk
+
+        Args:
+            full: Re-read every file; by default rows already in the right
+                  folder are kept and only new or moved files are read
+            folders: Folders to scan
+
+        Returns:
+            (rows written, rows removed)
+        """
+        with self._lock, self.conn:
+            return self._scan(full, folders)
+
+    def _scan(self, full=False, folders=CATALOG_FOLDERS):
+        """rebuild() inside the caller's transaction"""
+        written = removed = 0
+        known = dict(self.conn.execute("SELECT id, folder FROM items"))
+        seen = set()
+        for folder in folders:
+            directory = self.vault_path / folder
+            if not directory.is_dir():
+                continue
+            patterns = NESTED_FOLDERS.get(folder, ('*',))
+            for path in chain.from_iterable(directory.glob(p) for p in patterns):
+                if not path.is_file() or not is_item(path):
+                    continue
+                item_id = self.item_id(path)
+                seen.add(item_id)
+                if full or known.get(item_id) != folder:
+                    try:
+                        moved = timestamp(path.stat().st_ctime)
+                    except OSError:
+                        continue
+                    self._upsert(path, folder, moved, item_id=item_id)
+                    written += 1
+
+        for item_id, folder in known.items():
+            if item_id not in seen and folder in folders:
+                self.conn.execute("DELETE FROM items WHERE id = ?", (item_id,))
+                removed += 1
+        return written, removed
+
+    def stats(self):
+        """{folder: {priority: count}}"""
+        result = {}
+        for folder, priority, count in self.conn.execute(
+                "SELECT folder, priority, COUNT(*) FROM items GROUP BY folder, priority"):
+            result.setdefault(folder, {})[priority] = count
+        return result
+
+    def close(self):
+        self.conn.close()
+
+
+_catalog = None
+_catalog_lock = threading.Lock()
+
+
+def get_catalog(log=None):
+    """
+    Shared VaultCatalog for this process
+
+    Args:
+        log: Logging function taking (message, level), used on first call
+
+    Returns:
+        VaultCatalog
+    """
+    global _catalog
+    with _catalog_lock:
+        if _catalog is None:
+            _catalog = VaultCatalog(log=log)
+        return _catalog
+
+
+def main():
+    """Command line interface"""
+    parser = argparse.ArgumentParser(description="Rebuild and query the vault catalog")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    rebuild = commands.add_parser('rebuild', help="Re-derive the catalog from the vault folders")
+    rebuild.add_argument('--full', action='store_true', help="Re-read every file, not only changed ones")
+
+    commands.add_parser('stats', help="Item counts per folder and priority")
+
+    listing = commands.add_parser('list', help="List the items in a folder")
+    listing.add_argument('folder', help="e.g. Needs_Action or Pending_Approval")
+    listing.add_argument('--prefix', help="Only file names starting with this")
+    listing.add_argument('--priority', help="Only this priority")
+
+    args = parser.parse_args()
+    catalog = VaultCatalog()
+
+    try:
+        if args.command == 'rebuild':
+            written, removed = catalog.rebuild(full=args.full)
+            print(f"Catalog rebuilt: {written} item(s) written, {removed} removed")
+        elif args.command == 'stats':
+            stats = catalog.stats()
+            for folder in CATALOG_FOLDERS:
+                priorities = stats.get(folder, {})
+                detail = ", ".join(f"{p}: {n}" for p, n in sorted(priorities.items()))
+                print(f"{folder:<18} {sum(priorities.values()):>5}  {detail}")
+        else:
+            for item_id, item_type, channel, priority, created, moved in catalog.items(
+                    args.folder, args.prefix, args.priority):
+                print(f"{created}  {priority:<7} {channel or '-':<9} {item_type or '-':<16} {item_id}")
+    finally:
+        catalog.close()
+
+
+if __name__ == "__main__":
+    main()
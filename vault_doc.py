@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Vault Doc - Streaming parser for vault markdown files
+Reads YAML-style frontmatter and `## Section` blocks line by line, stops
+as soon as the requested sections are complete, and memoizes results by
+(path, mtime, size). Approval handlers and the LinkedIn queue get typed
+records instead of running ad-hoc regexes over whole files.
+"""
+
+import os
+import re
+import threading
+from itertools import chain
+from collections import OrderedDict
+from typing import NamedTuple, Optional
+
+# Frontmatter must close within this many lines or the file is malformed
+MAX_FRONTMATTER_LINES = 100
+CACHE_SIZE = 1024
+
+FIELD_RE = re.compile(r'^([A-Za-z_][\w-]*):\s*(.*?)\s*$')
+HEADING_RE = re.compile(r'^##\s+(.+?)\s*$')
+# Sections end at a horizontal rule (the approval footer) or the next heading
+RULE_RE = re.compile(r'^---')
+
+# Inline fields inside a LinkedIn queue section
+POST_STATUS_RE = re.compile(r'Status:\s*(\w+)')
+POST_SCHEDULED_RE = re.compile(r'Scheduled:\s*(.+)')
+POST_CONTENT_RE = re.compile(r'Content:\s*\n(.*)', re.DOTALL)
+POST_HEADING_RE = re.compile(r'^Post \d+$')
+
+
+class MalformedDocument(ValueError):
+    """A vault file is missing required frontmatter or sections"""
+
+
+class VaultDocument(NamedTuple):
+    path: str
+    frontmatter: dict
+    sections: dict          # heading -> text, in file order
+    complete: bool          # False if reading stopped early
+
+
+class EmailDraft(NamedTuple):
+    to: str
+    subject: str
+    body: str
+    cc: Optional[str] = None
+    bcc: Optional[str] = None
+
+
+class LinkedInApproval(NamedTuple):
+    content: str
+
+
+class WhatsAppApproval(NamedTuple):
+    to: str
+    message: str
+
+
+class QueuedPost(NamedTuple):
+    heading: str
+    status: str
+    scheduled: Optional[str]
+    content: str
+
+
+_cache = OrderedDict()      # path -> ((mtime_ns, size), VaultDocument)
+_cache_lock = threading.Lock()
+
+
+def _parse(path, wanted):
+    """Read frontmatter and sections, stopping once `wanted` are complete"""
+    frontmatter = {}
+    sections = {}
+    remaining = set(wanted) if wanted is not None else None
+
+    with open(path, 'r', encoding='utf-8') as f:
+        first = f.readline()
+        if first.rstrip('\r\n') == '---':
+            for number, line in enumerate(f, start=2):
+                line = line.rstrip('\r\n')
+                if line == '---':
+                    break
+                match = FIELD_RE.match(line)
+                if match:
+                    frontmatter[match.group(1)] = match.group(2)
+                if number > MAX_FRONTMATTER_LINES:
+                    raise MalformedDocument(f"{path}: frontmatter is not closed")
+            else:
+                raise MalformedDocument(f"{path}: frontmatter is not closed")
+            lines = f
+        else:
+            lines = chain([first], f)
+
+        current, body = None, []
+
+        def close():
+            sections[current] = "\n".join(body).strip()
+            if remaining is not None:
+                remaining.discard(current)
+
+        if remaining is not None and not remaining:
+            return VaultDocument(str(path), frontmatter, sections, False)
+
+        for line in lines:
+            line = line.rstrip('\r\n')
+            heading = HEADING_RE.match(line)
+            if heading or (current is not None and RULE_RE.match(line)):
+                if current is not None:
+                    close()
+                    if remaining is not None and not remaining:
+                        return VaultDocument(str(path), frontmatter, sections, False)
+                current, body = (heading.group(1), []) if heading else (None, [])
+            elif current is not None:
+                body.append(line)
+
+        if current is not None:
+            close()
+
+    return VaultDocument(str(path), frontmatter, sections, True)
+
+
+def read_document(path, sections=None):
+    """
+    Parse a vault markdown file (memoized)
+
+    Args:
+        path: File to read
+        sections: Headings that are needed; reading stops once they are
+                  complete. None reads the whole file.
+
+    Returns:
+        VaultDocument
+
+    Raises:
+        OSError if the file cannot be read, MalformedDocument if its
+        frontmatter is not closed
+    """
+    key = os.fspath(path)
+    st = os.stat(key)
+    stamp = (st.st_mtime_ns, st.st_size)
+
+    with _cache_lock:
+        cached = _cache.get(key)
+        if cached is not None and cached[0] == stamp:
+            doc = cached[1]
+            if doc.complete or (sections is not None and set(sections) <= doc.sections.keys()):
+                _cache.move_to_end(key)
+                return doc
+
+    doc = _parse(key, sections)
+
+    with _cache_lock:
+        _cache[key] = (stamp, doc)
+        _cache.move_to_end(key)
+        while len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+    return doc
+
+
+def _required(doc, value, what):
+    if not value:
+        raise MalformedDocument(f"{doc.path}: missing {what}")
+    return value
+
+
+def parse_email_draft(path):
+    """
+    Read an email approval file
+
+    Returns:
+        EmailDraft
+
+    Raises:
+        MalformedDocument if to, subject or the Body section is missing
+    """
+    doc = read_document(path, sections=['Body'])
+    fm = doc.frontmatter
+    return EmailDraft(
+        to=_required(doc, fm.get('to'), "'to'"),
+        subject=_required(doc, fm.get('subject'), "'subject'"),
+        body=_required(doc, doc.sections.get('Body'), "'## Body' section"),
+        cc=fm.get('cc') or None,
+        bcc=fm.get('bcc') or None
+    )
+
+
+def parse_linkedin_approval(path):
+    """
+    Read a LinkedIn approval file
+
+    Returns:
+        LinkedInApproval
+
+    Raises:
+        MalformedDocument if the Content section is missing
+    """
+    doc = read_document(path, sections=['Content'])
+    return LinkedInApproval(
+        content=_required(doc, doc.sections.get('Content'), "'## Content' section"))
+
+
+def parse_whatsapp_approval(path):
+    """
+    Read a WhatsApp approval file
+
+    Returns:
+        WhatsAppApproval
+
+    Raises:
+        MalformedDocument if 'to' or the Message section is missing
+    """
+    doc = read_document(path, sections=['Message'])
+    return WhatsAppApproval(
+        to=_required(doc, doc.frontmatter.get('to'), "'to'"),
+        message=_required(doc, doc.sections.get('Message'), "'## Message' section")
+    )
+
+
+def parse_post_queue(path):
+    """
+    Read the LinkedIn posts queue (## Post N sections)
+
+    Returns:
+        List of QueuedPost in file order
+    """
+    doc = read_document(path)
+    posts = []
+    for heading, text in doc.sections.items():
+        if not POST_HEADING_RE.match(heading):
+            continue
+        status = POST_STATUS_RE.search(text)
+        scheduled = POST_SCHEDULED_RE.search(text)
+        content = POST_CONTENT_RE.search(text)
+        posts.append(QueuedPost(
+            heading=heading,
+            status=status.group(1) if status else 'unknown',
+            scheduled=scheduled.group(1).strip() if scheduled else None,
+            content=content.group(1).strip() if content else ''
+        ))
+    return posts
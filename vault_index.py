@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Vault Index - Incremental in-memory view of vault folders
+Keeps counts, priorities and ages per folder up to date from filesystem
+events, so status and dashboard rendering never glob the vault
+"""
+
+import re
+import heapq
+import time
+from collections import Counter
+from pathlib import Path
+
+from vault_watch import DirectoryWatcher
+
+# Only the frontmatter is read to find the priority
+PRIORITY_RE = re.compile(r'^priority:\s*(\w+)', re.MULTILINE)
+HEAD_BYTES = 2048
+
+
+def read_priority(path):
+    """Read `priority:` from a task file's frontmatter (default: normal)"""
+    try:
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            head = f.read(HEAD_BYTES)
+    except OSError:
+        return 'normal'
+
+    match = PRIORITY_RE.search(head)
+    return match.group(1).lower() if match else 'normal'
+
+
+class FolderIndex:
+    """Index of the task files in one folder"""
+
+    def __init__(self, name):
+        self.name = name
+        self.watcher = None
+        self.entries = {}              # filename -> (priority, mtime)
+        self.priorities = Counter()
+        self._by_age = []              # heap of (mtime, filename), lazily pruned
+
+    def add(self, path):
+        """Add or refresh a file"""
+        try:
+            mtime = path.stat().st_mtime
+        except OSError:
+            return
+        self.remove(path)
+
+        priority = read_priority(path)
+        self.entries[path.name] = (priority, mtime)
+        self.priorities[priority] += 1
+        heapq.heappush(self._by_age, (mtime, path.name))
+
+        # Rebuild the age heap once stale entries dominate it
+        if len(self._by_age) > 2 * len(self.entries) + 64:
+            self._by_age = [(m, n) for n, (_, m) in self.entries.items()]
+            heapq.heapify(self._by_age)
+
+    def remove(self, path):
+        """Drop a file that left the folder"""
+        entry = self.entries.pop(path.name, None)
+        if entry is not None:
+            self.priorities[entry[0]] -= 1
+
+    @property
+    def count(self):
+        return len(self.entries)
+
+    def oldest_age(self):
+        """Seconds since the oldest file was written, or None if empty"""
+        while self._by_age:
+            mtime, name = self._by_age[0]
+            entry = self.entries.get(name)
+            if entry is not None and entry[1] == mtime:
+                return max(0.0, time.time() - mtime)
+            heapq.heappop(self._by_age)
+        return None
+
+
+class VaultIndex:
+    """
+    In-memory index over several vault folders
+
+    Call sync() to apply pending filesystem events without blocking, or
+    register each watcher's fileno() with an event loop and call sync()
+    when it becomes readable.
+    """
+
+    def __init__(self, vault_path, folders, pattern='*.md', poll_interval=30.0, on_change=None):
+        """
+        Args:
+            vault_path: Root of the vault
+            folders: Folder names to index (e.g. ['Needs_Action', 'Approved'])
+            pattern: File name pattern to index
+            poll_interval: Rescan interval when inotify is unavailable
+            on_change: Called as on_change(folder, path, present) for every
+                       file indexed (present=True) or dropped (False)
+        """
+        self.vault_path = Path(vault_path)
+        self.folders = {}
+        self.on_change = on_change
+
+        for name in folders:
+            directory = self.vault_path / name
+            directory.mkdir(exist_ok=True)
+            folder = FolderIndex(name)
+            folder.watcher = DirectoryWatcher(
+                directory,
+                pattern=pattern,
+                poll_interval=poll_interval,
+                on_removed=lambda path, folder=folder: self._removed(folder, path)
+            )
+            self.folders[name] = folder
+
+        self.sync()
+
+    def _removed(self, folder, path):
+        folder.remove(path)
+        if self.on_change is not None:
+            self.on_change(folder.name, path, False)
+
+    def watchers(self):
+        """DirectoryWatchers feeding the index"""
+        return [folder.watcher for folder in self.folders.values()]
+
+    def sync(self, settle=True):
+        """
+        Apply every event available right now
+
+        Args:
+            settle: False when syncing on demand - files that are already
+                    quiet are indexed without waiting out the debounce
+
+        Returns:
+            Number of files added, updated or removed (0 if nothing changed)
+        """
+        changes = 0
+        for folder in self.folders.values():
+            before = folder.count
+            added = 0
+            folder.watcher.read_events()
+            for path in folder.watcher.collect_ready(settle):
+                known = path.name in folder.entries
+                folder.add(path)
+                if path.name in folder.entries:
+                    changes += 1
+                    added += not known
+                    if self.on_change is not None:
+                        self.on_change(folder.name, path, True)
+            changes += before + added - folder.count
+        return changes
+
+    def next_timeout(self):
+        """Seconds until the next debounce or poll deadline across folders"""
+        timeouts = [t for t in (w.next_timeout() for w in self.watchers()) if t is not None]
+        return min(timeouts) if timeouts else None
+
+    def count(self, folder):
+        """Number of indexed files in a folder"""
+        return self.folders[folder].count
+
+    def priority_count(self, folder, priority):
+        """Number of files in a folder with a given priority"""
+        return self.folders[folder].priorities[priority]
+
+    def oldest_age(self, folder):
+        """Age in seconds of the oldest file in a folder, or None"""
+        return self.folders[folder].oldest_age()
+
+    def close(self):
+        for watcher in self.watchers():
+            watcher.close()
+
+
+def format_age(seconds):
+    """Compact age string like '45s', '12m' or '3h'"""
+    if seconds is None:
+        return "-"
+    if seconds < 60:
+        return f"{int(seconds)}s"
+    if seconds < 3600:
+        return f"{int(seconds // 60)}m"
+    if seconds < 86400:
+        return f"{int(seconds // 3600)}h"
+    return f"{int(seconds // 86400)}d"
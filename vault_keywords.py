@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Vault Keywords - Shared keyword engine for priority detection
+Builds one Aho-Corasick automaton from a weighted keyword dictionary and
+finds every keyword in a single linear pass, however many there are.
+Large files are streamed through mmap in chunks, so contents are scored
+without being read into memory whole.
+
+Keywords match whole words: letters and digits are word characters, and
+anything else (including '_' and '-', common in file names) is a
+boundary. A keyword ending in '*' matches any word it starts, e.g. 'pay*'
+matches 'payment'. Matching is case-insensitive for ASCII.
+
+Usage:
+    python vault_keywords.py Inbox/report.txt
+    python vault_keywords.py --text "Urgent: invoice overdue"
+"""
+
+import os
+import mmap
+import argparse
+from collections import deque
+from typing import NamedTuple
+from pathlib import Path
+
+# term:weight pairs; a term without a weight counts 1
+PRIORITY_KEYWORDS = os.getenv(
+    'PRIORITY_KEYWORDS',
+    'urgent:3,critical:3,emergency:3,asap:2,important:2,deadline:2,overdue:2,invoice:1,payment:1,help:1'
+)
+
+# Score from which an item is high / medium priority
+HIGH_PRIORITY_SCORE = int(os.getenv('HIGH_PRIORITY_SCORE', 3))
+MEDIUM_PRIORITY_SCORE = int(os.getenv('MEDIUM_PRIORITY_SCORE', 2))
+
+# Only this many bytes of a file's content are scanned (0 scans everything)
+KEYWORD_SCAN_BYTES = int(os.getenv('KEYWORD_SCAN_BYTES', 4 * 1024 * 1024))
+
+CHUNK_SIZE = 1024 * 1024
+
+# ASCII letters and digits, plus every non-ASCII byte so UTF-8 words stay whole
+_WORD_BYTES = (frozenset(b'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789')
+               | frozenset(range(128, 256)))
+
+
+class KeywordMatch(NamedTuple):
+    score: int
+    terms: tuple            # matched keywords, in order of first occurrence
+    priority: str
+
+
+def parse_keywords(spec):
+    """
+    Parse a 'term:weight,term' dictionary
+
+    Returns:
+        {term: weight}
+
+    Raises:
+        ValueError if a weight is not an integer
+    """
+    keywords = {}
+    for item in spec.split(','):
+        term, _, weight = item.strip().partition(':')
+        term = term.strip()
+        if term:
+            keywords[term] = int(weight) if weight.strip() else 1
+    return keywords
+
+
+def priority_for(score):
+    """'high', 'medium' or 'normal' for a keyword score"""
+    if score >= HIGH_PRIORITY_SCORE:
+        return "high"
+    if score >= MEDIUM_PRIORITY_SCORE:
+        return "medium"
+    return "normal"
+
+
+class KeywordMatcher:
+    """
+    Aho-Corasick automaton over a weighted keyword dictionary
+
+    Built once; scan(), scan_file() and scanner() may then be used from
+    any number of threads since matching never changes the automaton.
+    """
+
+    def __init__(self, keywords):
+        """
+        Args:
+            keywords: {term: weight}; a term ending in '*' is a word prefix
+        """
+        self.terms = []         # (term, weight, byte length, whole word)
+        goto = [{}]
+        outputs = [[]]
+
+        for term, weight in keywords.items():
+            whole_word = not term.endswith('*')
+            pattern = term.rstrip('*').lower().encode('utf-8')
+            if not pattern:
+                continue
+            state = 0
+            for byte in pattern:
+                nxt = goto[state].get(byte)
+                if nxt is None:
+                    nxt = goto[state][byte] = len(goto)
+                    goto.append({})
+                    outputs.append([])
+                state = nxt
+            outputs[state].append(len(self.terms))
+            self.terms.append((term, weight, len(pattern), whole_word))
+
+        # Failure links, breadth first; outputs inherit along them
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for byte, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and byte not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(byte, 0)
+                outputs[nxt] = outputs[nxt] + outputs[fail[nxt]]
+
+        self._goto = goto
+        self._fail = fail
+        self._outputs = [tuple(out) for out in outputs]
+        self.max_length = max((length for _, _, length, _ in self.terms), default=0)
+
+    def scanner(self):
+        """A Scanner for feeding one text in pieces"""
+        return Scanner(self)
+
+    def scan(self, *texts):
+        """
+        Score one or more texts (str or bytes) as a single document
+
+        Texts are separated by a boundary, e.g. a file name and its content.
+
+        Returns:
+            KeywordMatch
+        """
+        scanner = self.scanner()
+        for text in texts:
+            scanner.feed(text.encode('utf-8') if isinstance(text, str) else text)
+            scanner.boundary()
+        return scanner.result()
+
+    def scan_file(self, path, prefix=None, limit=KEYWORD_SCAN_BYTES):
+        """
+        Score a file's contents, streamed through mmap
+
+        Args:
+            path: File to scan
+            prefix: Text scored before the contents (e.g. the file name)
+            limit: Maximum content bytes to scan (0 or None for all)
+
+        Returns:
+            KeywordMatch
+
+        Raises:
+            OSError if the file cannot be read
+        """
+        scanner = self.scanner()
+        if prefix:
+            scanner.feed(prefix.encode('utf-8'))
+            scanner.boundary()
+
+        with open(path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            end = min(size, limit) if limit else size
+            if end:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    for offset in range(0, end, CHUNK_SIZE):
+                        scanner.feed(mapped[offset:min(offset + CHUNK_SIZE, end)])
+        return scanner.result()
+
+
+class Scanner:
+    """
+    Incremental matching state for one document
+
+    Each byte is examined once. A whole-word match is only counted once
+    the byte after it is known to be a boundary, so chunk edges do not
+    matter.
+    """
+
+    def __init__(self, matcher):
+        self.matcher = matcher
+        self.state = 0
+        self.scores = {}            # term index -> weight, first occurrence order
+        self._recent = bytearray()  # last bytes seen, for start-of-word checks
+        self._waiting = []          # whole-word matches awaiting the next byte
+
+    def _accept(self, index):
+        if index not in self.scores:
+            self.scores[index] = self.matcher.terms[index][1]
+
+    def feed(self, data):
+        """Scan the next piece of the document (bytes)"""
+        goto, fail, outputs = self.matcher._goto, self.matcher._fail, self.matcher._outputs
+        terms = self.matcher.terms
+        keep = self.matcher.max_length + 1
+        state = self.state
+        recent = self._recent
+        waiting = self._waiting
+
+        for byte in data.lower():
+            if waiting:
+                if byte not in _WORD_BYTES:
+                    for index in waiting:
+                        self._accept(index)
+                waiting.clear()
+
+            recent.append(byte)
+            while state and byte not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(byte, 0)
+
+            for index in outputs[state]:
+                _, _, length, whole_word = terms[index]
+                if index in self.scores:
+                    continue
+                # Byte before the match must be a boundary (or the start)
+                if len(recent) > length and recent[-length - 1] in _WORD_BYTES:
+                    continue
+                if whole_word:
+                    waiting.append(index)
+                else:
+                    self._accept(index)
+
+            if len(recent) > 4 * keep:
+                del recent[:-keep]
+
+        self.state = state
+
+    def boundary(self):
+        """Mark the end of a text; pending whole-word matches are counted"""
+        for index in self._waiting:
+            self._accept(index)
+        self._waiting.clear()
+        self._recent.clear()
+        self.state = 0
+
+    def result(self):
+        """KeywordMatch for everything fed so far"""
+        self.boundary()
+        score = sum(self.scores.values())
+        terms = tuple(self.matcher.terms[index][0] for index in self.scores)
+        return KeywordMatch(score, terms, priority_for(score))
+
+
+_matcher = None
+
+
+def get_matcher():
+    """Shared KeywordMatcher for PRIORITY_KEYWORDS"""
+    global _matcher
+    if _matcher is None:
+        _matcher = KeywordMatcher(parse_keywords(PRIORITY_KEYWORDS))
+    return _matcher
+
+
+def main():
+    """Command line interface"""
+    parser = argparse.ArgumentParser(description="Score files or text with the priority keywords")
+    parser.add_argument('files', nargs='*', help="Files to scan (name and contents)")
+    parser.add_argument('--text', help="Score this text instead")
+    args = parser.parse_args()
+
+    matcher = get_matcher()
+    if args.text is not None:
+        results = [("text", matcher.scan(args.text))]
+    else:
+        results = [(path, matcher.scan_file(path, prefix=Path(path).name)) for path in args.files]
+
+    for name, match in results:
+        print(f"{match.priority:<7} {match.score:>3}  {name}  {', '.join(match.terms) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Vault Log - Shared buffered logging for the AI Employee scripts
+Log lines are printed immediately and handed to one background writer
+thread per process, which appends them to the daily Logs/<prefix>_<date>.md
+files in batches, keeping each file open until the date rolls over.
+Optionally mirrors every entry as JSON lines for tooling.
+"""
+
+import os
+import json
+import queue
+import atexit
+import threading
+from datetime import datetime
+from pathlib import Path
+
+# Also write Logs/<prefix>_<date>.jsonl with one JSON object per entry
+LOG_JSONL = os.getenv('LOG_JSONL', 'false').lower() == 'true'
+
+# Minimum level printed to the console; files always get every entry
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()
+
+LEVELS = {'DEBUG': 10, 'INFO': 20, 'WARNING': 30, 'ERROR': 40, 'CRITICAL': 50}
+MAX_BATCH = 1000
+
+
+class LogWriter:
+    """
+    Background thread that appends queued log text to files
+
+    Whatever accumulates while one batch is being written goes out as the
+    next batch, so a burst of lines costs one write per file instead of an
+    open/stat/close per line.
+    """
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._files = {}           # stream key -> (path, open file)
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def _ensure_started(self):
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+                self._thread.start()
+                atexit.register(self.close)
+
+    def put(self, key, path, header, text):
+        """
+        Queue text for a file
+
+        Args:
+            key: Stream identity; a new path for the same key closes the old file
+            path: File to append to
+            header: Written first when the file is empty (or None)
+            text: Text to append
+        """
+        self._ensure_started()
+        self._queue.put((key, path, header, text))
+
+    def flush(self, timeout=5):
+        """Block until everything queued so far has been written"""
+        if self._thread is None:
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait(timeout)
+
+    def close(self):
+        """Write remaining entries and close every file"""
+        if self._thread is None or not self._thread.is_alive():
+            return
+        self._queue.put(None)
+        self._thread.join(timeout=5)
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            batch = [self._queue.get()]
+            while len(batch) < MAX_BATCH:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            pending = {}           # path -> [key, header, texts]
+            waiters = []
+            for item in batch:
+                if item is None:
+                    stopping = True
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    key, path, header, text = item
+                    pending.setdefault(path, [key, header, []])[2].append(text)
+
+            for path, (key, header, texts) in pending.items():
+                self._write(key, path, header, texts)
+
+            for waiter in waiters:
+                waiter.set()
+
+        for _, f in self._files.values():
+            f.close()
+        self._files.clear()
+
+    def _write(self, key, path, header, texts):
+        try:
+            current = self._files.get(key)
+            if current is None or current[0] != path:
+                # First write or the date rolled over
+                if current is not None:
+                    current[1].close()
+                f = open(path, 'a', encoding='utf-8')
+                self._files[key] = (path, f)
+                if header and f.tell() == 0:
+                    f.write(header)
+            f = self._files[key][1]
+            f.writelines(texts)
+            f.flush()
+        except Exception as e:
+            self._files.pop(key, None)
+            print(f"[ERROR] Failed to write to log file {path}: {e}")
+
+
+_writer = LogWriter()
+_loggers = {}
+_loggers_lock = threading.Lock()
+
+
+class VaultLogger:
+    """Daily markdown log (plus optional JSONL) for one component"""
+
+    def __init__(self, logs_dir, prefix, title, component=None, console=True, jsonl=LOG_JSONL):
+        """
+        Args:
+            logs_dir: Directory for the daily log files
+            prefix: File name prefix (Logs/<prefix>_<date>.md)
+            title: Heading written at the top of each daily file
+            component: Name recorded in JSONL entries (default: prefix)
+            console: Also print entries to stdout
+            jsonl: Also write Logs/<prefix>_<date>.jsonl
+        """
+        self.logs_dir = Path(logs_dir)
+        self.prefix = prefix
+        self.title = title
+        self.component = component or prefix
+        self.console = console
+        self.jsonl = jsonl
+        self.console_level = LEVELS.get(LOG_LEVEL, LEVELS['INFO'])
+
+    def _queue_markdown(self, log_date, text):
+        _writer.put(
+            (self.logs_dir, self.prefix, 'md'),
+            self.logs_dir / f"{self.prefix}_{log_date}.md",
+            f"# {self.title} - {log_date}\n\n",
+            text
+        )
+
+    def log(self, message, level="INFO", **fields):
+        """
+        Log a message with timestamp to console and file
+
+        Args:
+            message: The message to log
+            level: Log level (DEBUG, INFO, WARNING, ERROR)
+            **fields: Extra key/value context (e.g. correlation_id)
+        """
+        now = datetime.now()
+        log_entry = f"[{now.strftime('%Y-%m-%d %H:%M:%S')}] [{level}] {message}"
+        if fields:
+            log_entry += " " + " ".join(f"{k}={v}" for k, v in fields.items())
+
+        if self.console and LEVELS.get(level, LEVELS['INFO']) >= self.console_level:
+            print(log_entry)
+
+        log_date = now.strftime('%Y-%m-%d')
+        self._queue_markdown(log_date, log_entry + "\n")
+
+        if self.jsonl:
+            record = {
+                'ts': now.isoformat(timespec='milliseconds'),
+                'level': level,
+                'component': self.component,
+                'message': message,
+            }
+            record.update(fields)
+            _writer.put(
+                (self.logs_dir, self.prefix, 'jsonl'),
+                self.logs_dir / f"{self.prefix}_{log_date}.jsonl",
+                None,
+                json.dumps(record, ensure_ascii=False, default=str) + "\n"
+            )
+
+    def append(self, text):
+        """Append a raw markdown block to today's log file"""
+        self._queue_markdown(datetime.now().strftime('%Y-%m-%d'), text)
+
+    def flush(self, timeout=5):
+        """Wait until queued entries are on disk"""
+        _writer.flush(timeout)
+
+
+def get_logger(logs_dir, prefix, title, **kwargs):
+    """
+    Shared VaultLogger for a log file prefix
+
+    Args:
+        logs_dir: Directory for the daily log files
+        prefix: File name prefix, e.g. 'orchestrator'
+        title: Heading for each daily file, e.g. 'Orchestrator Log'
+        **kwargs: Passed to VaultLogger on first use
+
+    Returns:
+        VaultLogger
+    """
+    key = (str(logs_dir), prefix)
+    with _loggers_lock:
+        logger = _loggers.get(key)
+        if logger is None:
+            logger = _loggers[key] = VaultLogger(logs_dir, prefix, title, **kwargs)
+        return logger
+
+
+def flush_logs(timeout=5):
+    """Wait until every queued entry in this process is on disk"""
+    _writer.flush(timeout)
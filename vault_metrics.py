@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Vault Metrics - Prometheus-format metrics for the AI Employee pipeline
+The orchestrator serves /metrics on localhost; supervised watchers report
+their samples by printing marker lines that the orchestrator picks up from
+their stdout
+"""
+
+import os
+import math
+import asyncio
+import threading
+
+# Watchers only emit marker lines when started by the orchestrator
+METRICS_ENV = 'AI_EMPLOYEE_METRICS'
+METRIC_MARKER = '@metric '
+
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 900)
+POLL_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+    pairs = ",".join(f'{k}="{_escape(v)}"' for k, v in labels)
+    return "{" + pairs + "}"
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_value(value):
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Metric:
+    """Base class: a named metric family with labelled samples"""
+
+    kind = "untyped"
+
+    def __init__(self, name, help_text, labelnames=(), callback=None):
+        """
+        Args:
+            name: Metric name
+            help_text: HELP line
+            labelnames: Label names, in order
+            callback: Optional callable read at scrape time, returning a dict
+                      of label-value tuple -> value (or a plain number when
+                      there are no labels)
+        """
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self.callback = callback
+        self._lock = threading.Lock()
+        self._values = {}
+
+    def _key(self, labels):
+        return tuple((name, labels.get(name, "")) for name in self.labelnames)
+
+    def samples(self):
+        """List of (suffix, labels, value) tuples"""
+        if self.callback is None:
+            with self._lock:
+                return [("", key, value) for key, value in sorted(self._values.items())]
+
+        values = self.callback()
+        if not isinstance(values, dict):
+            return [("", (), values)]
+        return [("", tuple(zip(self.labelnames, key)), value) for key, value in sorted(values.items())]
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.kind}"]
+        for suffix, labels, value in self.samples():
+            lines.append(f"{self.name}{suffix}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines)
+
+
+class Counter(Metric):
+    """Monotonically increasing value"""
+
+    kind = "counter"
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(Metric):
+    """Point-in-time value"""
+
+    kind = "gauge"
+
+    def set(self, value, **labels):
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+
+class Histogram(Metric):
+    """Cumulative bucketed observations"""
+
+    kind = "histogram"
+
+    def __init__(self, name, help_text, labelnames=(), buckets=LATENCY_BUCKETS):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        self._series = {}  # key -> [bucket counts..., sum, count]
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0] * len(self.buckets) + [0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+                    break
+            series[-2] += value
+            series[-1] += 1
+
+    def samples(self):
+        out = []
+        with self._lock:
+            for key, series in sorted(self._series.items()):
+                cumulative = 0
+                for bound, count in zip(self.buckets, series):
+                    cumulative += count
+                    out.append(("_bucket", key + (("le", _format_value(bound)),), cumulative))
+                out.append(("_sum", key, series[-2]))
+                out.append(("_count", key, series[-1]))
+        return out
+
+
+class Registry:
+    """Collection of metrics rendered together"""
+
+    def __init__(self):
+        self.metrics = []
+
+    def register(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def counter(self, *args, **kwargs):
+        return self.register(Counter(*args, **kwargs))
+
+    def gauge(self, *args, **kwargs):
+        return self.register(Gauge(*args, **kwargs))
+
+    def histogram(self, *args, **kwargs):
+        return self.register(Histogram(*args, **kwargs))
+
+    def get(self, name):
+        for metric in self.metrics:
+            if metric.name == name:
+                return metric
+        return None
+
+    def render(self):
+        """Prometheus text exposition format"""
+        return "\n".join(metric.render() for metric in self.metrics) + "\n"
+
+
+async def _handle_request(registry, reader, writer):
+    """Minimal HTTP/1.0 handler: GET /metrics only"""
+    try:
+        request = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), timeout=5)
+        parts = request.split(b' ', 2)
+        path = parts[1].decode('latin-1') if len(parts) > 1 else ''
+
+        if parts[0] == b'GET' and path.split('?')[0] == '/metrics':
+            body = registry.render().encode('utf-8')
+            status = b'200 OK'
+            content_type = b'text/plain; version=0.0.4; charset=utf-8'
+        else:
+            body = b'Not Found\n'
+            status = b'404 Not Found'
+            content_type = b'text/plain'
+
+        writer.write(b'HTTP/1.0 ' + status + b'\r\nContent-Type: ' + content_type +
+                     b'\r\nContent-Length: ' + str(len(body)).encode() + b'\r\n\r\n' + body)
+        await writer.drain()
+    except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, asyncio.TimeoutError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+async def start_metrics_server(registry, port, host='127.0.0.1'):
+    """
+    Serve the registry at http://host:port/metrics on the running loop
+
+    Returns:
+        asyncio.Server (close() it on shutdown)
+    """
+    return await asyncio.start_server(
+        lambda r, w: _handle_request(registry, r, w), host, port)
+
+
+def report_metric(name, value):
+    """
+    Report a sample from a supervised watcher process
+
+    Prints a marker line the orchestrator turns into a metric observation.
+    Does nothing when the watcher runs standalone.
+    """
+    if os.getenv(METRICS_ENV) == '1':
+        print(f"{METRIC_MARKER}{name} {value}", flush=True)
+
+
+def parse_metric_line(line):
+    """
+    Parse a marker line printed by report_metric
+
+    Returns:
+        (name, value) or None if the line is not a metric marker
+    """
+    if not line.startswith(METRIC_MARKER):
+        return None
+    try:
+        name, value = line[len(METRIC_MARKER):].split()
+        return name, float(value)
+    except ValueError:
+        return None
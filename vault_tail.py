@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+Vault Tail - One chronological view of every component log
+Merges the daily logs of all components by timestamp (a streaming k-way
+merge holding one entry per log), then optionally follows them as they
+grow.
+
+Usage:
+    python vault_tail.py -f
+    python vault_tail.py -c gmail -c orchestrator -l WARNING --since 2026-02-20
+    python vault_tail.py -f -x 19ca07dfd9628f96 -x EMAIL_REPLY_20260227
+"""
+
+import os
+import re
+import sys
+import heapq
+import argparse
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from dotenv import load_dotenv
+
+from log_index import parse_line, SKIP_COMPONENTS
+from log_archive import iter_log_lines, parse_daily_log_name, archive_dir, range_end, ARCHIVE_RE
+from vault_log import LEVELS
+from vault_watch import DirectoryWatcher
+
+# Load environment variables
+load_dotenv()
+
+# Configuration
+VAULT_PATH = Path(os.getenv('VAULT_PATH', '.'))
+LOGS_DIR = VAULT_PATH / 'Logs'
+
+# Follow mode: fallback poll interval, and how long the newest entry of a
+# log is held back waiting for continuation lines
+FOLLOW_INTERVAL = 1.0
+FOLLOW_DEBOUNCE = 0.05
+HOLD_TIME = 0.25
+
+# "# Gmail Watcher Log - 2026-02-26" starts each daily file
+HEADER_RE = re.compile(r'^# .* - (\d{4}-\d{2}-\d{2})\s*$')
+
+
+class Entry:
+    """One log entry with any continuation lines"""
+
+    __slots__ = ('ts', 'component', 'level', 'lines')
+
+    def __init__(self, ts, component, level, message):
+        self.ts = ts
+        self.component = component
+        self.level = level
+        self.lines = [message]
+
+    def text(self):
+        return "\n".join(self.lines)
+
+    def format(self):
+        first = f"[{self.ts}] [{self.component}] [{self.level}] {self.lines[0]}"
+        return "\n".join([first] + [f"    {line}" for line in self.lines[1:]])
+
+
+def parse_entries(lines, component, log_date=None):
+    """
+    Group log lines into entries
+
+    Args:
+        lines: Iterable of lines without line endings
+        component: Component name for the entries
+        log_date: Date for entries that only carry a time; updated from
+                  each daily file header
+
+    Yields:
+        Entry objects, oldest first
+    """
+    current = None
+    for line in lines:
+        header = HEADER_RE.match(line)
+        if header:
+            log_date = header.group(1)
+            continue
+
+        parsed = parse_line(line, log_date)
+        if parsed is None:
+            if current is not None and line.strip() and line.strip() != '---':
+                current.lines.append(line)
+            continue
+
+        if current is not None:
+            yield current
+        current = Entry(parsed[0], component, parsed[1], parsed[2])
+
+    if current is not None:
+        yield current
+
+
+class EntryFilter:
+    """Component, level and correlation-ID filters"""
+
+    def __init__(self, components=None, level=None, correlation_ids=None):
+        self.components = set(components or [])
+        self.min_level = LEVELS.get(level.upper(), 0) if level else 0
+        self.correlation_ids = list(correlation_ids or [])
+
+    def wants_component(self, component):
+        if self.components:
+            return component in self.components
+        return component not in SKIP_COMPONENTS
+
+    def __call__(self, entry):
+        if self.min_level and LEVELS.get(entry.level, LEVELS['INFO']) < self.min_level:
+            return False
+        if self.correlation_ids:
+            text = entry.text()
+            return any(cid in text for cid in self.correlation_ids)
+        return True
+
+
+def components_in_range(logs_dir, since, until):
+    """Components with a daily log or archive overlapping the date range"""
+    found = set()
+    for path in Path(logs_dir).glob('*.md'):
+        parsed = parse_daily_log_name(path.name)
+        if parsed and since[:10] <= parsed[1] <= until[:10]:
+            found.add(parsed[0])
+
+    target = archive_dir(logs_dir)
+    if target.exists():
+        for path in target.glob('*.md.gz'):
+            match = ARCHIVE_RE.match(path.name)
+            if match and since[:7] <= match.group('month') <= until[:7]:
+                found.add(match.group('component'))
+    return found
+
+
+def merged_entries(logs_dir, since, until, entry_filter, offsets=None):
+    """
+    Entries from every selected component in timestamp order
+
+    Each component is read as a stream (archives first, then live daily
+    files) and the streams are merged lazily, so memory stays bounded by
+    the number of components rather than the size of the backlog. Once
+    exhausted, offsets holds where each daily file was read up to.
+    """
+    streams = []
+    for component in sorted(components_in_range(logs_dir, since, until)):
+        if not entry_filter.wants_component(component):
+            continue
+        lines = iter_log_lines(component, since, until, logs_dir=logs_dir, offsets=offsets)
+        streams.append(parse_entries(lines, component))
+
+    until = range_end(until)
+    for entry in heapq.merge(*streams, key=lambda e: e.ts):
+        if since <= entry.ts <= until and entry_filter(entry):
+            yield entry
+
+
+class FollowedFile:
+    """A live daily log read incrementally in follow mode"""
+
+    def __init__(self, path, component, log_date, offset):
+        self.path = path
+        self.component = component
+        self.log_date = log_date
+        self.offset = offset
+        self.partial = b''
+        self.pending = None        # last entry, held for continuation lines
+
+    def read(self):
+        """
+        Parse newly appended lines
+
+        Returns:
+            Completed entries; the newest one is held back until the next
+            entry starts or the file goes quiet
+        """
+        try:
+            with open(self.path, 'rb') as f:
+                f.seek(self.offset)
+                data = f.read()
+        except OSError:
+            return []
+
+        if not data:
+            # Quiet: release the held entry
+            entry, self.pending = self.pending, None
+            return [entry] if entry else []
+
+        self.offset += len(data)
+        data = self.partial + data
+        end = data.rfind(b'\n') + 1
+        self.partial = data[end:]
+        lines = data[:end].decode('utf-8', errors='replace').splitlines()
+
+        done = []
+        for line in lines:
+            parsed = None if HEADER_RE.match(line) else parse_line(line, self.log_date)
+            if parsed is None:
+                if self.pending is not None and line.strip() and line.strip() != '---':
+                    self.pending.lines.append(line)
+                continue
+            if self.pending is not None:
+                done.append(self.pending)
+            self.pending = Entry(parsed[0], self.component, parsed[1], parsed[2])
+        return done
+
+
+def follow(logs_dir, entry_filter, start_offsets, out):
+    """
+    Print entries as they are appended to today's logs
+
+    Args:
+        logs_dir: Folder with the daily logs
+        entry_filter: EntryFilter
+        start_offsets: {path: offset} already printed from the backlog
+        out: Output stream
+    """
+    logs_dir = Path(logs_dir)
+    followed = {}
+    watcher = DirectoryWatcher(logs_dir, pattern='*.md', debounce=FOLLOW_DEBOUNCE,
+                               poll_interval=FOLLOW_INTERVAL)
+
+    try:
+        while True:
+            today = datetime.now().strftime('%Y-%m-%d')
+
+            # Pick up new components and the next day's files
+            for path in logs_dir.glob(f"*{today}.md"):
+                parsed = parse_daily_log_name(path.name)
+                if path in followed or parsed is None or not entry_filter.wants_component(parsed[0]):
+                    continue
+                followed[path] = FollowedFile(path, parsed[0], parsed[1], start_offsets.get(path, 0))
+
+            batch = []
+            for path, state in list(followed.items()):
+                batch.extend(state.read())
+                if state.log_date != today and state.pending is None:
+                    del followed[path]
+
+            # Each round is small: order it across components
+            batch.sort(key=lambda e: e.ts)
+            for entry in batch:
+                if entry_filter(entry):
+                    out.write(entry.format() + "\n")
+            out.flush()
+
+            holding = any(state.pending is not None for state in followed.values())
+            watcher.wait(HOLD_TIME if holding else FOLLOW_INTERVAL)
+    finally:
+        watcher.close()
+
+
+def main():
+    """Command line interface"""
+    parser = argparse.ArgumentParser(description="Merged chronological tail of all vault logs")
+    parser.add_argument('-f', '--follow', action='store_true', help="Keep printing new entries")
+    parser.add_argument('-n', '--lines', type=int, default=20,
+                        help="Backlog entries to show (default 20, -1 for all)")
+    parser.add_argument('-c', '--component', action='append',
+                        help="Only this component (repeatable), e.g. gmail")
+    parser.add_argument('-l', '--level', help="Minimum level, e.g. WARNING")
+    parser.add_argument('-x', '--correlation-id', action='append',
+                        help="Only entries mentioning this ID, message ID or file name (repeatable)")
+    parser.add_argument('--since', help="Backlog from this date or timestamp (default: today)")
+    parser.add_argument('--until', help="Backlog up to this date or timestamp")
+    args = parser.parse_args()
+
+    now = datetime.now()
+    today = now.strftime('%Y-%m-%d')
+    since = args.since or today
+    # Follow mode resumes exactly where the backlog read stopped, so the
+    # backlog takes everything read; otherwise later entries are cut off
+    until = args.until or (today if args.follow else now.strftime('%Y-%m-%d %H:%M:%S'))
+    entry_filter = EntryFilter(args.component, args.level, args.correlation_id)
+    out = sys.stdout
+
+    # Filled by the backlog read with where each daily file was read up to
+    start_offsets = {}
+
+    try:
+        if args.lines != 0 or args.follow:
+            # With -n 0 the backlog is still read, for follow mode's offsets
+            entries = merged_entries(LOGS_DIR, since, until, entry_filter, start_offsets)
+            if args.lines >= 0:
+                entries = deque(entries, maxlen=args.lines)
+            for entry in entries:
+                out.write(entry.format() + "\n")
+            out.flush()
+
+        if args.follow:
+            follow(LOGS_DIR, entry_filter, start_offsets, out)
+    except KeyboardInterrupt:
+        pass
+    except BrokenPipeError:
+        sys.stderr.close()
+
+
+if __name__ == "__main__":
+    main()
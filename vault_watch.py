@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+"""
+Vault Watch - Event-driven directory watching for the AI Employee vault
+Uses Linux inotify (via ctypes) when available and falls back to polling
+"""
+
+import os
+import time
+import errno
+import fnmatch
+import select
+import struct
+import ctypes
+import ctypes.util
+from pathlib import Path
+
+# inotify event masks (see inotify(7))
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+
+WATCH_MASK = (IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO |
+              IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF)
+
+_EVENT_HEADER = struct.Struct('iIII')
+_READ_SIZE = 64 * 1024
+
+
+def _load_inotify():
+    """Return libc with inotify symbols, or None when unsupported"""
+    if not hasattr(os, 'O_CLOEXEC'):
+        return None
+
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or None, use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+
+_libc = _load_inotify()
+
+
+def inotify_available():
+    """Check whether this platform supports inotify"""
+    return _libc is not None
+
+
+class DirectoryWatcher:
+    """
+    Watch a directory for new, fully written files
+
+    Files are reported once they are complete: after an IN_CLOSE_WRITE or
+    IN_MOVED_TO event, the file must go `debounce` seconds without further
+    writes, and either keep the same size across two stats or have an mtime
+    at least `debounce` seconds old. Without inotify the directory is
+    rescanned every `poll_interval` seconds instead.
+
+    With recursive=True every non-hidden subdirectory gets its own watch,
+    added as soon as the subdirectory appears.
+    """
+
+    def __init__(self, directory, pattern='*', debounce=0.2, poll_interval=30.0,
+                 use_inotify=True, on_removed=None, recursive=False):
+        """
+        Args:
+            directory: Directory to watch
+            pattern: fnmatch pattern for file names (e.g. '*.md')
+            debounce: Seconds a file must stay unchanged before it is reported
+            poll_interval: Rescan interval in polling mode
+            use_inotify: Set False to force the polling fallback
+            on_removed: Optional callback(path) for files deleted or moved out
+            recursive: Also watch files in subdirectories
+        """
+        self.directory = Path(directory)
+        self.pattern = pattern
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.on_removed = on_removed
+        self.recursive = recursive
+
+        self._pending = {}  # path -> (last size, deadline)
+        self._known = {}    # path -> (size, mtime) as of last poll
+        self._next_poll = 0.0
+        self._inotify_fd = None
+        self._watches = {}  # wd -> directory
+
+        # Self-pipe so another thread can interrupt a blocking wait()
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        os.set_blocking(self._wake_w, False)
+
+        if use_inotify and _libc is not None:
+            self._start_inotify()
+
+        # Anything already sitting in the directory counts as new (and complete)
+        self.rescan(settle=False)
+
+    @property
+    def using_inotify(self):
+        """True when events come from inotify rather than polling"""
+        return self._inotify_fd is not None
+
+    @property
+    def mode(self):
+        """Human readable watch mode for log messages"""
+        return "inotify" if self.using_inotify else f"polling every {self.poll_interval}s"
+
+    def fileno(self):
+        """File descriptor that becomes readable when events arrive"""
+        return self._inotify_fd if self._inotify_fd is not None else self._wake_r
+
+    def _start_inotify(self):
+        """Create the inotify instance and watch the directory"""
+        fd = _libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            return
+
+        self._inotify_fd = fd
+        if not self.add_directory(self.directory):
+            os.close(fd)
+            self._inotify_fd = None
+
+    def add_directory(self, directory):
+        """
+        Add an inotify watch for a directory
+
+        Returns:
+            True if the watch was added, False otherwise
+        """
+        if self._inotify_fd is None:
+            return False
+
+        wd = _libc.inotify_add_watch(self._inotify_fd, os.fsencode(str(directory)), WATCH_MASK)
+        if wd < 0:
+            return False
+
+        self._watches[wd] = Path(directory)
+        return True
+
+    def _scan(self, directory, seen):
+        """Collect matching files under directory into seen (recursing if enabled)"""
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if self.recursive and entry.is_dir(follow_symlinks=False):
+                            if not entry.name.startswith('.'):
+                                if self.using_inotify:
+                                    self.add_directory(entry.path)
+                                self._scan(entry.path, seen)
+                            continue
+                        if not self._matches(entry.name) or not entry.is_file():
+                            continue
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    seen[Path(entry.path)] = (st.st_size, st.st_mtime)
+        except (FileNotFoundError, NotADirectoryError):
+            pass
+
+    def _matches(self, name):
+        """Skip hidden/temporary files and apply the name pattern"""
+        if name.startswith('.') or name.endswith('~'):
+            return False
+        return fnmatch.fnmatch(name, self.pattern)
+
+    def _mark_pending(self, path, size=None, delay=None):
+        """(Re)start the debounce timer for a path"""
+        delay = self.debounce if delay is None else delay
+        self._pending[path] = (size, time.monotonic() + delay)
+
+    def _mark_removed(self, path):
+        """Forget a path that left the directory"""
+        self._pending.pop(path, None)
+        existed = self._known.pop(path, None) is not None
+        if existed and self.on_removed:
+            self.on_removed(path)
+
+    def rescan(self, settle=True):
+        """
+        Full directory scan; used at startup, on overflow and when polling
+
+        Args:
+            settle: Debounce new files (False reports them on the next collect)
+        """
+        seen = {}
+        self._scan(self.directory, seen)
+
+        for path, signature in seen.items():
+            if self._known.get(path) != signature and path not in self._pending:
+                self._mark_pending(path, signature[0], None if settle else 0)
+
+        for path in list(self._known):
+            if path not in seen:
+                self._mark_removed(path)
+
+        self._next_poll = time.monotonic() + self.poll_interval
+
+    def _read_inotify(self):
+        """Drain the inotify fd and update pending state"""
+        try:
+            data = os.read(self._inotify_fd, _READ_SIZE)
+        except OSError as e:
+            if e.errno in (errno.EAGAIN, errno.EINTR):
+                return
+            raise
+
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b'\0')
+            offset += length
+
+            if mask & IN_Q_OVERFLOW:
+                self.rescan()
+                continue
+
+            if mask & IN_IGNORED:
+                self._watches.pop(wd, None)
+                continue
+
+            directory = self._watches.get(wd)
+            if directory is None or not name:
+                continue
+
+            self._handle_event(directory / os.fsdecode(name), mask)
+
+    def _handle_event(self, path, mask):
+        """React to a single inotify event"""
+        if mask & IN_ISDIR:
+            if self.recursive and not path.name.startswith('.'):
+                self._handle_directory(path, mask)
+            return
+        if not self._matches(path.name):
+            return
+
+        if mask & (IN_DELETE | IN_MOVED_FROM):
+            self._mark_removed(path)
+        elif mask & (IN_CLOSE_WRITE | IN_MOVED_TO | IN_MODIFY | IN_CREATE):
+            # Any write pushes the deadline back; size is checked at expiry
+            self._mark_pending(path)
+
+    def _handle_directory(self, path, mask):
+        """Watch subdirectories that appear; forget files under ones that leave"""
+        if mask & (IN_CREATE | IN_MOVED_TO):
+            # Files may have landed before the watch existed
+            self.add_directory(path)
+            found = {}
+            self._scan(path, found)
+            for file_path in found:
+                if file_path not in self._known:
+                    self._mark_pending(file_path)
+        elif mask & (IN_DELETE | IN_MOVED_FROM):
+            # A moved-away directory is still watched at its new location
+            for wd, directory in list(self._watches.items()):
+                if directory == path or path in directory.parents:
+                    _libc.inotify_rm_watch(self._inotify_fd, wd)
+                    del self._watches[wd]
+            for file_path in [p for p in set(self._known) | set(self._pending) if path in p.parents]:
+                self._mark_removed(file_path)
+
+    def retry(self, path, delay):
+        """Report a file again after `delay` seconds (e.g. when processing failed)"""
+        path = Path(path)
+        self._known.pop(path, None)
+        self._pending[path] = (None, time.monotonic() + delay)
+
+    def read_events(self):
+        """
+        Consume whatever is available without blocking
+
+        Drains the inotify fd, or rescans the directory when a poll is due.
+        Call collect_ready() afterwards to get completed files.
+        """
+        if self.using_inotify:
+            self._read_inotify()
+        elif time.monotonic() >= self._next_poll:
+            self.rescan()
+
+    def collect_ready(self, settle=True):
+        """
+        Return pending files whose debounce expired and that are quiet
+
+        Args:
+            settle: Wait out debounce deadlines (False checks quietness now,
+                    for callers that sync on demand rather than on events)
+        """
+        now = time.monotonic()
+        ready = []
+
+        for path, (size, deadline) in list(self._pending.items()):
+            if settle and deadline > now:
+                continue
+
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                self._pending.pop(path, None)
+                continue
+
+            quiet = time.time() - st.st_mtime >= self.debounce
+            if size != st.st_size and not quiet:
+                # Still growing (or never sized) - check again after debounce
+                self._mark_pending(path, st.st_size)
+                continue
+
+            del self._pending[path]
+            self._known[path] = (st.st_size, st.st_mtime)
+            ready.append(path)
+
+        return sorted(ready)
+
+    def next_timeout(self, deadline=None):
+        """Seconds until the next pending deadline, poll, or caller deadline"""
+        candidates = [d for _, d in self._pending.values()]
+        if not self.using_inotify:
+            candidates.append(self._next_poll)
+        if deadline is not None:
+            candidates.append(deadline)
+        if not candidates:
+            return None
+        return max(0.0, min(candidates) - time.monotonic())
+
+    def wait(self, timeout=None):
+        """
+        Block until files are ready, the timeout expires, or wakeup() is called
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            Sorted list of Paths that are complete and ready to process
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            ready = self.collect_ready()
+            if ready:
+                return ready
+
+            if deadline is not None and time.monotonic() >= deadline:
+                return []
+
+            if not self.using_inotify and time.monotonic() >= self._next_poll:
+                self.read_events()
+                continue
+
+            fds = [self._wake_r]
+            if self.using_inotify:
+                fds.append(self._inotify_fd)
+
+            try:
+                readable, _, _ = select.select(fds, [], [], self.next_timeout(deadline))
+            except InterruptedError:
+                continue
+
+            if self._wake_r in readable:
+                try:
+                    while os.read(self._wake_r, 512):
+                        pass
+                except BlockingIOError:
+                    pass
+                return self.collect_ready()
+
+            if self._inotify_fd is not None and self._inotify_fd in readable:
+                self._read_inotify()
+
+    def wakeup(self):
+        """Interrupt a blocking wait() from another thread or a signal handler"""
+        try:
+            os.write(self._wake_w, b'\0')
+        except (BlockingIOError, OSError):
+            pass
+
+    def close(self):
+        """Release the inotify instance and wakeup pipe"""
+        if self._inotify_fd is not None:
+            os.close(self._inotify_fd)
+            self._inotify_fd = None
+        for fd in (self._wake_r, self._wake_w):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self._watches.clear()
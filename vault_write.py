@@ -0,0 +1,414 @@
+#!/usr/bin/env python3
+"""
+Vault Write - Crash-safe file writes for the vault
+Content goes to a hidden temp file in the target folder and is renamed
+into place, so readers (the approval monitor, the watchers, Claude) see
+either the old file or the complete new one, never a partial write.
+
+Durability is group-committed: writes that arrive while another commit
+is syncing share the next commit, and writes made inside batch() are
+committed together when the block exits. A large group is made durable
+with one syncfs() per filesystem it touches instead of one fsync per
+file; only the vault's own filesystems are flushed, never the whole host.
+
+move_file() renames within a filesystem and, across filesystems (e.g. a
+mounted drop share as Inbox/), copies in the kernel, verifies a checksum
+and only then renames the copy into place and removes the source. Moves
+never replace an existing file: the destination is claimed with a hard
+link, which fails if the name is taken.
+"""
+
+import os
+import errno
+import ctypes
+import mmap
+import shutil
+import hashlib
+import itertools
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+# false keeps writes atomic but skips fsync (e.g. on a throwaway vault)
+VAULT_FSYNC = os.getenv('VAULT_FSYNC', 'true').lower() == 'true'
+
+# Groups at least this large are flushed with one syncfs() per filesystem
+GROUP_SYNC_THRESHOLD = int(os.getenv('VAULT_GROUP_SYNC_THRESHOLD', 16))
+
+# Bytes per copy_file_range()/sendfile() call when moving across filesystems
+COPY_CHUNK = 64 * 1024 * 1024
+
+_counter = itertools.count()
+_libc = None
+
+
+class PendingWrite:
+    """A temp file waiting to be committed to its final path"""
+
+    __slots__ = ('path', 'temp', 'on_commit', 'done', 'error')
+
+    def __init__(self, path, temp, on_commit):
+        self.path = path
+        self.temp = temp
+        self.on_commit = on_commit
+        self.done = False
+        self.error = None
+
+
+def _temp_path(path):
+    """Hidden temp file next to path (skipped by the vault watchers)"""
+    return path.with_name(f".{path.name}.{os.getpid()}.{next(_counter)}.tmp")
+
+
+def _fsync_path(path, directory=False):
+    fd = os.open(path, os.O_RDONLY | (os.O_DIRECTORY if directory else 0))
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _syncfs(directory):
+    """
+    Flush the filesystem holding directory with syncfs(2)
+
+    Returns:
+        False where syncfs() is unavailable (non-Linux libc)
+
+    Raises:
+        OSError if the flush fails
+    """
+    global _libc
+    if _libc is None:
+        try:
+            _libc = ctypes.CDLL(None, use_errno=True)
+        except OSError:
+            _libc = False
+    syncfs = getattr(_libc, 'syncfs', None) if _libc else None
+    if syncfs is None:
+        return False
+
+    fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        if syncfs(fd) != 0:
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error), str(directory))
+    finally:
+        os.close(fd)
+    return True
+
+
+class VaultWriter:
+    """
+    Atomic writer with group commit
+
+    write() stages the content in a temp file. Outside batch() the caller
+    then joins the current commit group: the first waiting thread becomes
+    the leader and commits everything staged so far - data synced, temp
+    files renamed, each folder synced once - while later writers queue up
+    for the next group.
+    """
+
+    def __init__(self, fsync=VAULT_FSYNC, group_threshold=GROUP_SYNC_THRESHOLD, log=print):
+        """
+        Args:
+            fsync: Make commits durable, not only atomic
+            group_threshold: Group size from which one syncfs() per
+                             filesystem replaces per-file fsyncs
+            log: Logging function taking (message, level) for failed
+                 on_commit callbacks, or None
+        """
+        self.fsync = fsync
+        self.group_threshold = group_threshold
+        self.log = log
+        self._pending = []
+        self._pending_lock = threading.Lock()
+        self._commit_lock = threading.Lock()
+        self._local = threading.local()
+
+    def write(self, path, content, encoding='utf-8', on_commit=None):
+        """
+        Atomically replace a file's content
+
+        Args:
+            path: Final file path
+            content: str (encoded with `encoding`) or bytes
+            encoding: Text encoding
+            on_commit: Called with the path once the file is in place
+
+        Returns:
+            The path. Inside batch() the file appears when the block exits.
+
+        Raises:
+            OSError if the temp file cannot be written or the commit fails
+        """
+        path = Path(path)
+        temp = _temp_path(path)
+        data = content.encode(encoding) if isinstance(content, str) else content
+
+        try:
+            with open(temp, 'wb') as f:
+                f.write(data)
+        except OSError:
+            temp.unlink(missing_ok=True)
+            raise
+
+        entry = PendingWrite(path, temp, on_commit)
+        batch = getattr(self._local, 'batch', None)
+        if batch is not None:
+            batch.append(entry)
+            return path
+
+        with self._pending_lock:
+            self._pending.append(entry)
+        self._join_commit(entry)
+        if entry.error is not None:
+            raise entry.error
+        return path
+
+    def _join_commit(self, entry):
+        with self._commit_lock:
+            if entry.done:
+                return  # a previous leader committed it
+            with self._pending_lock:
+                group, self._pending = self._pending, []
+            self._commit(group)
+
+    def _sync_group(self, group):
+        """syncfs() each filesystem the group was staged on; False to fall back to fsync"""
+        filesystems = {}
+        try:
+            for entry in group:
+                filesystems.setdefault(os.stat(entry.temp.parent).st_dev, entry.temp.parent)
+            return all([_syncfs(directory) for directory in filesystems.values()])
+        except OSError:
+            return False
+
+    def _commit(self, group):
+        """Sync, rename and sync the folders for a group of staged writes"""
+        if self.fsync:
+            if len(group) < self.group_threshold or not self._sync_group(group):
+                for entry in group:
+                    try:
+                        _fsync_path(entry.temp)
+                    except OSError as e:
+                        entry.error = e
+
+        directories = set()
+        for entry in group:
+            if entry.error is None:
+                try:
+                    os.replace(entry.temp, entry.path)
+                    directories.add(entry.path.parent)
+                except OSError as e:
+                    entry.error = e
+            if entry.error is not None:
+                entry.temp.unlink(missing_ok=True)
+
+        if self.fsync:
+            for directory in directories:
+                try:
+                    _fsync_path(directory, directory=True)
+                except OSError:
+                    pass  # not supported everywhere; the rename itself succeeded
+
+        # Every entry is marked done first: the files are in place, and a
+        # failing callback must not strand the rest of the group
+        for entry in group:
+            entry.done = True
+        for entry in group:
+            if entry.error is None and entry.on_commit is not None:
+                try:
+                    entry.on_commit(entry.path)
+                except Exception as e:
+                    if self.log is not None:
+                        self.log(f"After writing {entry.path.name}: {e}", "ERROR")
+
+    @contextmanager
+    def batch(self):
+        """
+        Defer commits on this thread until the block exits
+
+        Everything written in the block becomes durable in one commit.
+        Nested blocks join the outermost one.
+
+        Raises:
+            OSError on exit if any write in the batch failed to commit
+        """
+        if getattr(self._local, 'batch', None) is not None:
+            yield
+            return
+
+        self._local.batch = group = []
+        try:
+            yield
+        finally:
+            self._local.batch = None
+            if group:
+                with self._commit_lock:
+                    self._commit(group)
+
+        errors = [entry.error for entry in group if entry.error is not None]
+        if errors:
+            raise errors[0]
+
+
+_writer = VaultWriter()
+
+
+def write_file(path, content, encoding='utf-8', on_commit=None):
+    """
+    Atomically write a vault file with the shared writer
+
+    Args:
+        path: Final file path
+        content: str or bytes
+        encoding: Text encoding
+        on_commit: Called with the path once the file is in place
+
+    Returns:
+        The path
+    """
+    return _writer.write(path, content, encoding, on_commit)
+
+
+def batch():
+    """Group the writes of a burst into one commit (context manager)"""
+    return _writer.batch()
+
+
+def _copy_range(src_fd, dst_fd, size):
+    """Copy size bytes in the kernel: copy_file_range, else sendfile"""
+    copied = 0
+    use_range = hasattr(os, 'copy_file_range')
+    while copied < size:
+        count = min(COPY_CHUNK, size - copied)
+        if use_range:
+            try:
+                sent = os.copy_file_range(src_fd, dst_fd, count)
+            except OSError as e:
+                # Not supported between these filesystems: use sendfile
+                if e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EOPNOTSUPP, errno.EINVAL):
+                    raise
+                use_range = False
+                continue
+        else:
+            # Reads at an explicit offset, writes at the target's position
+            sent = os.sendfile(dst_fd, src_fd, copied, count)
+        if sent == 0:
+            raise OSError(errno.EIO, "Source file shrank while being moved")
+        copied += sent
+
+
+def file_digest(path):
+    """BLAKE2b digest of a file, hashed straight from an mmap of it"""
+    digest = hashlib.blake2b()
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                digest.update(mapped)
+    return digest.hexdigest()
+
+
+def _remove_source(src, dst, log=None):
+    """
+    Remove a moved file's source once dst is in place
+
+    The move has already succeeded, so a source that cannot be removed
+    (read-only or busy mount, no permission) is reported, not raised:
+    raising would have the caller retry and create another copy.
+    """
+    try:
+        Path(src).unlink(missing_ok=True)
+    except OSError as e:
+        if log is not None:
+            log(f"Moved {Path(src).name} to {dst} but could not remove the source: {e}", "WARNING")
+
+
+def rename_no_replace(src, dst, log=None):
+    """
+    Rename src to dst, failing instead of replacing an existing dst
+
+    The new name is claimed with link(), which is atomic and refuses an
+    existing target, and the old name is then removed. Filesystems without
+    hard links fall back to a checked rename. Once dst exists the rename
+    counts as done, even if the old name could not be removed.
+
+    Args:
+        src: File to rename
+        dst: New path, which must not exist
+        log: Logging function taking (message, level), or None
+
+    Raises:
+        FileExistsError if dst exists; OSError (EXDEV across filesystems)
+        if the rename fails
+    """
+    try:
+        os.link(src, dst, follow_symlinks=False)
+    except OSError as e:
+        if e.errno not in (errno.EPERM, errno.ENOTSUP, errno.EOPNOTSUPP, errno.EMLINK):
+            raise
+        if os.path.lexists(dst):
+            raise FileExistsError(errno.EEXIST, "File exists", str(dst)) from None
+        os.rename(src, dst)
+        return
+    _remove_source(src, dst, log)
+
+
+def move_file(src, dst, fsync=VAULT_FSYNC, log=None):
+    """
+    Move a file, also across filesystems
+
+    A plain rename when possible. On EXDEV the data is copied in the kernel
+    (copy_file_range, or sendfile where that is unsupported) to a hidden
+    temp file next to dst, checked against the source's checksum, synced,
+    and renamed into place; the source is removed last. A failed or
+    mismatched copy leaves the source untouched. Timestamps and mode are
+    preserved, so arrival order survives the move. Once dst is in place
+    the move has succeeded: a source that cannot be removed is logged and
+    left behind.
+
+    Args:
+        src: File to move
+        dst: Destination path, which must not exist
+        fsync: Make the copy durable before the source is removed
+        log: Logging function taking (message, level), or None
+
+    Returns:
+        dst as a Path
+
+    Raises:
+        FileExistsError if dst exists; OSError if the move fails or the
+        copy does not match the source
+    """
+    src, dst = Path(src), Path(dst)
+    try:
+        rename_no_replace(src, dst, log)
+        return dst
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+
+    temp = _temp_path(dst)
+    try:
+        with open(src, 'rb') as source, open(temp, 'wb') as target:
+            size = os.fstat(source.fileno()).st_size
+            _copy_range(source.fileno(), target.fileno(), size)
+            if fsync:
+                os.fsync(target.fileno())
+
+        if file_digest(src) != file_digest(temp):
+            raise OSError(errno.EIO, f"Checksum mismatch moving {src.name}")
+        shutil.copystat(src, temp)
+        rename_no_replace(temp, dst, log)
+    except BaseException:
+        temp.unlink(missing_ok=True)
+        raise
+
+    if fsync:
+        try:
+            _fsync_path(dst.parent, directory=True)
+        except OSError:
+            pass
+    _remove_source(src, dst, log)
+    return dst
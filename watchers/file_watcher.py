@@ -2,86 +2,347 @@
 """
 File Watcher for AI Employee Vault
 Monitors Inbox/ folder and creates tasks in Needs_Action/
+Reacts to inotify events as files land, and only picks a file up once it
+has stopped changing, so large copies are never moved half-written.
+Large drops are ingested in batches on a thread pool. Subfolders of
+Inbox/ are watched too and routed by the rules in inbox_routes.json.
 """
 
 import os
-import time
+import sys
 import json
+import itertools
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+# Shared vault modules live in the vault root
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from vault_log import get_logger
+from vault_catalog import get_catalog
+from vault_watch import DirectoryWatcher
+from vault_write import write_file, move_file
+from vault_keywords import get_matcher
+from inbox_routing import RoutingRules
+
+# Seconds a dropped file must stay unchanged (same size, no writes) before
+# it is moved; in-progress copies keep pushing this back
+INBOX_DEBOUNCE = float(os.getenv('INBOX_DEBOUNCE', 0.5))
+
+# Drops of at least this many ready files are ingested as one batch on
+# INBOX_WORKERS threads, with one log entry and one journal write
+INBOX_BATCH_SIZE = int(os.getenv('INBOX_BATCH_SIZE', 16))
+INBOX_WORKERS = int(os.getenv('INBOX_WORKERS', 8))
+
+# The journal is compacted once this many lines (or twice the live entries
+# left by the last compaction, if more) have been appended
+JOURNAL_COMPACT_LINES = int(os.getenv('PROCESSED_JOURNAL_COMPACT_LINES', 1000))
+
+
+def candidate_names(filename, folders=()):
+    """
+    filename, then variants of it for when the name is taken
+
+    Args:
+        filename: Preferred name
+        folders: Inbox subfolders the file came from, added to the name
+                 first so same-named drops from different folders stay
+                 recognisable (e.g. scan_clients_acme.pdf)
+    """
+    yield filename
+    base, dot, extension = filename.rpartition('.')
+    if not dot:
+        base, extension = filename, ''
+    else:
+        extension = f".{extension}"
+    if folders:
+        base = f"{base}_{'_'.join(folders)}"
+        yield f"{base}{extension}"
+    stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    yield f"{base}_{stamp}{extension}"
+    for n in itertools.count(2):
+        yield f"{base}_{stamp}_{n}{extension}"
+
+
+class ProcessedJournal:
+    """
+    Inbox files already turned into tasks, kept as an append-only journal
+
+    Each processed file costs one short JSON line appended to the journal
+    instead of a rewrite of the whole set. Replay on startup stops at a
+    torn final line, so a crash mid-append loses at most that entry.
+    Entries expire once their file has left the inbox: compaction, run
+    when the journal grows and on close, rewrites it atomically with only
+    the entries whose file still exists. Each entry also keeps the file's
+    size and mtime, so a new file dropped under a processed name is not
+    mistaken for the old one; a file that was moved away is never
+    recorded at all.
+    """
+
+    def __init__(self, path, inbox_dir, legacy_path=None, compact_lines=JOURNAL_COMPACT_LINES):
+        """
+        Args:
+            path: Journal file (JSON lines)
+            inbox_dir: Directory the recorded names are relative to
+            legacy_path: Old .processed_files.json set to import once
+            compact_lines: Minimum journal length before compaction
+        """
+        self.path = Path(path)
+        self.inbox_dir = Path(inbox_dir)
+        self.compact_lines = compact_lines
+        self.entries = {}       # name relative to the inbox -> {'at', 'size', 'mtime'}
+        self.lines = 0
+        self._compact_at = 0    # journal length that triggers the next compaction
+        self._file = None
+
+        self._replay()
+        if legacy_path is not None:
+            self._import_legacy(Path(legacy_path))
+        self.compact()
+
+    def _key(self, path):
+        path = Path(path)
+        try:
+            return path.relative_to(self.inbox_dir).as_posix()
+        except ValueError:
+            return path.name
+
+    def _signature(self, name):
+        """(size, mtime_ns) of an inbox file, or None if it is gone"""
+        try:
+            st = (self.inbox_dir / name).stat()
+        except OSError:
+            return None
+        return {'size': st.st_size, 'mtime': st.st_mtime_ns}
+
+    def _line(self, name):
+        return json.dumps({'name': name, **self.entries[name]}, ensure_ascii=False) + "\n"
+
+    def _replay(self):
+        """Load the journal, stopping at a torn final write"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                        name = record.pop('name')
+                        self.entries[name] = record
+                    except (ValueError, KeyError, TypeError):
+                        break
+                    self.lines += 1
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"⚠️  Warning: Could not load processed files: {e}")
+
+    def _import_legacy(self, legacy_path):
+        """Fold the old JSON set into the journal, then remove it"""
+        if not legacy_path.exists():
+            return
+        try:
+            with open(legacy_path, 'r') as f:
+                for name in json.load(f):
+                    self.entries.setdefault(self._key(name), {'at': None})
+            self.lines += 1  # forces the compaction that persists them
+            legacy_path.unlink()
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"⚠️  Warning: Could not import {legacy_path}: {e}")
+
+    def __contains__(self, path):
+        name = self._key(path)
+        entry = self.entries.get(name)
+        if entry is None:
+            return False
+        signature = self._signature(name)
+        if signature is not None and all(entry.get(k) == v for k, v in signature.items()):
+            return True
+        # A different file now has this name (or it is gone)
+        del self.entries[name]
+        return False
+
+    def __len__(self):
+        return len(self.entries)
+
+    def add(self, path):
+        """Record a processed file with one appended line"""
+        self.add_many([path])
+
+    def add_many(self, paths):
+        """
+        Record a batch of processed files with one append
+
+        Only files still in the inbox (e.g. a move whose source could not
+        be removed) need an entry; for the rest any old entry is dropped.
+        """
+        at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        lines = []
+        for path in paths:
+            name = self._key(path)
+            signature = self._signature(name)
+            if signature is None:
+                self.entries.pop(name, None)
+                continue
+            self.entries[name] = {'at': at, **signature}
+            lines.append(self._line(name))
+        if not lines:
+            return
+        try:
+            if self._file is None:
+                self._file = open(self.path, 'a', encoding='utf-8')
+            # Whole lines only; replay stops at a torn final one
+            self._file.write("".join(lines))
+            self._file.flush()
+            self.lines += len(lines)
+        except IOError as e:
+            print(f"❌ Error saving processed files: {e}")
+
+        if self.lines >= self._compact_at:
+            self.compact()
+
+    def compact(self):
+        """Drop entries whose file has left the inbox and rewrite the journal"""
+        entries = {}
+        for name, entry in self.entries.items():
+            signature = self._signature(name)
+            if signature is None:
+                continue
+            if entry.get('size') is None:
+                entry = {**entry, **signature}  # legacy entry: adopt the current file
+            elif any(entry.get(k) != v for k, v in signature.items()):
+                continue
+            entries[name] = entry
+        self.entries = entries
+        self._compact_at = len(self.entries) + max(self.compact_lines, len(self.entries))
+        if self.lines == len(self.entries) and self.path.exists():
+            return
+
+        content = "".join(self._line(name) for name in self.entries)
+        try:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            write_file(self.path, content)
+            self.lines = len(self.entries)
+        except IOError as e:
+            print(f"❌ Error saving processed files: {e}")
+
+    def close(self):
+        self.compact()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
 
 class FileWatcher:
     def __init__(self, inbox_dir="Inbox", needs_action_dir="Needs_Action", logs_dir="Logs"):
         self.inbox_dir = Path(inbox_dir)
         self.needs_action_dir = Path(needs_action_dir)
+        self.vault_dir = self.needs_action_dir.parent
         self.logs_dir = Path(logs_dir)
-        self.processed_file = Path(".processed_files.json")
-        self.processed_files = self.load_processed_files()
 
         # Ensure directories exist
         self.inbox_dir.mkdir(exist_ok=True)
         self.needs_action_dir.mkdir(exist_ok=True)
         self.logs_dir.mkdir(exist_ok=True)
 
-    def load_processed_files(self):
-        """Load the list of already processed files"""
-        if self.processed_file.exists():
-            try:
-                with open(self.processed_file, 'r') as f:
-                    return set(json.load(f))
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"⚠️  Warning: Could not load processed files: {e}")
-                return set()
-        return set()
-
-    def save_processed_files(self):
-        """Save the list of processed files"""
+        self.processed = ProcessedJournal(
+            ".processed_files.jsonl", self.inbox_dir, legacy_path=".processed_files.json")
+
+        # Actions go to Logs/file_watcher_<date>.md; progress is printed separately
+        self.logger = get_logger(self.logs_dir, 'file_watcher', 'File Watcher Log', console=False)
+        self.catalog = get_catalog(log=self.logger.log)
+        self.routes = RoutingRules(log=self.logger.log)
+
+        # Destinations handed out but not yet moved into, so files planned
+        # in parallel never pick the same name
+        self._reserved = set()
+        self._reserve_lock = threading.Lock()
+
+    def classify(self, file_path):
+        """
+        Score a file's name and contents against the priority keywords
+
+        Returns:
+            KeywordMatch with the priority and matched terms
+        """
+        matcher = get_matcher()
         try:
-            with open(self.processed_file, 'w') as f:
-                json.dump(list(self.processed_files), f, indent=2)
-        except IOError as e:
-            print(f"❌ Error saving processed files: {e}")
+            return matcher.scan_file(file_path, prefix=file_path.name)
+        except OSError:
+            return matcher.scan(file_path.name)
+
+    def task_destination(self, filename, folder=None, origin=()):
+        """
+        Reserve a path in Needs_Action (or folder) for an inbox file
+
+        A taken name gets the Inbox subfolders it came from (origin), then
+        a timestamp suffix, then a counter. The
+        path stays reserved until release_destination(); the move itself
+        refuses to overwrite, so a name taken in the meantime fails the
+        move instead of replacing a task.
+        """
+        folder = self.needs_action_dir if folder is None else folder
+        with self._reserve_lock:
+            for name in candidate_names(filename, origin):
+                destination = folder / name
+                if destination not in self._reserved and not os.path.lexists(destination):
+                    self._reserved.add(destination)
+                    return destination
+
+    def release_destination(self, destination):
+        """Give up a reservation from task_destination()"""
+        with self._reserve_lock:
+            self._reserved.discard(destination)
+
+    def plan_task(self, file_path):
+        """
+        Route and classify an inbox file
 
-    def detect_priority(self, filename):
-        """Detect priority from filename keywords"""
-        filename_upper = filename.upper()
+        Returns:
+            (destination path, priority, KeywordMatch, Route)
+        """
+        try:
+            folders = file_path.relative_to(self.inbox_dir).parent.parts
+        except ValueError:
+            folders = ()
+        route = self.routes.table.route(folders)
+        match = self.classify(file_path)
+        priority = route.priority or match.priority
 
-        if "URGENT" in filename_upper or "CRITICAL" in filename_upper:
-            return "high"
-        elif "IMPORTANT" in filename_upper:
-            return "medium"
-        else:
-            return "normal"
+        folder = None
+        if route.destination:
+            folder = self.vault_dir / route.destination
+            folder.mkdir(exist_ok=True)
+        destination = self.task_destination(route.task_name(file_path.name), folder, folders)
+        return destination, priority, match, route
 
     def create_task(self, file_path):
         """Move file from Inbox to Needs_Action and create task metadata"""
         try:
             # Get file info
-            filename = file_path.name
-            priority = self.detect_priority(filename)
-            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-
-            # Move file to Needs_Action
-            destination = self.needs_action_dir / filename
-
-            # If file already exists in Needs_Action, add timestamp
-            if destination.exists():
-                name_parts = filename.rsplit('.', 1)
-                if len(name_parts) == 2:
-                    new_name = f"{name_parts[0]}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{name_parts[1]}"
-                else:
-                    new_name = f"{filename}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-                destination = self.needs_action_dir / new_name
+            filename = file_path.relative_to(self.inbox_dir).as_posix()
+            destination, priority, match, route = self.plan_task(file_path)
+            folder = destination.parent.name
 
             # Move the file
-            file_path.rename(destination)
+            try:
+                self.catalog.move(file_path, destination, details={'type': route.type, 'priority': priority})
+            finally:
+                self.release_destination(destination)
 
-            print(f"✅ Moved to Needs_Action: {destination.name}")
+            print(f"✅ Moved to {folder}: {destination.name}")
             print(f"   Priority: {priority}")
+            if route.type:
+                print(f"   Type: {route.type}")
+            if match.terms:
+                print(f"   Keywords: {', '.join(match.terms)}")
 
             # Log the action
-            self.log_action(f"Moved {filename} to Needs_Action (priority: {priority})")
+            keywords = f", keywords: {', '.join(match.terms)}" if match.terms else ""
+            task_type = f", type: {route.type}" if route.type else ""
+            self.log_action(f"Moved {filename} to {folder} (priority: {priority}{task_type}{keywords})")
 
             return True
 
@@ -89,58 +350,128 @@ class FileWatcher:
             print(f"❌ Error processing {file_path}: {e}")
             return False
 
+    def _move_task(self, file_path):
+        """Route, classify and move one file of a batch (runs on a pool thread)"""
+        destination, priority, _, route = self.plan_task(file_path)
+        try:
+            move_file(file_path, destination, log=self.logger.log)
+        finally:
+            self.release_destination(destination)
+        return destination, {'type': route.type, 'priority': priority}
+
+    def ingest_batch(self, files):
+        """
+        Move a large drop into Needs_Action (or routed folders) on a thread pool
+
+        Files are classified and moved in parallel; the catalog is updated
+        in one transaction, the journal with one append and the log with
+        one entry. The task listing keeps the order the files arrived in.
+
+        Args:
+            files: Ready inbox files
+
+        Returns:
+            Files that could not be moved
+        """
+        def arrival(path):
+            try:
+                return (path.stat().st_mtime_ns, path.name)
+            except OSError:
+                return (0, path.name)
+
+        files = sorted(files, key=arrival)
+        with ThreadPoolExecutor(max_workers=max(1, INBOX_WORKERS), thread_name_prefix="inbox") as pool:
+            futures = [pool.submit(self._move_task, file_path) for file_path in files]
+
+        moved, failed = [], []
+        for file_path, future in zip(files, futures):
+            try:
+                destination, details = future.result()
+                moved.append((file_path, destination, details))
+            except Exception as e:
+                # One bad file must not lose the moves already made
+                print(f"❌ Error processing {file_path}: {e}")
+                failed.append(file_path)
+
+        if moved:
+            self.catalog.record_moves([(src, dst) for src, dst, _ in moved],
+                                      {dst: details for _, dst, details in moved})
+            self.processed.add_many([src for src, _, _ in moved])
+
+            print("\n".join(f"✅ Moved to {dst.parent.name}: {dst.name} ({details['priority']})"
+                            for _, dst, details in moved))
+            counts = Counter(details['priority'] for _, _, details in moved)
+            summary = ", ".join(f"{priority}: {count}" for priority, count in sorted(counts.items()))
+            folders = ", ".join(sorted({dst.parent.name for _, dst, _ in moved}))
+            self.log_action(f"Moved {len(moved)} file(s) to {folders} in one batch ({summary}); "
+                            f"first {moved[0][1].name}, last {moved[-1][1].name}")
+        if failed:
+            self.log_action(f"{len(failed)} file(s) could not be moved and will be retried")
+
+        return failed
+
     def log_action(self, message):
         """Log an action to the daily log file"""
-        try:
-            log_date = datetime.now().strftime('%Y-%m-%d')
-            log_file = self.logs_dir / f"file_watcher_{log_date}.md"
-            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        self.logger.log(message)
 
-            with open(log_file, 'a', encoding='utf-8') as f:
-                if not log_file.exists() or log_file.stat().st_size == 0:
-                    f.write(f"# File Watcher Log - {log_date}\n\n")
-                f.write(f"[{timestamp}] {message}\n")
+    def process_ready(self, ready, watcher, interval):
+        """
+        Turn one round of ready inbox files into tasks
 
-        except Exception as e:
-            print(f"⚠️  Warning: Could not write to log: {e}")
+        Args:
+            ready: Files the watcher reported complete
+            watcher: DirectoryWatcher to hand failed files back to
+            interval: Retry delay for files that could not be moved
+        """
+        # Filter out already processed files
+        new_files = [f for f in ready if f not in self.processed]
+        if new_files:
+            self.routes.refresh()
 
-    def watch(self, interval=10):
-        """Watch the inbox folder for new files"""
-        print(f"👀 Watching {self.inbox_dir} for new files...")
-        print(f"📁 Tasks will be created in {self.needs_action_dir}")
-        print(f"⏱️  Check interval: {interval} seconds")
-        print("Press Ctrl+C to stop\n")
+        if len(new_files) >= INBOX_BATCH_SIZE:
+            print(f"\n📥 Found {len(new_files)} new file(s) - ingesting as a batch")
+            for file_path in self.ingest_batch(new_files):
+                if file_path.exists():
+                    watcher.retry(file_path, interval)
 
-        try:
-            while True:
-                # Get all files in inbox
-                inbox_files = list(self.inbox_dir.glob('*'))
+        elif new_files:
+            print(f"\n📥 Found {len(new_files)} new file(s)")
 
-                # Filter out directories and already processed files
-                new_files = [
-                    f for f in inbox_files
-                    if f.is_file() and str(f) not in self.processed_files
-                ]
+            for file_path in new_files:
+                print(f"Processing: {file_path.name}")
 
-                if new_files:
-                    print(f"\n📥 Found {len(new_files)} new file(s)")
+                # Create task
+                if self.create_task(file_path):
+                    # Mark as processed
+                    self.processed.add(file_path)
+                elif file_path.exists():
+                    watcher.retry(file_path, interval)
 
-                    for file_path in new_files:
-                        print(f"Processing: {file_path.name}")
+    def watch(self, interval=10):
+        """
+        Watch the inbox folder for new files
 
-                        # Create task
-                        if self.create_task(file_path):
-                            # Mark as processed
-                            self.processed_files.add(str(file_path))
-                            self.save_processed_files()
+        Args:
+            interval: Rescan interval when inotify is unavailable, and the
+                      retry delay for files that could not be moved
+        """
+        watcher = DirectoryWatcher(self.inbox_dir, debounce=INBOX_DEBOUNCE, poll_interval=interval,
+                                   recursive=True)
 
-                # Wait before next check
-                time.sleep(interval)
+        print(f"👀 Watching {self.inbox_dir} for new files ({watcher.mode})...")
+        print(f"📁 Tasks will be created in {self.needs_action_dir}")
+        print("Press Ctrl+C to stop\n")
+
+        try:
+            while True:
+                # Blocks until files are complete; no syscalls while idle
+                self.process_ready(watcher.wait(), watcher, interval)
 
         except KeyboardInterrupt:
             print("\n\n👋 File watcher stopped")
-            self.save_processed_files()
-
+        finally:
+            watcher.close()
+            self.processed.close()
 
 def main():
     """Main function"""
@@ -5,9 +5,11 @@ Checks every 2 minutes and creates task files for new emails
 """
 
 import os
+import sys
 import json
 import time
 import base64
+from functools import partial
 from datetime import datetime
 from pathlib import Path
 from email.utils import parsedate_to_datetime
@@ -19,6 +21,13 @@ from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from dotenv import load_dotenv
 
+# Shared vault modules live in the vault root
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from vault_metrics import report_metric
+from vault_log import get_logger
+from vault_catalog import get_catalog
+from vault_write import write_file, batch
+
 # Gmail API scopes - using readonly for safety
 SCOPES = ['https://www.googleapis.com/auth/gmail.readonly']
 
@@ -41,32 +50,10 @@ PROCESSED_EMAILS_FILE = VAULT_PATH / 'processed_emails.json'
 NEEDS_ACTION_DIR.mkdir(exist_ok=True)
 LOGS_DIR.mkdir(exist_ok=True)
 
-
-def log_message(message, level="INFO"):
-    """
-    Log a message to both console and daily log file
-
-    Args:
-        message: The message to log
-        level: Log level (INFO, WARNING, ERROR)
-    """
-    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    log_entry = f"[{timestamp}] [{level}] {message}"
-
-    # Print to console
-    print(log_entry)
-
-    # Write to daily log file
-    log_date = datetime.now().strftime('%Y-%m-%d')
-    log_file = LOGS_DIR / f"gmail_{log_date}.md"
-
-    try:
-        with open(log_file, 'a', encoding='utf-8') as f:
-            if not log_file.exists() or log_file.stat().st_size == 0:
-                f.write(f"# Gmail Watcher Log - {log_date}\n\n")
-            f.write(f"{log_entry}\n")
-    except Exception as e:
-        print(f"[ERROR] Failed to write to log file: {e}")
+# Daily log: Logs/gmail_<date>.md
+logger = get_logger(LOGS_DIR, 'gmail', 'Gmail Watcher Log')
+log_message = logger.log
+catalog = get_catalog(log=log_message)
 
 
 def authenticate_gmail():
@@ -176,11 +163,10 @@ def save_processed_emails(processed_ids):
         processed_ids: Set of email IDs that have been processed
     """
     try:
-        with open(PROCESSED_EMAILS_FILE, 'w') as f:
-            json.dump({
-                'processed_ids': list(processed_ids),
-                'last_updated': datetime.now().isoformat()
-            }, f, indent=2)
+        write_file(PROCESSED_EMAILS_FILE, json.dumps({
+            'processed_ids': list(processed_ids),
+            'last_updated': datetime.now().isoformat()
+        }, indent=2))
     except Exception as e:
         log_message(f"Failed to save processed emails: {e}", "ERROR")
 
@@ -284,12 +270,14 @@ def extract_email_details(service, email_id):
         return None
 
 
-def create_task_file(email_details):
+def create_task_file(email_details, on_commit=None):
     """
     Create a task file in Needs_Action/ directory
 
     Args:
         email_details: Dictionary with email information
+        on_commit: Called with the path once the file is in place (inside
+                   batch() that is when the batch commits)
 
     Returns:
         Path to created task file or None if failed
@@ -347,12 +335,17 @@ requires_approval: true
         # Write task file
         if DRY_RUN:
             log_message(f"[DRY RUN] Would create task file: {filepath}")
+            if on_commit is not None:
+                on_commit(filepath)
             return filepath
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+        def committed(path):
+            log_message(f"Created task file: {path.name}")
+            if on_commit is not None:
+                on_commit(path)
+            catalog.record(path)
 
-        log_message(f"Created task file: {filename}")
+        write_file(filepath, content, on_commit=committed)
         return filepath
 
     except Exception as e:
@@ -392,30 +385,39 @@ def check_new_emails(service, processed_ids):
 
         new_processed = []
 
-        for message in messages:
-            email_id = message['id']
+        def processed(email_id, sender, path):
+            new_processed.append(email_id)
+            log_message(f"Successfully processed email from {sender}")
+
+        # Task files of one poll are committed together; an email counts as
+        # processed only once its file is in place, so a failed commit
+        # leaves the rest to be picked up by the next poll
+        try:
+            with batch():
+                for message in messages:
+                    email_id = message['id']
 
-            # Skip if already processed
-            if email_id in processed_ids:
-                log_message(f"Skipping already processed email: {email_id}")
-                continue
+                    # Skip if already processed
+                    if email_id in processed_ids:
+                        log_message(f"Skipping already processed email: {email_id}")
+                        continue
 
-            log_message(f"Processing new email: {email_id}")
+                    log_message(f"Processing new email: {email_id}")
 
-            # Extract email details
-            email_details = extract_email_details(service, email_id)
+                    # Extract email details
+                    email_details = extract_email_details(service, email_id)
 
-            if email_details:
-                # Create task file
-                task_file = create_task_file(email_details)
+                    if email_details:
+                        # Create task file
+                        task_file = create_task_file(
+                            email_details, on_commit=partial(processed, email_id, email_details['sender_email']))
 
-                if task_file:
-                    new_processed.append(email_id)
-                    log_message(f"Successfully processed email from {email_details['sender_email']}")
-                else:
-                    log_message(f"Failed to create task for email {email_id}", "WARNING")
-            else:
-                log_message(f"Failed to extract details for email {email_id}", "WARNING")
+                        if not task_file:
+                            log_message(f"Failed to create task for email {email_id}", "WARNING")
+                    else:
+                        log_message(f"Failed to extract details for email {email_id}", "WARNING")
+        except OSError as e:
+            log_message(f"Failed to write task files: {e}", "ERROR")
 
         return new_processed
 
@@ -460,7 +462,9 @@ def main():
             log_message(f"Check #{check_count} - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 
             # Check for new emails
+            started = time.monotonic()
             new_processed = check_new_emails(service, processed_ids)
+            report_metric('poll_duration_seconds', time.monotonic() - started)
 
             # Update processed IDs
             if new_processed:
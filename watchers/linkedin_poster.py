@@ -4,8 +4,10 @@ LinkedIn Poster - Automates posting to LinkedIn from a queue
 Checks every 30 minutes for scheduled posts and publishes them
 """
 
+import json
 import os
 import re
+import sys
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -13,6 +15,15 @@ from pathlib import Path
 from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
 from dotenv import load_dotenv
 
+# Shared vault modules live in the vault root
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from vault_metrics import report_metric
+from vault_log import get_logger
+from vault_catalog import get_catalog
+from vault_write import write_file
+from done_archive import shard_dir, add_to_manifest
+from vault_doc import parse_post_queue
+
 # Load environment variables
 load_dotenv()
 
@@ -29,6 +40,7 @@ DONE_DIR = VAULT_PATH / 'Done'
 LOGS_DIR = VAULT_PATH / 'Logs'
 LINKEDIN_POSTS_FILE = PLANS_DIR / 'LinkedIn_Posts.md'
 SESSION_DIR = VAULT_PATH / 'linkedin_session'
+POSTS_TODAY_FILE = VAULT_PATH / '.linkedin_posts_today.json'
 
 # Ensure directories exist
 PLANS_DIR.mkdir(exist_ok=True)
@@ -36,32 +48,10 @@ DONE_DIR.mkdir(exist_ok=True)
 LOGS_DIR.mkdir(exist_ok=True)
 SESSION_DIR.mkdir(exist_ok=True)
 
-
-def log_message(message, level="INFO"):
-    """
-    Log a message to both console and daily log file
-
-    Args:
-        message: The message to log
-        level: Log level (INFO, WARNING, ERROR)
-    """
-    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    log_entry = f"[{timestamp}] [{level}] {message}"
-
-    # Print to console
-    print(log_entry)
-
-    # Write to daily log file
-    log_date = datetime.now().strftime('%Y-%m-%d')
-    log_file = LOGS_DIR / f"linkedin_{log_date}.md"
-
-    try:
-        with open(log_file, 'a', encoding='utf-8') as f:
-            if not log_file.exists() or log_file.stat().st_size == 0:
-                f.write(f"# LinkedIn Poster Log - {log_date}\n\n")
-            f.write(f"{log_entry}\n")
-    except Exception as e:
-        print(f"[ERROR] Failed to write to log file: {e}")
+# Daily log: Logs/linkedin_<date>.md
+logger = get_logger(LOGS_DIR, 'linkedin', 'LinkedIn Poster Log')
+log_message = logger.log
+catalog = get_catalog(log=log_message)
 
 
 def parse_posts_file():
@@ -77,40 +67,21 @@ def parse_posts_file():
         return []
 
     try:
-        with open(LINKEDIN_POSTS_FILE, 'r', encoding='utf-8') as f:
-            content = f.read()
-
         posts = []
-        # Split by post headers (## Post N)
-        post_sections = re.split(r'\n## Post \d+\n', content)[1:]  # Skip header
-
-        for section in post_sections:
-            # Extract status
-            status_match = re.search(r'Status:\s*(\w+)', section)
-            status = status_match.group(1) if status_match else 'unknown'
-
-            # Extract scheduled time
-            scheduled_match = re.search(r'Scheduled:\s*(.+)', section)
-            scheduled_str = scheduled_match.group(1).strip() if scheduled_match else None
-
+        for post in parse_post_queue(LINKEDIN_POSTS_FILE):
             # Parse scheduled time
             scheduled_time = None
-            if scheduled_str:
+            if post.scheduled:
                 try:
-                    scheduled_time = datetime.strptime(scheduled_str, '%Y-%m-%d %H:%M')
+                    scheduled_time = datetime.strptime(post.scheduled, '%Y-%m-%d %H:%M')
                 except ValueError:
-                    log_message(f"Invalid date format: {scheduled_str}", "WARNING")
+                    log_message(f"Invalid date format: {post.scheduled}", "WARNING")
 
-            # Extract content (everything after "Content:" until "---" or end)
-            content_match = re.search(r'Content:\s*\n(.*?)(?:\n---|\Z)', section, re.DOTALL)
-            content = content_match.group(1).strip() if content_match else ''
-
-            if content and status == 'pending' and scheduled_time:
+            if post.content and post.status == 'pending' and scheduled_time:
                 posts.append({
-                    'status': status,
+                    'status': post.status,
                     'scheduled': scheduled_time,
-                    'content': content,
-                    'raw_section': section
+                    'content': post.content
                 })
 
         return posts
@@ -147,8 +118,7 @@ Check out the results...
 ---
 """
     try:
-        with open(LINKEDIN_POSTS_FILE, 'w', encoding='utf-8') as f:
-            f.write(template)
+        write_file(LINKEDIN_POSTS_FILE, template)
         log_message("Created template LinkedIn_Posts.md")
     except Exception as e:
         log_message(f"Failed to create template: {e}", "ERROR")
@@ -177,8 +147,7 @@ def update_post_status(content_to_find, new_status, posted_time=None):
 
         updated_content = re.sub(pattern, replacement, file_content, count=1, flags=re.DOTALL)
 
-        with open(LINKEDIN_POSTS_FILE, 'w', encoding='utf-8') as f:
-            f.write(updated_content)
+        write_file(LINKEDIN_POSTS_FILE, updated_content)
 
         log_message("Updated post status to 'posted'")
 
@@ -188,15 +157,18 @@ def update_post_status(content_to_find, new_status, posted_time=None):
 
 def archive_posted_content(content, posted_time):
     """
-    Archive posted content to Done/ directory
+    Archive posted content to today's Done/ shard
 
     Args:
         content: The posted content
         posted_time: When it was posted
     """
     try:
-        date_str = datetime.now().strftime('%Y-%m-%d')
-        archive_file = DONE_DIR / f"LinkedIn_Posted_{date_str}.md"
+        now = datetime.now()
+        date_str = now.strftime('%Y-%m-%d')
+        shard = shard_dir(now, DONE_DIR)
+        shard.mkdir(parents=True, exist_ok=True)
+        archive_file = shard / f"LinkedIn_Posted_{date_str}.md"
 
         # Create or append to archive file
         mode = 'a' if archive_file.exists() else 'w'
@@ -207,6 +179,9 @@ def archive_posted_content(content, posted_time):
             f.write(f"## Posted at {posted_time}\n\n")
             f.write(f"{content}\n\n")
             f.write("---\n\n")
+        catalog.record(archive_file)
+        if mode == 'w':
+            add_to_manifest(archive_file, now, channel='linkedin')
 
         log_message(f"Archived post to {archive_file.name}")
 
@@ -214,6 +189,10 @@ def archive_posted_content(content, posted_time):
         log_message(f"Failed to archive post: {e}", "ERROR")
 
 
+# Posts made today: persisted on every post, then kept in memory
+posts_today = {'date': None, 'count': 0}
+
+
 def count_posts_today():
     """
     Count how many posts were made today
@@ -221,22 +200,38 @@ def count_posts_today():
     Returns:
         Number of posts made today
     """
+    date_str = datetime.now().strftime('%Y-%m-%d')
+    if posts_today['date'] == date_str:
+        return posts_today['count']
+
+    count = 0
     try:
-        date_str = datetime.now().strftime('%Y-%m-%d')
-        log_file = LOGS_DIR / f"linkedin_{date_str}.md"
+        if POSTS_TODAY_FILE.exists():
+            state = json.loads(POSTS_TODAY_FILE.read_text(encoding='utf-8'))
+            if state.get('date') == date_str:
+                count = int(state.get('count', 0))
 
-        if not log_file.exists():
-            return 0
+    except (ValueError, OSError) as e:
+        log_message(f"Error reading today's post count: {e}", "WARNING")
+        return 0
 
-        with open(log_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+    posts_today.update(date=date_str, count=count)
+    return count
 
-        # Count "Successfully posted" messages
-        return content.count("Successfully posted to LinkedIn")
 
-    except Exception as e:
-        log_message(f"Error counting today's posts: {e}", "WARNING")
-        return 0
+def record_post():
+    """
+    Count a successful post towards today's rate limit
+
+    The count is written to the state file before returning, so a crash
+    right after a post cannot reset it and let the daily limit be exceeded.
+    """
+    count_posts_today()
+    posts_today['count'] += 1
+    try:
+        write_file(POSTS_TODAY_FILE, json.dumps(posts_today))
+    except OSError as e:
+        log_message(f"Could not save today's post count: {e}", "WARNING")
 
 
 def login_to_linkedin(page, headless=False):
@@ -323,22 +318,6 @@ def post_to_linkedin(page, content):
         page.screenshot(path=str(screenshot_path))
         log_message(f"Screenshot saved to {screenshot_path}")
 
-        # Debug: List all buttons
-        try:
-            buttons = page.query_selector_all('button')
-            log_message(f"Found {len(buttons)} buttons on page")
-            for i, btn in enumerate(buttons[:15]):  # First 15 buttons
-                try:
-                    text = btn.inner_text()[:50] if btn.inner_text() else ""
-                    aria_label = btn.get_attribute('aria-label') or ""
-                    class_name = btn.get_attribute('class') or ""
-                    if text or aria_label:
-                        log_message(f"Button {i}: text='{text}', aria='{aria_label}', class='{class_name[:50]}'")
-                except:
-                    pass
-        except Exception as e:
-            log_message(f"Debug error: {e}", "WARNING")
-
         # Click "Start a post" - LinkedIn uses a share box
         log_message("Opening post composer...")
 
@@ -488,6 +467,7 @@ def main():
                     continue
 
                 # Parse posts file
+                started = time.monotonic()
                 pending_posts = parse_posts_file()
                 log_message(f"Found {len(pending_posts)} pending post(s)")
 
@@ -505,6 +485,7 @@ def main():
 
                         # Post to LinkedIn
                         if post_to_linkedin(page, post['content']):
+                            record_post()
                             posted_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
 
                             # Update status
@@ -520,6 +501,8 @@ def main():
                         else:
                             log_message("Failed to post, will retry next cycle", "WARNING")
 
+                report_metric('poll_duration_seconds', time.monotonic() - started)
+
                 # Wait before next check
                 log_message(f"Waiting {CHECK_INTERVAL} seconds until next check...")
                 time.sleep(CHECK_INTERVAL)
@@ -6,6 +6,7 @@ Checks every 60 seconds for messages with specific keywords
 
 import os
 import re
+import sys
 import time
 from datetime import datetime
 from pathlib import Path
@@ -13,6 +14,14 @@ from pathlib import Path
 from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
 from dotenv import load_dotenv
 
+# Shared vault modules live in the vault root
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from vault_metrics import report_metric
+from vault_log import get_logger
+from vault_catalog import get_catalog
+from vault_write import write_file
+from vault_keywords import KeywordMatcher, parse_keywords
+
 # Load environment variables
 load_dotenv()
 
@@ -21,8 +30,9 @@ VAULT_PATH = Path(os.getenv('VAULT_PATH', '.'))
 WHATSAPP_SESSION_PATH = Path(os.getenv('WHATSAPP_SESSION_PATH', './whatsapp_session'))
 CHECK_INTERVAL = 60  # 60 seconds
 
-# Keywords to monitor (case-insensitive)
-URGENT_KEYWORDS = ["urgent", "invoice", "payment", "help", "asap"]
+# Keywords to monitor (case-insensitive, whole words; see vault_keywords)
+URGENT_KEYWORDS = parse_keywords(os.getenv('WHATSAPP_KEYWORDS', 'urgent,invoice,payment,help,asap'))
+keyword_matcher = KeywordMatcher(URGENT_KEYWORDS)
 
 # Paths
 NEEDS_ACTION_DIR = VAULT_PATH / 'Needs_Action'
@@ -34,32 +44,10 @@ NEEDS_ACTION_DIR.mkdir(exist_ok=True)
 LOGS_DIR.mkdir(exist_ok=True)
 WHATSAPP_SESSION_PATH.mkdir(exist_ok=True)
 
-
-def log_message(message, level="INFO"):
-    """
-    Log a message to both console and daily log file
-
-    Args:
-        message: The message to log
-        level: Log level (INFO, WARNING, ERROR)
-    """
-    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    log_entry = f"[{timestamp}] [{level}] {message}"
-
-    # Print to console
-    print(log_entry)
-
-    # Write to daily log file
-    log_date = datetime.now().strftime('%Y-%m-%d')
-    log_file = LOGS_DIR / f"whatsapp_{log_date}.md"
-
-    try:
-        with open(log_file, 'a', encoding='utf-8') as f:
-            if not log_file.exists() or log_file.stat().st_size == 0:
-                f.write(f"# WhatsApp Watcher Log - {log_date}\n\n")
-            f.write(f"{log_entry}\n")
-    except Exception as e:
-        print(f"[ERROR] Failed to write to log file: {e}")
+# Daily log: Logs/whatsapp_<date>.md
+logger = get_logger(LOGS_DIR, 'whatsapp', 'WhatsApp Watcher Log')
+log_message = logger.log
+catalog = get_catalog(log=log_message)
 
 
 def load_processed_messages():
@@ -106,8 +94,7 @@ def contains_urgent_keyword(text):
     if not text:
         return False, []
 
-    text_lower = text.lower()
-    matched = [kw for kw in URGENT_KEYWORDS if kw in text_lower]
+    matched = list(keyword_matcher.scan(text).terms)
     return len(matched) > 0, matched
 
 
@@ -162,8 +149,7 @@ keywords: {', '.join(matched_keywords)}
 """
 
         # Write task file
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+        write_file(filepath, content, on_commit=catalog.record)
 
         log_message(f"Created task file: {filename}")
         return filepath
@@ -409,7 +395,9 @@ def main():
                 log_message(f"Check #{check_count} - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 
                 # Check for urgent messages
+                started = time.monotonic()
                 urgent_count = check_for_urgent_messages(page, processed_ids)
+                report_metric('poll_duration_seconds', time.monotonic() - started)
 
                 if urgent_count > 0:
                     log_message(f"Processed {urgent_count} urgent message(s)")